@@ -37,6 +37,9 @@ class ConfigHandler:
         if self.config.get("border_color") == "#00FF00":
             self.config["border_color"] = "#4c4c4c"
             logger.info("Migrated old border color from #00FF00 to #4c4c4c")
+        if self.config.get("ctranslate2_compute_type") == "int8" and not self.config.get("ctranslate2_compute_type_user_set", False):
+            self.config["ctranslate2_compute_type"] = "auto"
+            logger.info("Migrated CTranslate2 compute type from int8 to auto")
 
     def load_config(self):
         logger.info("Loading configuration file...")
@@ -75,25 +75,88 @@ SOURCE_LANGUAGES = {
 
 TRANSLATOR_ENGINES = {
     "libretranslate_local": "LibreTranslate",
-    "ctranslate2": "CTranslate2"
+    "ctranslate2": "CTranslate2",
+    "fastest": "Fastest (LibreTranslate and CTranslate2)"
 }
 
 DEFAULT_CTRANSLATE2_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".config", "Voxlay", "models")
 
-DEFAULT_CTRANSLATE2_COMPUTE_TYPE = "int8"
+DEFAULT_CTRANSLATE2_COMPUTE_TYPE = "auto"
+
+CTRANSLATE2_COMPUTE_TYPES = {
+    "auto": "Auto (benchmark)",
+    "int8": "int8",
+    "int8_float32": "int8_float32",
+    "int8_float16": "int8_float16",
+    "int8_bfloat16": "int8_bfloat16",
+    "int16": "int16",
+    "float32": "float32",
+}
+
+DEFAULT_DECODING_PROFILE = "auto"
+DEFAULT_TARGET_LATENCY_MS = 150
+
+DECODING_PROFILES = {
+    "auto": "Auto (target latency)",
+    "fastest": "Fastest (greedy)",
+    "balanced": "Balanced (beam 2)",
+    "quality": "Quality (beam 4)",
+}
+
+DEFAULT_STREAM_TRANSLATION = False
+DEFAULT_STREAM_MAX_UPDATES_PER_SECOND = 15
+
+DEFAULT_TRANSLATION_CACHE_SIZE = 2048
+DEFAULT_TRANSLATION_MEMORY_FUZZY = False
+DEFAULT_TRANSLATION_MEMORY_SEED_THRESHOLD = 0.75
+
+DEFAULT_LOCAL_SERVER_PORT = 5005
+
+DEFAULT_CTRANSLATE2_WORKER_MODE = "thread"
+DEFAULT_CTRANSLATE2_MEMORY_BUDGET_MB = 1024
+
+DEFAULT_TRANSLATION_DEADLINE_MS = 5000
+DEFAULT_LIBRETRANSLATE_BREAKER_THRESHOLD = 3
+DEFAULT_LIBRETRANSLATE_BREAKER_RESET_S = 30
 
 DEFAULT_CONFIG_STRUCT = {
     "hotkey_translate": DEFAULT_HOTKEY,
     "hotkey_copy": DEFAULT_COPY_HOTKEY,
     "overlay_position": DEFAULT_OVERLAY_POSITION,
     "target_language": DEFAULT_TARGET_LANGUAGE,
+    "additional_target_languages": [],
     "recognizer_engine": DEFAULT_RECOGNIZER_ENGINE,
     "translator_engine": DEFAULT_TRANSLATOR_ENGINE,
     "libretranslate_url": DEFAULT_LIBRETRANSLATE_URL,
+    "libretranslate_urls": [],
     "libretranslate_api_key": "",
+    "libretranslate_batching": True,
+    "libretranslate_breaker_threshold": DEFAULT_LIBRETRANSLATE_BREAKER_THRESHOLD,
+    "libretranslate_breaker_reset_s": DEFAULT_LIBRETRANSLATE_BREAKER_RESET_S,
+    "ctranslate2_fallback": True,
+    "translation_deadline_ms": DEFAULT_TRANSLATION_DEADLINE_MS,
+    "model_hub_url": "",
     "ctranslate2_model_dir": DEFAULT_CTRANSLATE2_MODEL_DIR,
     "ctranslate2_model": "",
     "ctranslate2_compute_type": DEFAULT_CTRANSLATE2_COMPUTE_TYPE,
+    "ctranslate2_compute_type_user_set": False,
+    "ctranslate2_worker_mode": DEFAULT_CTRANSLATE2_WORKER_MODE,
+    "ctranslate2_prewarm": True,
+    "ctranslate2_prefetch": True,
+    "conversation_mode": False,
+    "ctranslate2_memory_budget_mb": DEFAULT_CTRANSLATE2_MEMORY_BUDGET_MB,
+    "decoding_profile": DEFAULT_DECODING_PROFILE,
+    "target_latency_ms": DEFAULT_TARGET_LATENCY_MS,
+    "stream_translation": DEFAULT_STREAM_TRANSLATION,
+    "stream_max_updates_per_second": DEFAULT_STREAM_MAX_UPDATES_PER_SECOND,
+    "translation_cache_enabled": True,
+    "translation_cache_size": DEFAULT_TRANSLATION_CACHE_SIZE,
+    "translation_cache_persistent": True,
+    "translation_memory_enabled": True,
+    "translation_memory_fuzzy": DEFAULT_TRANSLATION_MEMORY_FUZZY,
+    "translation_memory_seed_threshold": DEFAULT_TRANSLATION_MEMORY_SEED_THRESHOLD,
+    "local_server_enabled": False,
+    "local_server_port": DEFAULT_LOCAL_SERVER_PORT,
     "source_language": DEFAULT_SOURCE_LANGUAGE,
 
     "font_size": DEFAULT_FONT_SIZE,
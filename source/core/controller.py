@@ -2,13 +2,12 @@ import sys
 import os
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 try:
     from utils.pynput_hotkeys import PynputHotkeyManager
 except ImportError:
     PynputHotkeyManager = None
 
-import requests
 import logging
 from PyQt6 import QtCore
 
@@ -16,16 +15,45 @@ logger = logging.getLogger("Core.Controller")
 
 from core.config_handler import config_handler
 from core.audio_capture import AudioCaptureManager
-from engines import ctranslate2_engine
+from engines import ctranslate2_engine, translation_process
+from engines.page_cache import PageCachePrewarmer
+from engines.model_prefetcher import ModelPrefetcher, PairSwitchHistory, HISTORY_FILE
+from engines.language_id import ConversationRouter
+from engines.libretranslate_pool import get_libretranslate_pool, PoolExhausted
+from engines.libretranslate_client import CONNECT_TIMEOUT_S
+from engines.text_segmentation import split_segments
+from engines.resilience import Deadline, CircuitBreaker
+from engines.engine_race import EngineRaceStats, STATS_FILE as RACE_STATS_FILE
+from engines.decoding_profiles import DecodingProfileSelector
+from engines.translation_cache import TranslationCache
+from engines.translation_memory import get_translation_memory, seed_prefix
+from utils.perf_monitor import EventLoopLagMonitor, audio_overflow_count
 from core.constants import (
     DEFAULT_LIBRETRANSLATE_URL, DEFAULT_SOURCE_LANGUAGE,
-    DEFAULT_TRANSLATOR_ENGINE
+    DEFAULT_TRANSLATOR_ENGINE,
+    DEFAULT_DECODING_PROFILE, DEFAULT_TARGET_LATENCY_MS,
+    DEFAULT_STREAM_TRANSLATION, DEFAULT_STREAM_MAX_UPDATES_PER_SECOND,
+    DEFAULT_TRANSLATION_CACHE_SIZE, DEFAULT_TRANSLATION_MEMORY_FUZZY,
+    DEFAULT_TRANSLATION_MEMORY_SEED_THRESHOLD, DEFAULT_CTRANSLATE2_WORKER_MODE,
+    DEFAULT_CTRANSLATE2_MEMORY_BUDGET_MB,
+    DEFAULT_TRANSLATION_DEADLINE_MS, DEFAULT_LIBRETRANSLATE_BREAKER_THRESHOLD,
+    DEFAULT_LIBRETRANSLATE_BREAKER_RESET_S
 )
 
+CACHE_STATS_LOG_INTERVAL = 50
+FANOUT_WORKERS = 4
+RACE_WORKERS = 4
+LIBRETRANSLATE_RETRIES = 3
+LIBRETRANSLATE_BACKOFF_S = 0.25
+LIBRETRANSLATE_MIN_TIMEOUT_S = 0.05
+UI_LAG_WARN_MS = 50
+
 class ApplicationController(QtCore.QObject):
     start_translation_signal = QtCore.pyqtSignal()
     stop_translation_signal = QtCore.pyqtSignal()
     copy_translation_signal = QtCore.pyqtSignal()
+    translation_health_signal = QtCore.pyqtSignal(str, int)
+    performance_signal = QtCore.pyqtSignal(str)
 
     def __init__(self, app):
         super().__init__()
@@ -37,6 +65,29 @@ class ApplicationController(QtCore.QObject):
         self.hotkey_manager = PynputHotkeyManager(self) if PynputHotkeyManager else None
         
         self.executor = ThreadPoolExecutor(max_workers=2)
+        self.fanout_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS)
+        self.race_executor = ThreadPoolExecutor(max_workers=RACE_WORKERS)
+        self.profile_selector = DecodingProfileSelector(config_handler.get("target_latency_ms", DEFAULT_TARGET_LATENCY_MS))
+        self.translation_cache = self._create_translation_cache()
+        self.translation_memory = get_translation_memory(
+            config_handler.config_dir / "translation_memory.sqlite3" if config_handler.config_dir else None
+        )
+        self.lag_monitor = EventLoopLagMonitor(self)
+        self.lag_monitor.start()
+        self.reported_overflows = 0
+        self.prewarmer = PageCachePrewarmer(self._prewarm_paths)
+        self.prewarmer.start()
+        self.conversation_router = None
+        self.prefetcher = ModelPrefetcher(PairSwitchHistory(
+            config_handler.config_dir / HISTORY_FILE if config_handler.config_dir else None
+        ))
+        self.race_stats = EngineRaceStats(
+            config_handler.config_dir / RACE_STATS_FILE if config_handler.config_dir else None
+        )
+        self.app.aboutToQuit.connect(self.race_stats.flush)
+        self.breaker = CircuitBreaker("LibreTranslate", on_change=self._on_breaker_change)
+        self.fallback_count = 0
+        self.fallback_loading = set()
 
         self.audio_manager.status_signal.connect(self.on_audio_status)
         self.audio_manager.transcription_signal.connect(self.on_transcription_received)
@@ -45,6 +96,74 @@ class ApplicationController(QtCore.QObject):
         self.stop_translation_signal.connect(self.stop_translation_process)
         self.copy_translation_signal.connect(self.copy_last_translation)
 
+    def _create_translation_cache(self):
+        persistent_path = None
+        if config_handler.get("translation_cache_persistent", True) and config_handler.config_dir:
+            persistent_path = config_handler.config_dir / "translation_cache.sqlite3"
+        cache = TranslationCache(
+            max_entries=config_handler.get("translation_cache_size", DEFAULT_TRANSLATION_CACHE_SIZE),
+            persistent_path=persistent_path
+        )
+        cache.enabled = config_handler.get("translation_cache_enabled", True)
+        return cache
+
+    def _prewarm_paths(self):
+        config = config_handler.config
+        if config.get("translator_engine") != "ctranslate2" or not config.get("ctranslate2_prewarm", True):
+            return []
+        model_name = config.get("ctranslate2_model", "")
+        if not model_name:
+            return []
+        return ctranslate2_engine.model_files(config.get("ctranslate2_model_dir", "models"), model_name)
+
+    def _ctranslate2_translator(self, config):
+        return translation_process.get_ctranslate2_translator(config)
+
+    def _prefetch_models(self):
+        config = config_handler.config
+        model_name = config.get("ctranslate2_model", "")
+        if config.get("translator_engine") != "ctranslate2" or not model_name or not config.get("ctranslate2_prefetch", True):
+            return
+        translator = self._ctranslate2_translator(config)
+        models = [model_name]
+        if config.get("conversation_mode", False):
+            models += self._conversation_models(translator, model_name)[1:]
+        self.prefetcher.prefetch(
+            translator, models, config.get("ctranslate2_memory_budget_mb", DEFAULT_CTRANSLATE2_MEMORY_BUDGET_MB)
+        )
+
+    def _prepare_translation(self):
+        config = config_handler.config
+        engine = config.get("translator_engine", DEFAULT_TRANSLATOR_ENGINE)
+        if engine == "ctranslate2":
+            self._prefetch_models()
+            return
+        get_libretranslate_pool(self._libretranslate_urls(config)).warm()
+        if engine == "fastest":
+            source = config.get("source_language", DEFAULT_SOURCE_LANGUAGE).split("-")[0].lower()
+            try:
+                translator = self._ctranslate2_translator(config)
+                translator.ensure_loaded(translator.resolve_model_name(source, config.get("target_language", "en")))
+            except Exception as e:
+                logger.debug(f"No CTranslate2 model to prepare for the engine race: {e}")
+
+    def _libretranslate_urls(self, config):
+        return [config.get("libretranslate_url", DEFAULT_LIBRETRANSLATE_URL)] + list(config.get("libretranslate_urls", []))
+
+    def _get_conversation_router(self, language_a, language_b):
+        if self.conversation_router is None or self.conversation_router.languages != (language_a, language_b):
+            logger.info(f"Conversation mode between {language_a} and {language_b}")
+            self.conversation_router = ConversationRouter(language_a, language_b)
+        return self.conversation_router
+
+    def _conversation_models(self, translator, model_name):
+        src, tgt = ctranslate2_engine.parse_model_pair(model_name)
+        try:
+            return [model_name, translator.resolve_model_name(tgt, src)]
+        except RuntimeError:
+            logger.warning(f"Conversation mode needs a {tgt}-{src} model as well, translating one way only")
+            return [model_name]
+
     def set_overlay_window(self, window):
         self.overlay_window = window
 
@@ -81,6 +200,7 @@ class ApplicationController(QtCore.QObject):
         
         manual_mode = config_handler.get("enable_manual_mode", False)
         self.audio_manager.start_listening(manual=manual_mode)
+        threading.Thread(target=self._prepare_translation, name="PrepareTranslation", daemon=True).start()
 
     def on_audio_status(self, message, is_error, is_final, duration_ms=0):
         if self.overlay_window:
@@ -90,8 +210,14 @@ class ApplicationController(QtCore.QObject):
         self.executor.submit(self._translate_worker, text)
 
     def _translate_worker(self, text):
+        # Each utterance keeps its own deadline; a newer one never cuts an
+        # earlier translation short.
+        config = config_handler.config
+        deadline = Deadline(config.get("translation_deadline_ms", DEFAULT_TRANSLATION_DEADLINE_MS) / 1000)
+        self._translate_with_deadline(config, text, deadline)
+
+    def _translate_with_deadline(self, config, text, deadline):
         try:
-            config = config_handler.config
             engine = config.get("translator_engine", DEFAULT_TRANSLATOR_ENGINE)
             target_lang = config.get("target_language", "en")
             source_lang = config.get("source_language", DEFAULT_SOURCE_LANGUAGE)
@@ -102,36 +228,116 @@ class ApplicationController(QtCore.QObject):
                 return
 
             translated_text = None
+            release_capacity = None
+            self.translation_cache.enabled = config.get("translation_cache_enabled", True)
+            extra_targets = config.get("additional_target_languages", [])
+            conversation = config.get("conversation_mode", False)
+            if conversation:
+                extra_targets = []
             
             if engine == "ctranslate2":
                 self.on_audio_status("Translating (CTranslate2)...", False, False)
-                model_dir = config.get("ctranslate2_model_dir", "models")
-                device = "cpu" #force cpu
-                compute_type = config.get("ctranslate2_compute_type", "int8")
                 model_name = config.get("ctranslate2_model", "")
                 
-                logger.debug(f"CTranslate2 config: dir='{model_dir}', model='{model_name}'")
+                logger.debug(f"CTranslate2 config: dir='{config.get('ctranslate2_model_dir', 'models')}', model='{model_name}'")
                 
                 if not model_name:
                     logger.warning("CTranslate2: No model selected.")
                     self.on_audio_status("Error: No model selected. Please select a model in Settings.", False, True)
                     return
 
-                translator = ctranslate2_engine.get_translator(model_dir, device, compute_type)
-                try:
-                    translated_text = translator.translate(text, model_name=model_name)
-                except Exception as e:
-                    logger.error(f"Translation failed: {e}")
-                    self.on_audio_status(f"Translation error: {e}", False, True)
-                    return
+                translator = self._ctranslate2_translator(config)
+                self.prefetcher.record_use(model_name)
+                resident = [model_name]
+                if conversation:
+                    resident = self._conversation_models(translator, model_name)
+                    if len(resident) == 2:
+                        model_src, model_tgt = ctranslate2_engine.parse_model_pair(model_name)
+                        routed_src, _ = self._get_conversation_router(model_src, model_tgt).route(text)
+                        model_name = resident[0] if routed_src == model_src else resident[1]
+                model_src, model_tgt = ctranslate2_engine.parse_model_pair(model_name)
+                src = model_src or source_lang.split("-")[0].lower()
+                jobs = [(model_tgt or target_lang, model_name)]
+                for tgt in extra_targets:
+                    if tgt in (src, jobs[0][0]):
+                        continue
+                    try:
+                        jobs.append((tgt, translator.resolve_model_name(src, tgt)))
+                    except RuntimeError as e:
+                        logger.warning(f"Skipping additional target {tgt}: {e}")
+                capacity_token = translator.reserve_capacity(
+                    sum(2 if translator.is_pivot(name) else 1 for name in set(resident) | {name for _, name in jobs})
+                )
+                release_capacity = lambda: translator.release_capacity(capacity_token)
+                
+                def translate_one(tgt, name, allow_stream):
+                    cache_key = TranslationCache.make_key(engine, name, src, tgt, text)
+                    return self.translation_cache.get_or_compute(
+                        cache_key, lambda: self._translate_with_memory(
+                            config, src, tgt, text,
+                            lambda prefix: self._translate_ctranslate2(translator, text, name, config, prefix, allow_stream),
+                            supports_prefix=True
+                        )
+                    )
+
+            elif engine == "fastest":
+                self.on_audio_status("Translating...", False, False)
+                urls = self._libretranslate_urls(config)
+                src = source_lang.split("-")[0].lower()
+                if conversation:
+                    src, target_lang = self._get_conversation_router(src, target_lang).route(text)
+                jobs = [(target_lang, None)] + [(tgt, None) for tgt in extra_targets if tgt not in (target_lang, src)]
+
+                def translate_one(tgt, name, allow_stream):
+                    cache_key = TranslationCache.make_key(engine, None, src, tgt, text)
+                    return self.translation_cache.get_or_compute(
+                        cache_key, lambda: self._translate_with_memory(
+                            config, src, tgt, text,
+                            lambda prefix: self._translate_race(config, text, src, tgt, urls, deadline)
+                        )
+                    )
 
             else:
                 self.on_audio_status("Translating (LibreTranslate)...", False, False)
                 url = config.get("libretranslate_url", DEFAULT_LIBRETRANSLATE_URL)
+                urls = self._libretranslate_urls(config)
                 
                 src = "pl" if source_lang.startswith("pl") else ("en" if source_lang.startswith("en") else source_lang)
+                if conversation:
+                    src, target_lang = self._get_conversation_router(src.split("-")[0].lower(), target_lang).route(text)
+                jobs = [(target_lang, None)] + [(tgt, None) for tgt in extra_targets if tgt not in (target_lang, src.split("-")[0].lower())]
                 
-                translated_text = self._translate_libretranslate(text, src, target_lang, url)
+                def translate_one(tgt, name, allow_stream):
+                    cache_key = TranslationCache.make_key(engine, url, src, tgt, text)
+                    return self.translation_cache.get_or_compute(
+                        cache_key, lambda: self._translate_with_memory(
+                            config, src.split("-")[0].lower(), tgt, text,
+                            lambda prefix: self._translate_libretranslate(text, src, tgt, urls, deadline)
+                        )
+                    )
+            
+            try:
+                if len(jobs) == 1:
+                    translated_text = translate_one(jobs[0][0], jobs[0][1], True)
+                else:
+                    translated_text = self._translate_fanout(jobs, translate_one)
+                    self._log_cache_stats()
+                    if not translated_text:
+                        self.on_audio_status("Translation failed for all target languages.", False, True)
+                    return
+            except Exception as e:
+                logger.error(f"Translation failed: {e}")
+                self.on_audio_status(f"Translation error: {e}", False, True)
+                return
+            finally:
+                if release_capacity:
+                    release_capacity()
+            
+            self._log_cache_stats()
+            self._log_perf(config)
+            if engine == "ctranslate2" and deadline.remaining() <= 0:
+                # In-process decoding cannot be interrupted, so an overrun is only reported.
+                logger.warning(f"CTranslate2 translation overran its {deadline.timeout_s:.1f}s deadline")
                 
             if translated_text:
                 self.last_translated_text = translated_text
@@ -144,28 +350,294 @@ class ApplicationController(QtCore.QObject):
             logger.error(f"Translation worker error: {err_msg}")
             self.on_audio_status(f"Error: {err_msg}", False, True)
 
-    def _translate_libretranslate(self, text, source, target, url):
-        retries = 3
-        backoff = 1
-        for i in range(retries):
+    def _translate_fanout(self, jobs, translate_one):
+        start = time.perf_counter()
+        futures = [self.fanout_executor.submit(translate_one, tgt, name, False) for tgt, name in jobs[1:]]
+        
+        outcomes = []
+        try:
+            outcomes.append((jobs[0][0], translate_one(jobs[0][0], jobs[0][1], False)))
+        except Exception as e:
+            logger.error(f"Translation to {jobs[0][0]} failed: {e}")
+            outcomes.append((jobs[0][0], None))
+        for (tgt, _), future in zip(jobs[1:], futures):
+            try:
+                outcomes.append((tgt, future.result()))
+            except Exception as e:
+                logger.error(f"Translation to {tgt} failed: {e}")
+                outcomes.append((tgt, None))
+        
+        logger.debug(f"Fan-out to {len(jobs)} targets took {(time.perf_counter() - start) * 1000:.0f}ms")
+        lines = [(tgt, result) for tgt, result in outcomes if result]
+        if not lines:
+            return None
+        
+        self.last_translated_text = "\n".join(result for _, result in lines)
+        if self.overlay_window:
+            self.overlay_window.show_lines_signal.emit(lines, True, 0)
+        return self.last_translated_text
+
+    def _translate_ctranslate2(self, translator, text, model_name, config, target_prefix=None, allow_stream=True):
+        word_count = len(text.split())
+        streaming = allow_stream and config.get("stream_translation", DEFAULT_STREAM_TRANSLATION)
+        if streaming and config.get("decoding_profile", DEFAULT_DECODING_PROFILE) == "auto":
+            # Token streaming is itself the latency choice; greedy decoding is what streams.
+            profile = "fastest"
+        else:
+            profile = self._select_decoding_profile(config, word_count)
+        model_was_loaded = translator.is_loaded(model_name)
+        
+        start = time.perf_counter()
+        if streaming:
+            translated_text = self._translate_streaming(translator, text, model_name, profile, config, target_prefix)
+        else:
+            translated_text = translator.translate(text, model_name=model_name, profile=profile, target_prefix=target_prefix)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        if model_was_loaded:
+            self.profile_selector.observe(profile, word_count, elapsed_ms)
+        logger.debug(f"CTranslate2 translation took {elapsed_ms:.0f}ms (profile: {profile})")
+        return translated_text
+
+    def _translate_with_memory(self, config, source_lang, target_lang, text, translate_func, supports_prefix=False):
+        if not config.get("translation_memory_enabled", True):
+            return translate_func(None)
+        
+        match_target = self.translation_memory.exact(source_lang, target_lang, text)
+        if match_target:
+            logger.info(f"Translation memory hit for '{text}'")
+            return match_target
+        
+        # A fuzzy match is another sentence, so it is never returned as the
+        # translation; at most it seeds the start of the decoded output.
+        prefix = None
+        if supports_prefix and config.get("translation_memory_fuzzy", DEFAULT_TRANSLATION_MEMORY_FUZZY):
+            seed_threshold = config.get("translation_memory_seed_threshold", DEFAULT_TRANSLATION_MEMORY_SEED_THRESHOLD)
+            match = self.translation_memory.lookup(source_lang, target_lang, text, seed_threshold)
+            if match:
+                score, match_source, match_target = match
+                prefix = seed_prefix(text, match_source, match_target) or None
+                if prefix:
+                    logger.debug(f"Seeding translation from memory ({score:.2f}) with prefix '{prefix}'")
+        
+        translated_text = translate_func(prefix)
+        if translated_text:
+            self.translation_memory.add(source_lang, target_lang, text, translated_text)
+        return translated_text
+
+    def _log_cache_stats(self):
+        stats = self.translation_cache.stats()
+        if stats["lookups"] and stats["lookups"] % CACHE_STATS_LOG_INTERVAL == 0:
+            logger.info(
+                f"Translation cache: {stats['hit_rate']:.0%} hit rate over {stats['lookups']} lookups "
+                f"(memory {stats['memory_hits']}, disk {stats['disk_hits']}, coalesced {stats['coalesced']}, "
+                f"misses {stats['misses']}, {stats['entries']} entries)"
+            )
+
+    def _log_perf(self, config):
+        lag = self.lag_monitor.snapshot()
+        overflows = audio_overflow_count()
+        mode = config.get("ctranslate2_worker_mode", DEFAULT_CTRANSLATE2_WORKER_MODE)
+        self.performance_signal.emit(f"UI lag p95 {lag['p95_ms']:.0f}ms, audio overflows: {overflows}")
+        message = (
+            f"UI event loop lag ({mode} worker): p50 {lag['p50_ms']:.1f}ms, p95 {lag['p95_ms']:.1f}ms, "
+            f"max {lag['max_ms']:.1f}ms over {lag['samples']} samples; audio overflows: {overflows}"
+        )
+        if lag["p95_ms"] >= UI_LAG_WARN_MS or overflows > self.reported_overflows:
+            self.reported_overflows = overflows
+            logger.warning(message)
+        else:
+            logger.debug(message)
+
+    def _translate_streaming(self, translator, text, model_name, profile, config, target_prefix=None):
+        max_rate = config.get("stream_max_updates_per_second", DEFAULT_STREAM_MAX_UPDATES_PER_SECOND)
+        min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        start = time.perf_counter()
+        last_emit = 0.0
+        partial = ""
+        first_word_logged = False
+        
+        for partial in translator.translate_stream(text, model_name=model_name, profile=profile, target_prefix=target_prefix):
+            now = time.perf_counter()
+            if not first_word_logged and partial.strip():
+                logger.debug(f"Time to first word: {(now - start) * 1000:.0f}ms")
+                first_word_logged = True
+            if now - last_emit >= min_interval:
+                last_emit = now
+                self.on_audio_status(partial, False, False)
+        
+        return partial
+
+    def _select_decoding_profile(self, config, word_count):
+        profile = config.get("decoding_profile", DEFAULT_DECODING_PROFILE)
+        if profile != "auto":
+            return profile
+        target_latency = config.get("target_latency_ms", DEFAULT_TARGET_LATENCY_MS)
+        return self.profile_selector.select(word_count, target_latency)
+
+    def _translate_libretranslate(self, text, source, target, urls, deadline):
+        translated_text = self._request_libretranslate(text, source, target, urls, deadline)
+        if translated_text is not None:
+            return translated_text
+        reason = "deadline passed" if deadline.remaining() <= 0 else f"circuit {self.breaker.state}"
+        return self._translate_fallback(text, source, target, deadline, reason)
+
+    def _request_libretranslate(self, text, source, target, urls, deadline):
+        config = config_handler.config
+        self.breaker.configure(
+            config.get("libretranslate_breaker_threshold", DEFAULT_LIBRETRANSLATE_BREAKER_THRESHOLD),
+            config.get("libretranslate_breaker_reset_s", DEFAULT_LIBRETRANSLATE_BREAKER_RESET_S)
+        )
+        pool = get_libretranslate_pool(urls)
+        # Sentences go out as one array request, or as parallel chunks when
+        # several servers are configured, instead of one long string.
+        segments = split_segments(text) if config.get("libretranslate_batching", True) else [text]
+        if deadline.done() or not self.breaker.allow():
+            return None
+        # The breaker counts requests, not attempts: retries of one utterance
+        # add a single failure between them.
+        backoff = LIBRETRANSLATE_BACKOFF_S
+        attempted = False
+        for i in range(LIBRETRANSLATE_RETRIES):
+            if deadline.done():
+                break
+            remaining = max(deadline.remaining(), LIBRETRANSLATE_MIN_TIMEOUT_S)
+            timeout = (min(CONNECT_TIMEOUT_S, remaining), remaining)
+            attempted = True
             try:
-                payload = {"q": text, "source": source, "target": target}
-                resp = requests.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=10)
-                if resp.status_code == 200:
-                    return resp.json().get("translatedText", "")
+                if len(segments) > 1:
+                    result = " ".join(pool.translate_segments(segments, source, target, timeout))
                 else:
-                    logger.error(f"LibreTranslate error: {resp.status_code} - {resp.text}")
-            except requests.exceptions.Timeout:
-                logger.warning(f"LibreTranslate timeout (attempt {i+1}/{retries})")
+                    result = pool.translate(text, source, target, timeout=timeout)
+                self.breaker.record_success()
+                return result
+            except PoolExhausted as e:
+                logger.error(f"LibreTranslate error (attempt {i+1}/{LIBRETRANSLATE_RETRIES}): {e}")
             except Exception as e:
                 logger.error(f"LibreTranslate request error: {e}")
-            
-            if i < retries - 1:
-                time.sleep(backoff)
-                backoff *= 2
-        
+
+            if i == LIBRETRANSLATE_RETRIES - 1 or not deadline.sleep(backoff):
+                break
+            backoff *= 2
+        if attempted:
+            self.breaker.record_failure()
+        else:
+            # Nothing was sent before the deadline ran out, which says nothing
+            # about the server.
+            self.breaker.release()
         return None
 
+    def _translate_race(self, config, text, source, target, urls, deadline):
+        entrants = {}
+        try:
+            translator = self._ctranslate2_translator(config)
+            model_name = translator.resolve_model_name(source, target)
+            entrants["ctranslate2"] = lambda race_deadline: self._translate_ctranslate2(
+                translator, text, model_name, config, None, False
+            )
+        except RuntimeError as e:
+            logger.debug(f"CTranslate2 sits this race out: {e}")
+        entrants["libretranslate"] = lambda race_deadline: self._request_libretranslate(
+            text, source, target, urls, race_deadline
+        )
+
+        chosen = self.race_stats.choose(list(entrants))
+        winner, translated_text = self._run_race({name: entrants[name] for name in chosen}, deadline)
+        if winner is None and len(chosen) < len(entrants):
+            backup = {name: run for name, run in entrants.items() if name not in chosen}
+            logger.info(f"{chosen[0]} failed, trying {', '.join(backup)}")
+            winner, translated_text = self._run_race(backup, deadline)
+        if len(entrants) > 1 and (len(chosen) > 1 or winner not in chosen):
+            self.race_stats.record_race(list(entrants) if winner not in chosen else chosen, winner)
+        return translated_text
+
+    def _run_race(self, entrants, deadline):
+        start = time.perf_counter()
+        # The losers only need to stop retrying; their in-flight work is ignored.
+        race_deadline = Deadline(deadline.remaining())
+        futures = {}
+        for name, run in entrants.items():
+            future = self.race_executor.submit(run, race_deadline)
+            future.add_done_callback(lambda f, name=name: self._record_race_result(name, f, start, race_deadline))
+            futures[future] = name
+
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning(f"No engine answered within the {deadline.timeout_s:.1f}s deadline")
+                    break
+                for future in done:
+                    if future.exception() is None and future.result():
+                        logger.debug(f"{futures[future]} won the race in {(time.perf_counter() - start) * 1000:.0f}ms")
+                        return futures[future], future.result()
+        finally:
+            race_deadline.cancel()
+            for future in pending:
+                future.cancel()
+        return None, None
+
+    def _record_race_result(self, name, future, start, race_deadline):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.warning(f"{name} failed in the engine race: {future.exception()}")
+            self.race_stats.record_result(name, None)
+        elif not future.result():
+            # A loser that gave up because the race was over did not fail.
+            if not race_deadline.cancelled:
+                self.race_stats.record_result(name, None)
+        else:
+            self.race_stats.record_result(name, (time.perf_counter() - start) * 1000)
+
+    def _translate_fallback(self, text, source, target, deadline, reason):
+        config = config_handler.config
+        if not config.get("ctranslate2_fallback", True):
+            logger.warning(f"LibreTranslate unavailable ({reason}) and CTranslate2 fallback is disabled")
+            return None
+        try:
+            translator = self._ctranslate2_translator(config)
+            model_name = translator.resolve_model_name(source.split("-")[0].lower(), target)
+            if not translator.is_loaded(model_name):
+                load_ms = (translator.get_model_info(model_name) or {}).get("load_ms")
+                if not load_ms or load_ms / 1000 > deadline.remaining():
+                    self._load_fallback_model(translator, model_name)
+                    logger.warning(f"LibreTranslate unavailable ({reason}), fallback model {model_name} is not resident yet")
+                    return None
+            translated_text = translator.translate(text, model_name=model_name, profile="fastest")
+        except Exception as e:
+            logger.warning(f"LibreTranslate unavailable ({reason}) and CTranslate2 fallback failed: {e}")
+            return None
+        self.fallback_count += 1
+        logger.info(f"LibreTranslate unavailable ({reason}), translated with {model_name} ({self.fallback_count} fallbacks so far)")
+        self.translation_health_signal.emit(self.breaker.state, self.fallback_count)
+        return translated_text
+
+    def _load_fallback_model(self, translator, model_name):
+        if model_name in self.fallback_loading:
+            return
+        self.fallback_loading.add(model_name)
+
+        def load():
+            try:
+                translator.ensure_loaded(model_name)
+                logger.info(f"Fallback model {model_name} is resident")
+            except Exception as e:
+                logger.warning(f"Could not load fallback model {model_name}: {e}")
+            finally:
+                self.fallback_loading.discard(model_name)
+
+        threading.Thread(target=load, name="FallbackModelLoad", daemon=True).start()
+
+    def _on_breaker_change(self, state):
+        stats = self.breaker.stats()
+        logger.info(
+            f"LibreTranslate circuit is {state} (opened {stats['times_opened']} times, "
+            f"{stats['rejected']} requests short-circuited, {self.fallback_count} fallbacks)"
+        )
+        self.translation_health_signal.emit(state, self.fallback_count)
+
     def copy_last_translation(self):
         if self.last_translated_text and self.overlay_window:
             self.overlay_window.copy_to_clipboard_signal.emit(self.last_translated_text)
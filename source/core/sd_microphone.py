@@ -4,6 +4,7 @@ except OSError:
     sd = None
 import speech_recognition as sr
 import logging
+from utils.perf_monitor import record_audio_overflow
 
 logger = logging.getLogger("SoundDeviceMic")
 
@@ -11,10 +12,15 @@ class SoundDeviceStreamWrapper:
     def __init__(self, sd_stream, sample_width):
         self.sd_stream = sd_stream
         self.sample_width = sample_width
+        self.overflows = 0
     
     def read(self, size):
         frames = size // self.sample_width
         data, overflowed = self.sd_stream.read(frames)
+        if overflowed:
+            self.overflows += 1
+            record_audio_overflow()
+            logger.debug(f"Audio input overflow ({self.overflows} in this stream)")
         return bytes(data)
 
 class SoundDeviceMicrophone(sr.AudioSource):
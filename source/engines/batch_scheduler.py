@@ -0,0 +1,116 @@
+import time
+import logging
+import threading
+from collections import deque, Counter
+from concurrent.futures import Future
+
+logger = logging.getLogger("BatchScheduler")
+
+DEFAULT_BATCH_WINDOW_MS = 5
+DEFAULT_MAX_BATCH_SIZE = 16
+CONCURRENCY_GAP_S = 0.05
+IDLE_WORKER_TIMEOUT_S = 60
+STATS_LOG_INTERVAL = 100
+
+class BatchScheduler:
+    def __init__(self, run_batch, window_ms=DEFAULT_BATCH_WINDOW_MS, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.run_batch = run_batch
+        self.window_ms = window_ms
+        self.max_batch_size = max_batch_size
+        self.cond = threading.Condition()
+        self.queues = {}
+        self.workers = {}
+        self.last_arrival = {}
+        self.concurrent = {}
+        self.batch_sizes = Counter()
+        self.queue_depths = Counter()
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, key, item):
+        return self.submit_many(key, [item])[0]
+
+    def submit_many(self, key, items):
+        futures = [Future() for _ in items]
+        now = time.monotonic()
+        with self.cond:
+            queue = self.queues.setdefault(key, deque())
+            previous = self.last_arrival.get(key)
+            self.concurrent[key] = bool(queue) or (previous is not None and now - previous < CONCURRENCY_GAP_S)
+            self.last_arrival[key] = now
+            queue.extend(zip(items, futures))
+            self.requests += len(items)
+            if key not in self.workers:
+                worker = threading.Thread(target=self._worker, args=(key,), daemon=True)
+                self.workers[key] = worker
+                worker.start()
+            self.cond.notify_all()
+        return futures
+
+    def _next_batch(self, key):
+        with self.cond:
+            queue = self.queues[key]
+            idle_deadline = time.monotonic() + IDLE_WORKER_TIMEOUT_S
+            while not queue:
+                remaining = idle_deadline - time.monotonic()
+                if remaining <= 0:
+                    del self.workers[key]
+                    del self.queues[key]
+                    return None
+                self.cond.wait(remaining)
+
+            # A lone request is dispatched immediately; the window only applies
+            # when other requests for this key arrived close together.
+            if self.concurrent.get(key) and len(queue) < self.max_batch_size:
+                deadline = time.monotonic() + self.window_ms / 1000
+                while len(queue) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.cond.wait(remaining)
+
+            depth = len(queue)
+            batch = [queue.popleft() for _ in range(min(depth, self.max_batch_size))]
+            self.queue_depths[depth] += 1
+            self.batch_sizes[len(batch)] += 1
+            self.batches += 1
+            return batch
+
+    def _worker(self, key):
+        while True:
+            batch = self._next_batch(key)
+            if batch is None:
+                return
+            items = [item for item, _ in batch]
+            try:
+                results = self.run_batch(key, items)
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except BaseException as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            if len(batch) > 1:
+                logger.debug(f"Ran batch of {len(batch)} requests for {key[0]}")
+            if self.batches % STATS_LOG_INTERVAL == 0:
+                stats = self.stats()
+                logger.info(
+                    f"Batching: {stats['requests']} requests in {stats['batches']} batches "
+                    f"(mean {stats['mean_batch_size']:.2f}, sizes {stats['batch_size_histogram']}, "
+                    f"queue depths {stats['queue_depth_histogram']})"
+                )
+
+    def queue_depth(self):
+        with self.cond:
+            return sum(len(queue) for queue in self.queues.values())
+
+    def stats(self):
+        with self.cond:
+            return {
+                "requests": self.requests,
+                "batches": self.batches,
+                "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+                "queue_depth": sum(len(queue) for queue in self.queues.values()),
+                "batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+                "queue_depth_histogram": dict(sorted(self.queue_depths.items())),
+            }
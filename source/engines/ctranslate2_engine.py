@@ -1,15 +1,31 @@
 import os
+import json
+import time
+import hashlib
 import logging
+import platform
+import difflib
 from pathlib import Path
 import shutil
-import subprocess
-import sys
+import itertools
+import threading
+
+from core.constants import CTRANSLATE2_COMPUTE_TYPES
+from engines.batch_scheduler import BatchScheduler
+from engines.decoding_profiles import build_decoding_options
+from engines.text_segmentation import split_sentences
+from engines.vocabulary_map import build_vmap, benchmark_vmap, write_vmap_report, vmap_enabled, VMAP_FILE
+from engines.page_cache import seconds_since_prewarm
+from engines.model_registry import (
+    get_registry, parse_model_pair, file_checksum, touch_model_dir, PIVOT_MANIFEST, INSTALL_REPORT_FILE
+)
 
 logger = logging.getLogger("CTranslate2Engine")
 
 ctranslate2 = None
 transformers = None
 HAS_CTRANSLATE2 = None
+HAS_CONVERSION_LIBS = None
 
 def _import_libs():
     global ctranslate2, transformers, HAS_CTRANSLATE2
@@ -17,7 +33,6 @@ def _import_libs():
         return HAS_CTRANSLATE2
         
     try:
-        import torch
         import ctranslate2 as ct2
         import transformers as tf
         try:
@@ -34,16 +49,100 @@ def _import_libs():
         HAS_CTRANSLATE2 = True
     except ImportError as e:
         HAS_CTRANSLATE2 = False
-        logger.warning(f"Required libraries not installed ({e}). Please install them with: pip install torch ctranslate2 transformers sentencepiece")
+        logger.warning(f"Required libraries not installed ({e}). Please install them with: pip install ctranslate2 transformers sentencepiece")
     return HAS_CTRANSLATE2
 
+def _import_conversion_libs():
+    global HAS_CONVERSION_LIBS
+    if HAS_CONVERSION_LIBS is not None:
+        return HAS_CONVERSION_LIBS
+    if not _import_libs():
+        HAS_CONVERSION_LIBS = False
+        return False
+    try:
+        import torch
+        import ctranslate2.converters
+        HAS_CONVERSION_LIBS = True
+    except ImportError as e:
+        HAS_CONVERSION_LIBS = False
+        logger.warning(f"Model conversion libraries not installed ({e}). Please install them with: pip install torch")
+    return HAS_CONVERSION_LIBS
+
+# Probed in settings order, so anything "auto" picks can also be chosen by hand.
+COMPUTE_TYPE_CANDIDATES = [c for c in CTRANSLATE2_COMPUTE_TYPES if c != "auto"]
+COMPUTE_TYPE_CACHE_FILE = "compute_types.json"
+COMPUTE_TYPE_ACCURACY_TOLERANCE = 0.9
+COMPUTE_TYPE_PROBE_ROUNDS = 3
+COMPUTE_TYPE_PROBE_SENTENCES = [
+    "Good morning, how are you today?",
+    "The meeting has been moved to Thursday afternoon because the manager is travelling.",
+    "Please send me the report before the end of the week.",
+    "I think we should try a different approach to this problem.",
+]
+
+def _cpu_fingerprint():
+    cpu_model = platform.processor() or ""
+    flags = []
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name") and not cpu_model:
+                    cpu_model = line.split(":", 1)[1].strip()
+                elif line.startswith("flags"):
+                    wanted = ("avx2", "avx512f", "avx512_vnni", "avx512_bf16", "avx_vnni", "fma", "f16c")
+                    flags = sorted(flag for flag in line.split(":", 1)[1].split() if flag in wanted)
+                    break
+    except OSError:
+        pass
+    ct2_version = getattr(ctranslate2, "__version__", "unknown") if ctranslate2 else "unknown"
+    raw = f"{platform.machine()}|{cpu_model}|{','.join(flags)}|{ct2_version}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16], cpu_model, flags
+
+CONVERSION_QUANTIZATIONS = ["int8", "int8_float32", "int8_float16", "int8_bfloat16", "int16", "float16", "bfloat16", "float32"]
+DEFAULT_INSTALL_QUANTIZATION = "int8"
+TOKENIZER_FILES = ("source.spm", "target.spm", "vocab.json", "tokenizer_config.json", "special_tokens_map.json")
+
+def conversion_quantization(compute_type):
+    return compute_type if compute_type in CONVERSION_QUANTIZATIONS else DEFAULT_INSTALL_QUANTIZATION
+
+def _directory_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+PIVOT_LANGUAGE = "en"
+DEFAULT_MAX_LOADED_MODELS = 2
+
+class ModelNotAvailableError(Exception):
+    pass
+
+def model_files(model_dir, model_name):
+    entry = get_registry(model_dir).get(model_name)
+    if not entry:
+        return []
+    names = entry["legs"] if entry["pivot"] else [model_name]
+    return [
+        path for name in names for path in sorted((Path(model_dir) / name).iterdir())
+        if path.is_file() and not path.name.startswith(".")
+    ]
+
+def pivot_model_dir_name(source, target):
+    return f"Pivot_opus-mt-{source}-{target}"
+
 class CTranslate2Wrapper:
-    def __init__(self, model_dir="models", device="cpu", compute_type="int8"):
+    def __init__(self, model_dir="models", device="cpu", compute_type="auto"):
         self.model_dir = Path(model_dir)
+        self.registry = get_registry(self.model_dir)
         self.device = device
         self.compute_type = compute_type
         self.models = {}
         self.tokenizers = {}
+        self.loaded_compute_types = {}
+        self.vmap_models = set()
+        self.max_loaded_models = DEFAULT_MAX_LOADED_MODELS
+        self.reservations = {}
+        self.reservation_ids = itertools.count(1)
+        self.lock = threading.RLock()
+        self.load_locks = {}
+        self.scheduler = BatchScheduler(self._run_batch)
         
         if not self.model_dir.exists():
             try:
@@ -61,7 +160,7 @@ class CTranslate2Wrapper:
         return self.model_dir / safe_name
 
     def ensure_model(self, source_lang, target_lang):
-        if not _import_libs():
+        if not _import_conversion_libs():
             return False, "CTranslate2 libraries not installed."
 
         model_name, src, tgt = self._get_model_name(source_lang, target_lang)
@@ -81,184 +180,518 @@ class CTranslate2Wrapper:
             logger.error(f"Failed to download/convert model {model_name}: {e}")
             return False, str(e)
 
+    def set_model_dir(self, model_dir):
+        self.model_dir = Path(model_dir)
+        self.registry = get_registry(self.model_dir)
+
     def list_models(self):
-        if not self.model_dir.exists():
-            return []
-        
-        models = []
-        for item in self.model_dir.iterdir():
-            if item.is_dir() and (item / "model.bin").exists():
-                models.append(item.name)
-        return models
+        return self.registry.models()
 
-    def load_model(self, source_lang, target_lang):
+    def get_model_info(self, model_name):
+        return self.registry.get(model_name)
+
+    def is_pivot(self, model_name):
+        entry = self.registry.get(model_name)
+        return bool(entry and entry["pivot"])
+
+    def get_pivot_legs(self, model_name):
+        return self.registry.get(model_name)["legs"]
+
+    def is_loaded(self, model_name):
+        names = self.get_pivot_legs(model_name) if self.is_pivot(model_name) else [model_name]
+        with self.lock:
+            return all(name in self.models for name in names)
+
+    def resolve_model_name(self, source_lang, target_lang):
         model_name, src, tgt = self._get_model_name(source_lang, target_lang)
         local_path = self._get_local_model_path(model_name)
+
+        if self.registry.get(local_path.name):
+            return local_path.name
+
+        resolved = self.registry.resolve(src, tgt)
+        if resolved:
+            return resolved
+
+        raise RuntimeError(f"Model for {src}-{tgt} not found at {local_path}. Please download it using the 'Download New Model' button.")
+
+    def load_model(self, source_lang, target_lang):
+        return self.load_model_by_name(self.resolve_model_name(source_lang, target_lang))
+
+    def loaded_models(self):
+        with self.lock:
+            return list(self.models)
+
+    def unload_model(self, model_name):
+        names = self.get_pivot_legs(model_name) if self.is_pivot(model_name) else [model_name]
+        with self.lock:
+            for name in names:
+                self._unload(name)
+
+    def reserve_capacity(self, count):
+        # Reservations only last until released, so the resident-model cap
+        # falls back once a fan-out, conversation or prefetch is done.
+        with self.lock:
+            token = next(self.reservation_ids)
+            self.reservations[token] = count
+            self._update_capacity()
+        return token
+
+    def release_capacity(self, token):
+        with self.lock:
+            self.reservations.pop(token, None)
+            self._update_capacity()
+
+    def _update_capacity(self):
+        capacity = max([DEFAULT_MAX_LOADED_MODELS] + list(self.reservations.values()))
+        if capacity != self.max_loaded_models:
+            logger.info(f"Keeping up to {capacity} models resident")
+            self.max_loaded_models = capacity
+
+    def ensure_loaded(self, model_name):
+        if self.is_pivot(model_name):
+            first, second = self.get_pivot_legs(model_name)
+            self.load_model_by_name(first, protected=(second,))
+            self.load_model_by_name(second, protected=(first,))
+        else:
+            self.load_model_by_name(model_name)
+
+    def _load_tokenizer(self, local_path, model_name):
+        candidates = [str(local_path), model_name.replace("_", "/")]
+        if "opus-mt" in model_name and not model_name.startswith("Helsinki-NLP"):
+             candidates.append(f"Helsinki-NLP/{model_name.replace('_', '/')}")
         
-        if not local_path.exists() or not (local_path / "model.bin").exists():
-            found = False
-            for item in self.model_dir.iterdir():
-                if item.is_dir() and f"{src}-{tgt}" in item.name:
-                    local_path = item
-                    found = True
+        tokenizer = None
+        last_err = None
+        for candidate in candidates:
+            try:
+                logger.debug(f"Attempting to load tokenizer from candidate: {candidate}")
+                tokenizer = transformers.AutoTokenizer.from_pretrained(candidate, local_files_only=True if candidate == str(local_path) else False)
+                if tokenizer:
+                    logger.info(f"Successfully loaded tokenizer from: {candidate}")
                     break
-            
-            if not found:
-                raise RuntimeError(f"Model for {src}-{tgt} not found at {local_path}. Please download it using the 'Download New Model' button.")
+            except Exception as ex:
+                last_err = ex
+                continue
         
-        return self.load_model_by_name(local_path.name)
+        if tokenizer is None:
+            logger.warning(f"Could not load tokenizer for {model_name}. Last error: {last_err}")
+            if last_err:
+                raise last_err
+            else:
+                raise RuntimeError(f"Failed to load tokenizer for {model_name}")
+        return tokenizer
 
-    def load_model_by_name(self, model_name):
-        if not _import_libs():
-            raise RuntimeError("CTranslate2 libraries not installed.")
+    def _compute_type_cache_path(self):
+        return self.model_dir / COMPUTE_TYPE_CACHE_FILE
 
-        if model_name in self.models:
-            return self.models[model_name], self.tokenizers[model_name]
+    def _read_compute_type_cache(self):
+        path = self._compute_type_cache_path()
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"Could not read compute type cache {path}: {e}")
+            return {}
 
-        if self.models:
-            logger.info("Unloading previous models to free memory...")
-            self.models.clear()
-            self.tokenizers.clear()
-            import gc
-            gc.collect()
+    def _write_compute_type_cache(self, data):
+        path = self._compute_type_cache_path()
+        try:
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write compute type cache {path}: {e}")
 
-        local_path = self.model_dir / model_name
-        if not local_path.exists() or not (local_path / "model.bin").exists():
-             raise RuntimeError(f"Model {model_name} not found at {local_path}")
+    def get_selected_compute_type(self, model_name):
+        if self.compute_type != "auto":
+            return self.compute_type, "configured"
+        if model_name in self.loaded_compute_types:
+            return self.loaded_compute_types[model_name], "measured"
+        machine_key, _, _ = _cpu_fingerprint()
+        entry = self._read_compute_type_cache().get(machine_key, {}).get("models", {}).get(model_name)
+        if entry:
+            return entry.get("compute_type"), "measured"
+        return None, "pending"
 
-        logger.info(f"Loading model {model_name} from {local_path}...")
-        
+    def resolve_compute_type(self, model_name, local_path, tokenizer):
+        if self.compute_type != "auto":
+            return self.compute_type
+
+        machine_key, cpu_model, flags = _cpu_fingerprint()
+        cache = self._read_compute_type_cache()
+        entry = cache.get(machine_key, {}).get("models", {}).get(model_name)
+        if entry and entry.get("compute_type"):
+            logger.info(f"Using cached compute type '{entry['compute_type']}' for {model_name}")
+            return entry["compute_type"]
+
+        compute_type, timings = self._probe_compute_types(local_path, tokenizer)
+        machine = cache.setdefault(machine_key, {"cpu": cpu_model, "flags": flags, "models": {}})
+        machine.setdefault("models", {})[model_name] = {
+            "compute_type": compute_type,
+            "timings_ms": timings,
+            "measured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._write_compute_type_cache(cache)
+        return compute_type
+
+    def _probe_compute_types(self, local_path, tokenizer):
         try:
-            translator = ctranslate2.Translator(str(local_path), device=self.device, compute_type=self.compute_type)
-            
-            candidates = [str(local_path), model_name.replace("_", "/")]
-            if "opus-mt" in model_name and not model_name.startswith("Helsinki-NLP"):
-                 candidates.append(f"Helsinki-NLP/{model_name.replace('_', '/')}")
-            
-            tokenizer = None
-            last_err = None
-            for candidate in candidates:
-                try:
-                    logger.debug(f"Attempting to load tokenizer from candidate: {candidate}")
-                    tokenizer = transformers.AutoTokenizer.from_pretrained(candidate, local_files_only=True if candidate == str(local_path) else False)
-                    if tokenizer:
-                        logger.info(f"Successfully loaded tokenizer from: {candidate}")
-                        break
-                except Exception as ex:
-                    last_err = ex
-                    continue
-            
-            if tokenizer is None:
-                logger.warning(f"Could not load tokenizer for {model_name}. Last error: {last_err}")
-                if last_err:
-                    raise last_err
-                else:
-                    raise RuntimeError(f"Failed to load tokenizer for {model_name}")
-
-                    if (local_path / "source.spm").exists() and (local_path / "target.spm").exists():
-                        try:
-                            from transformers import MarianTokenizer
-                            tokenizer = MarianTokenizer.from_pretrained(str(local_path))
-                        except Exception:
-                            pass
-                    
-                    if tokenizer is None:
-                        logger.warning(f"Could not load tokenizer for {model_name}: {e}")
-                        raise e
-            
-            self.models[model_name] = translator
-            self.tokenizers[model_name] = tokenizer
-            
-            return translator, tokenizer
+            supported = set(ctranslate2.get_supported_compute_types(self.device))
         except Exception as e:
-            logger.error(f"Error loading model {model_name}: {e}")
-            raise
+            logger.warning(f"Could not query supported compute types: {e}")
+            supported = {"int8", "float32"}
+
+        candidates = [c for c in COMPUTE_TYPE_CANDIDATES if c in supported]
+        logger.info(f"Benchmarking compute types for {local_path.name}: {', '.join(candidates)}")
 
-    def translate(self, text, source_lang=None, target_lang=None, model_name=None):
+        batch = [tokenizer.convert_ids_to_tokens(tokenizer.encode(s)) for s in COMPUTE_TYPE_PROBE_SENTENCES]
+        reference = None
+        timings = {}
+        outputs = {}
+
+        for compute_type in ["float32"] + [c for c in candidates if c != "float32"]:
+            if compute_type not in supported:
+                continue
+            try:
+                translator = ctranslate2.Translator(str(local_path), device=self.device, compute_type=compute_type)
+                translator.translate_batch(batch[:1])
+                start = time.perf_counter()
+                for _ in range(COMPUTE_TYPE_PROBE_ROUNDS):
+                    results = translator.translate_batch(batch)
+                elapsed = (time.perf_counter() - start) * 1000 / COMPUTE_TYPE_PROBE_ROUNDS
+                del translator
+            except Exception as e:
+                logger.warning(f"Compute type {compute_type} failed during probe: {e}")
+                continue
+
+            hypotheses = [r.hypotheses[0] for r in results]
+            if compute_type == "float32":
+                reference = hypotheses
+            outputs[compute_type] = hypotheses
+            timings[compute_type] = round(elapsed, 1)
+            logger.debug(f"Compute type {compute_type}: {elapsed:.1f}ms per probe batch")
+
+        best = None
+        for compute_type, elapsed in sorted(timings.items(), key=lambda item: item[1]):
+            if reference is not None:
+                agreement = sum(
+                    difflib.SequenceMatcher(None, ref, hyp).ratio()
+                    for ref, hyp in zip(reference, outputs[compute_type])
+                ) / len(reference)
+                if agreement < COMPUTE_TYPE_ACCURACY_TOLERANCE:
+                    logger.info(f"Rejecting compute type {compute_type}: agreement {agreement:.2f} below tolerance")
+                    continue
+            best = compute_type
+            break
+
+        if best is None:
+            best = "int8" if "int8" in supported else "float32"
+        logger.info(f"Selected compute type '{best}' (timings: {timings})")
+        return best, timings
+
+    def _unload(self, model_name):
+        self.models.pop(model_name, None)
+        self.tokenizers.pop(model_name, None)
+        self.loaded_compute_types.pop(model_name, None)
+        self.vmap_models.discard(model_name)
+
+    def _evict_models(self, protected):
+        evicted = False
+        for name in list(self.models):
+            if len(self.models) < self.max_loaded_models:
+                break
+            if name in protected:
+                continue
+            logger.info(f"Unloading model {name} to free memory...")
+            self._unload(name)
+            evicted = True
+        if evicted:
+            import gc
+            gc.collect()
+
+    def load_model_by_name(self, model_name, protected=()):
         if not _import_libs():
             raise RuntimeError("CTranslate2 libraries not installed.")
 
+        with self.lock:
+            if model_name in self.models:
+                if self.compute_type == "auto" or self.loaded_compute_types.get(model_name) == self.compute_type:
+                    translator = self.models.pop(model_name)
+                    self.models[model_name] = translator
+                    return translator, self.tokenizers[model_name]
+            load_lock = self.load_locks.setdefault(model_name, threading.Lock())
+
+        with load_lock:
+            with self.lock:
+                if model_name in self.models and (self.compute_type == "auto" or self.loaded_compute_types.get(model_name) == self.compute_type):
+                    return self.models[model_name], self.tokenizers[model_name]
+                self._unload(model_name)
+                self._evict_models(set(protected) | {model_name})
+
+            local_path = self.model_dir / model_name
+            entry = self.registry.get(model_name)
+            if not entry or entry["pivot"]:
+                 raise RuntimeError(f"Model {model_name} not found at {local_path}")
+
+            logger.info(f"Loading model {model_name} from {local_path}...")
+            
+            try:
+                tokenizer = self._load_tokenizer(local_path, model_name)
+                compute_type = self.resolve_compute_type(model_name, local_path, tokenizer)
+                start = time.perf_counter()
+                # CTranslate2 copies the weights into its own buffers (even the
+                # in-memory files= variant), so a model cannot be mapped; the page
+                # cache prewarmer is what makes this read fast.
+                translator = ctranslate2.Translator(str(local_path), device=self.device, compute_type=compute_type)
+                prewarmed = seconds_since_prewarm(local_path / "model.bin")
+                cache_state = f", prewarmed {prewarmed:.0f}s ago" if prewarmed is not None else ""
+                logger.info(f"Loaded {model_name} ({compute_type}{cache_state}) in {(time.perf_counter() - start) * 1000:.0f}ms")
+                
+                with self.lock:
+                    self.models[model_name] = translator
+                    self.tokenizers[model_name] = tokenizer
+                    self.loaded_compute_types[model_name] = compute_type
+                    if vmap_enabled(local_path):
+                        self.vmap_models.add(model_name)
+                        logger.info(f"Vocabulary map enabled for {model_name}")
+                
+                return translator, tokenizer
+            except Exception as e:
+                logger.error(f"Error loading model {model_name}: {e}")
+                raise
+
+    def _resolve_request(self, source_lang, target_lang, model_name):
         if model_name:
-            translator, tokenizer = self.load_model_by_name(model_name)
+            return model_name
         elif source_lang and target_lang:
-            translator, tokenizer = self.load_model(source_lang, target_lang)
+            return self.resolve_model_name(source_lang, target_lang)
+        raise ValueError("Translate called without model_name or source/target pair")
+
+    def _translate_pivot(self, text, model_name, profile):
+        first, second = self.get_pivot_legs(model_name)
+        _, first_tokenizer = self.load_model_by_name(first, protected=(second,))
+        _, second_tokenizer = self.load_model_by_name(second, protected=(first,))
+
+        segments = split_sentences(text) or [text]
+        batch = [first_tokenizer.convert_ids_to_tokens(first_tokenizer.encode(s)) for s in segments]
+        results = self.translate_tokens(first, profile, batch)
+        intermediate = [first_tokenizer.decode(first_tokenizer.convert_tokens_to_ids(target)) for target, _ in results]
+        logger.debug(f"Pivot intermediate ({PIVOT_LANGUAGE}): {' '.join(intermediate)}")
+
+        batch = [second_tokenizer.convert_ids_to_tokens(second_tokenizer.encode(s)) for s in intermediate]
+        results = self.translate_tokens(second, profile, batch)
+        return " ".join(second_tokenizer.decode(second_tokenizer.convert_tokens_to_ids(target)) for target, _ in results)
+
+    def _run_batch(self, key, items):
+        model_name, profile = key
+        translator, _ = self.load_model_by_name(model_name)
+        sources = [source for source, _ in items]
+        prefixes = [prefix for _, prefix in items]
+        options = build_decoding_options(profile, max(len(source) for source in sources))
+        if model_name in self.vmap_models:
+            options["use_vmap"] = True
+        if any(prefixes):
+            longest_prefix = max(len(prefix) for prefix in prefixes if prefix)
+            options["max_decoding_length"] = max(options["max_decoding_length"], longest_prefix + 1)
+            results = translator.translate_batch(sources, target_prefix=[prefix or None for prefix in prefixes], **options)
         else:
-            raise ValueError("Translate called without model_name or source/target pair")
+            results = translator.translate_batch(sources, **options)
+        return [(r.hypotheses[0], r.scores[0] if options["return_scores"] and r.scores else None) for r in results]
+
+    def translate_tokens(self, model_name, profile, sources, prefixes=None):
+        prefixes = prefixes or [None] * len(sources)
+        futures = self.scheduler.submit_many((model_name, profile), list(zip(sources, prefixes)))
+        return [future.result() for future in futures]
+
+    def get_batching_stats(self):
+        return self.scheduler.stats()
+
+    def _tokenize_target_prefix(self, tokenizer, prefix_text):
+        if not prefix_text:
+            return None
+        try:
+            ids = tokenizer(text_target=prefix_text)["input_ids"]
+        except TypeError:
+            with tokenizer.as_target_tokenizer():
+                ids = tokenizer.encode(prefix_text)
+        tokens = tokenizer.convert_ids_to_tokens(ids)
+        if tokens and tokens[-1] == tokenizer.eos_token:
+            tokens = tokens[:-1]
+        return tokens or None
+
+    def translate(self, text, source_lang=None, target_lang=None, model_name=None, profile="balanced", target_prefix=None):
+        if not _import_libs():
+            raise RuntimeError("CTranslate2 libraries not installed.")
+
+        model_name = self._resolve_request(source_lang, target_lang, model_name)
+        if self.is_pivot(model_name):
+            return self._translate_pivot(text, model_name, profile)
+        _, tokenizer = self.load_model_by_name(model_name)
         
         source = tokenizer.convert_ids_to_tokens(tokenizer.encode(text))
-        results = translator.translate_batch([source])
-        target = results[0].hypotheses[0]
+        prefix = self._tokenize_target_prefix(tokenizer, target_prefix)
+        target, score = self.translate_tokens(model_name, profile, [source], [prefix])[0]
+        if score is not None:
+            logger.debug(f"Translation score ({profile}): {score:.3f}")
         translated_text = tokenizer.decode(tokenizer.convert_tokens_to_ids(target))
         
         return translated_text
 
-def install_model(model_name, output_dir):
-    if not _import_libs():
-        return False, "Required libraries (torch, ctranslate2, transformers) are not installed. Model conversion requires torch."
+    def translate_many(self, texts, source_lang=None, target_lang=None, model_name=None, profile="balanced"):
+        if not _import_libs():
+            raise RuntimeError("CTranslate2 libraries not installed.")
 
-    logger.info(f"Installing model {model_name} to {output_dir}...")
-    
+        model_name = self._resolve_request(source_lang, target_lang, model_name)
+        if self.is_pivot(model_name):
+            return [self._translate_pivot(text, model_name, profile) if text.strip() else "" for text in texts]
+        _, tokenizer = self.load_model_by_name(model_name)
+
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        sources = [tokenizer.convert_ids_to_tokens(tokenizer.encode(texts[i])) for i in indices]
+        translations = [""] * len(texts)
+        if sources:
+            for i, (target, _) in zip(indices, self.translate_tokens(model_name, profile, sources)):
+                translations[i] = tokenizer.decode(tokenizer.convert_tokens_to_ids(target))
+        return translations
+
+    def translate_stream(self, text, source_lang=None, target_lang=None, model_name=None, profile="fastest", target_prefix=None):
+        if not _import_libs():
+            raise RuntimeError("CTranslate2 libraries not installed.")
+
+        model_name = self._resolve_request(source_lang, target_lang, model_name)
+        if self.is_pivot(model_name):
+            yield self._translate_pivot(text, model_name, profile)
+            return
+        translator, tokenizer = self.load_model_by_name(model_name)
+
+        source = tokenizer.convert_ids_to_tokens(tokenizer.encode(text))
+        options = build_decoding_options(profile, len(source))
+        prefix = self._tokenize_target_prefix(tokenizer, target_prefix)
+        if prefix:
+            options["max_decoding_length"] = max(options["max_decoding_length"], len(prefix) + 1)
+
+        # generate_tokens only decodes greedily, so profiles that use beam search
+        # go through the batch scheduler and arrive in one piece.
+        if options["beam_size"] > 1 or not hasattr(translator, "generate_tokens"):
+            logger.debug(f"Streaming the full result at once (profile {profile}, beam {options['beam_size']})")
+            target, _ = self.translate_tokens(model_name, profile, [source], [prefix])[0]
+            yield tokenizer.decode(tokenizer.convert_tokens_to_ids(target))
+            return
+
+        tokens = list(prefix) if prefix else []
+        last_text = ""
+        for step in translator.generate_tokens(
+            source, target_prefix=prefix, max_decoding_length=options["max_decoding_length"],
+            use_vmap=model_name in self.vmap_models
+        ):
+            tokens.append(step.token)
+            partial = tokenizer.decode(tokenizer.convert_tokens_to_ids(tokens), skip_special_tokens=True)
+            if partial != last_text:
+                last_text = partial
+                yield partial
+
+def write_pivot_manifest(output_path, source, target, legs):
+    pivot_dir = Path(output_path) / pivot_model_dir_name(source, target)
+    pivot_dir.mkdir(parents=True, exist_ok=True)
+    with open(pivot_dir / PIVOT_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"source": source, "target": target, "pivot": PIVOT_LANGUAGE, "legs": legs}, f, indent=2)
+    touch_model_dir(output_path)
+    logger.info(f"Pivot model {source}-{PIVOT_LANGUAGE}-{target} installed at {pivot_dir}")
+    return pivot_dir
+
+def _write_install_report(model_name, model_source, target_dir, quantization):
+    report = {
+        "model": model_name,
+        "quantization": quantization,
+        "size_bytes": _directory_size(target_dir),
+        "checksum": file_checksum(Path(target_dir) / "model.bin"),
+        "installed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    if os.path.isdir(model_source):
+        report["checkpoint_bytes"] = sum(
+            f.stat().st_size for f in Path(model_source).iterdir() if f.suffix in (".bin", ".safetensors")
+        )
     try:
-        output_path = Path(output_dir)
-        if not output_path.exists():
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-        safe_name = model_name.replace("/", "_")
-        target_dir = output_path / safe_name
-        
-        model_source = model_name
-        try:
-            from huggingface_hub import snapshot_download
-            logger.info(f"Downloading {model_name} via huggingface_hub...")
-            import tempfile
-            
-            downloaded_path = snapshot_download(repo_id=model_name, allow_patterns=["*.bin", "*.json", "*.spm", "*.txt", "*.safetensors"])
-            if downloaded_path:
-                model_source = downloaded_path
-                logger.info(f"Model downloaded to {model_source}")
-        except ImportError:
-            logger.warning("huggingface_hub not installed or failed. Relying on default ctranslate2 download.")
-        except Exception as e:
-            logger.warning(f"huggingface_hub download failed: {e}. Trying default ctranslate2 download.")
+        start = time.perf_counter()
+        ctranslate2.Translator(str(target_dir), device="cpu", compute_type="default")
+        report["load_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    except Exception as e:
+        logger.warning(f"Could not measure load time of {model_name}: {e}")
 
-        try:
-            import sentencepiece
-        except ImportError:
-             return False, "Library 'sentencepiece' is missing. Please install it: pip install sentencepiece"
+    with open(Path(target_dir) / INSTALL_REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    checkpoint = f" (checkpoint {report['checkpoint_bytes'] / 1e6:.1f} MB)" if "checkpoint_bytes" in report else ""
+    load = f", loads in {report['load_ms']:.0f}ms without conversion" if "load_ms" in report else ""
+    logger.info(f"Installed {model_name}: {report['size_bytes'] / 1e6:.1f} MB on disk as {quantization}{checkpoint}{load}")
+    return report
 
-        import ctranslate2.converters
-        converter = ctranslate2.converters.TransformersConverter(model_source)
-        converter.convert(str(target_dir), force=True)
-        
-        if os.path.isdir(model_source):
-            logger.info("Copying tokenizer files to target directory...")
-            for f in os.listdir(model_source):
-                if f.endswith(('.json', '.txt', '.spm', '.model')) and not f.startswith('model'):
-                    source_f = os.path.join(model_source, f)
-                    target_f = os.path.join(str(target_dir), f)
-                    if not os.path.exists(target_f):
-                        shutil.copy2(source_f, target_f)
-            
-        logger.info(f"Model {model_name} installed successfully.")
-        return True, str(target_dir)
+def prepare_vocabulary_map(model_dir, compute_type="default"):
+    model_dir = Path(model_dir)
+    try:
+        translator = ctranslate2.Translator(str(model_dir), device="cpu", compute_type=compute_type)
+        build_vmap(model_dir, translator)
+        # The vocabulary map is read when the model loads, so reload in place
+        # to benchmark with the map that was just written.
+        translator.unload_model()
+        translator.load_model()
+        tokenizer = transformers.AutoTokenizer.from_pretrained(str(model_dir), local_files_only=True)
+        batch = [tokenizer.convert_ids_to_tokens(tokenizer.encode(s)) for s in COMPUTE_TYPE_PROBE_SENTENCES]
+        report = benchmark_vmap(translator, batch)
+        report["measured_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        write_vmap_report(model_dir, report)
+        logger.info(
+            f"Vocabulary map for {model_dir.name}: {report['tokens_per_second']:.0f} -> {report['tokens_per_second_vmap']:.0f} tokens/s "
+            f"({report['speedup']:.2f}x), agreement {report['agreement']:.2f}, {'enabled' if report['enabled'] else 'disabled'}"
+        )
+        return report
     except Exception as e:
-        error_msg = str(e)
-        if "Repository Not Found" in error_msg or "401 Client Error" in error_msg or "valid model identifier" in error_msg:
-             return False, f"Model '{model_name}' does not exist on Hugging Face. Many direct language pairs are not available. Please try using the LibreTranslate engine (requires Docker) or use English as a main language."
-        
-        logger.error(f"Failed to install model {model_name}: {error_msg}")
-        return False, f"Installation failed: {error_msg}"
+        logger.warning(f"Could not prepare vocabulary map for {model_dir.name}: {e}")
+        (model_dir / VMAP_FILE).unlink(missing_ok=True)
+        return None
+
+def convert_model(model_name, model_source, target_dir, quantization=DEFAULT_INSTALL_QUANTIZATION):
+    if not _import_conversion_libs():
+        raise RuntimeError("Required libraries (torch, ctranslate2, transformers) are not installed. Model conversion requires torch.")
+    try:
+        import sentencepiece
+    except ImportError:
+        raise RuntimeError("Library 'sentencepiece' is missing. Please install it: pip install sentencepiece")
+
+    quantization = conversion_quantization(quantization)
+    logger.info(f"Converting {model_name} with {quantization} quantization...")
+    converter = ctranslate2.converters.TransformersConverter(str(model_source))
+    converter.convert(str(target_dir), quantization=quantization, force=True)
+    
+    if os.path.isdir(model_source):
+        logger.info("Copying tokenizer files to target directory...")
+        for f in TOKENIZER_FILES:
+            source_f = os.path.join(model_source, f)
+            target_f = os.path.join(str(target_dir), f)
+            if os.path.exists(source_f) and not os.path.exists(target_f):
+                shutil.copy2(source_f, target_f)
+    
+    prepare_vocabulary_map(target_dir, quantization)
+    _write_install_report(model_name, model_source, target_dir, quantization)
+    touch_model_dir(Path(target_dir).parent)
+    return target_dir
 
 _instance = None
 
-def get_translator(model_dir="models", device="cpu", compute_type="int8"):
+def get_translator(model_dir="models", device=None, compute_type=None):
     global _instance
     if _instance is None:
-        _instance = CTranslate2Wrapper(model_dir, device, compute_type)
+        _instance = CTranslate2Wrapper(model_dir, device or "cpu", compute_type or "auto")
     else:
         if str(_instance.model_dir) != str(model_dir):
-             _instance.model_dir = Path(model_dir)
-        _instance.device = device
-        _instance.compute_type = compute_type
+             _instance.set_model_dir(model_dir)
+        if device:
+            _instance.device = device
+        if compute_type:
+            _instance.compute_type = compute_type
         
     return _instance
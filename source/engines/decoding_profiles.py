@@ -0,0 +1,81 @@
+import threading
+import logging
+
+logger = logging.getLogger("DecodingProfiles")
+
+DECODING_PROFILES = {
+    "fastest": {
+        "beam_size": 1,
+        "patience": 1,
+        "length_ratio": 1.5,
+        "length_extra": 10,
+        "return_scores": False,
+        "cost_factor": 1.0,
+    },
+    "balanced": {
+        "beam_size": 2,
+        "patience": 1,
+        "length_ratio": 2.0,
+        "length_extra": 16,
+        "return_scores": False,
+        "cost_factor": 1.8,
+    },
+    "quality": {
+        "beam_size": 4,
+        # patience > 1 keeps searching for more finished hypotheses, which
+        # would make this profile slower than its cost_factor promises.
+        "patience": 1,
+        "length_ratio": 3.0,
+        "length_extra": 32,
+        "return_scores": True,
+        "cost_factor": 4.0,
+    },
+}
+
+PROFILE_ORDER = ["quality", "balanced", "fastest"]
+
+MAX_DECODING_LENGTH = 512
+
+def build_decoding_options(profile, input_length):
+    settings = DECODING_PROFILES.get(profile) or DECODING_PROFILES["balanced"]
+    max_length = int(input_length * settings["length_ratio"]) + settings["length_extra"]
+    return {
+        "beam_size": settings["beam_size"],
+        "patience": settings["patience"],
+        "max_decoding_length": max(1, min(MAX_DECODING_LENGTH, max_length)),
+        "return_scores": settings["return_scores"],
+    }
+
+class DecodingProfileSelector:
+    def __init__(self, target_latency_ms=150, overhead_ms=5.0, base_ms_per_word=4.0, smoothing=0.2):
+        self.target_latency_ms = target_latency_ms
+        self.overhead_ms = overhead_ms
+        self.base_ms_per_word = base_ms_per_word
+        self.smoothing = smoothing
+        self.observations = 0
+        self.lock = threading.Lock()
+
+    def estimate(self, profile, word_count):
+        factor = DECODING_PROFILES[profile]["cost_factor"]
+        with self.lock:
+            return self.overhead_ms + self.base_ms_per_word * factor * max(word_count, 1)
+
+    def select(self, word_count, target_latency_ms=None):
+        target = target_latency_ms if target_latency_ms is not None else self.target_latency_ms
+        for profile in PROFILE_ORDER:
+            if self.estimate(profile, word_count) <= target:
+                return profile
+        return PROFILE_ORDER[-1]
+
+    def observe(self, profile, word_count, elapsed_ms):
+        if profile not in DECODING_PROFILES or word_count <= 0:
+            return
+        factor = DECODING_PROFILES[profile]["cost_factor"]
+        sample = max(elapsed_ms - self.overhead_ms, 0.0) / (factor * word_count)
+        with self.lock:
+            if self.observations == 0:
+                self.base_ms_per_word = sample
+            else:
+                self.base_ms_per_word += self.smoothing * (sample - self.base_ms_per_word)
+            self.observations += 1
+        logger.debug(f"Observed {profile} translation: {elapsed_ms:.0f}ms for {word_count} words (base {self.base_ms_per_word:.2f}ms/word)")
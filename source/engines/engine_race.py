@@ -0,0 +1,146 @@
+import json
+import time
+import logging
+import threading
+import statistics
+from collections import Counter, deque
+from pathlib import Path
+
+logger = logging.getLogger("EngineRace")
+
+STATS_FILE = "engine_race_stats.json"
+RECENT_RACES = 50
+LATENCY_WINDOW = 100
+SETTLE_MIN_RACES = 20
+SETTLE_WIN_RATE = 0.9
+RERACE_EVERY = 10
+STATS_LOG_INTERVAL = 25
+SAVE_INTERVAL_S = 30
+
+class EngineRaceStats:
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.lock = threading.Lock()
+        self.engines = {}
+        self.recent_winners = deque(maxlen=RECENT_RACES)
+        self.races = 0
+        self.choices = 0
+        self.dirty = False
+        self.last_save = time.monotonic()
+        self._load()
+
+    def _engine(self, name):
+        return self.engines.setdefault(name, {"races": 0, "wins": 0, "failures": 0, "latencies": deque(maxlen=LATENCY_WINDOW)})
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for name, entry in data.get("engines", {}).items():
+                engine = self._engine(name)
+                engine.update({key: entry.get(key, 0) for key in ("races", "wins", "failures")})
+                engine["latencies"].extend(entry.get("latencies", []))
+            self.recent_winners.extend(data.get("recent_winners", []))
+            self.races = data.get("races", 0)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not read engine race stats {self.path}: {e}")
+
+    def _save(self):
+        self.dirty = False
+        self.last_save = time.monotonic()
+        if not self.path:
+            return
+        data = {
+            "races": self.races,
+            "recent_winners": list(self.recent_winners),
+            "engines": {name: dict(engine, latencies=list(engine["latencies"])) for name, engine in self.engines.items()},
+        }
+        try:
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write engine race stats {self.path}: {e}")
+
+    def _settled(self):
+        if len(self.recent_winners) < SETTLE_MIN_RACES:
+            return None
+        name, wins = Counter(self.recent_winners).most_common(1)[0]
+        return name if wins / len(self.recent_winners) >= SETTLE_WIN_RATE else None
+
+    def settled_engine(self):
+        with self.lock:
+            return self._settled()
+
+    def choose(self, available):
+        with self.lock:
+            self.choices += 1
+            settled = self._settled()
+            # Every few requests race anyway, so a change in which engine is
+            # faster (a busy server, a model that got evicted) is noticed.
+            if len(available) < 2 or settled not in available or self.choices % RERACE_EVERY == 0:
+                return list(available)
+            return [settled]
+
+    def record_result(self, name, elapsed_ms=None):
+        with self.lock:
+            engine = self._engine(name)
+            if elapsed_ms is None:
+                engine["failures"] += 1
+            else:
+                engine["latencies"].append(round(elapsed_ms, 1))
+            self.dirty = True
+
+    def record_race(self, entrants, winner):
+        with self.lock:
+            self.races += 1
+            for name in entrants:
+                self._engine(name)["races"] += 1
+            if winner:
+                self._engine(winner)["wins"] += 1
+                self.recent_winners.append(winner)
+            # Rewritten at most every SAVE_INTERVAL_S; flush() writes the rest on exit.
+            self.dirty = True
+            if time.monotonic() - self.last_save >= SAVE_INTERVAL_S:
+                self._save()
+            log_now = self.races % STATS_LOG_INTERVAL == 0
+        if log_now:
+            self.log_summary()
+
+    def flush(self):
+        with self.lock:
+            if self.dirty:
+                self._save()
+
+    def stats(self):
+        with self.lock:
+            recent = Counter(self.recent_winners)
+            return {
+                "races": self.races,
+                "settled": self._settled(),
+                "engines": {
+                    name: {
+                        "races": engine["races"],
+                        "wins": engine["wins"],
+                        "failures": engine["failures"],
+                        "recent_win_rate": recent[name] / len(self.recent_winners) if self.recent_winners else None,
+                        "p50_ms": statistics.median(engine["latencies"]) if engine["latencies"] else None,
+                    }
+                    for name, engine in self.engines.items()
+                },
+            }
+
+    def log_summary(self):
+        stats = self.stats()
+        parts = []
+        for name, engine in stats["engines"].items():
+            win_rate = f"{engine['recent_win_rate']:.0%}" if engine["recent_win_rate"] is not None else "n/a"
+            p50 = f"{engine['p50_ms']:.0f}ms" if engine["p50_ms"] is not None else "n/a"
+            parts.append(f"{name} wins {win_rate} of recent races, p50 {p50}, {engine['failures']} failures")
+        settled = f"settled on {stats['settled']}" if stats["settled"] else "still racing"
+        logger.info(f"Engine race after {stats['races']} races ({settled}): {'; '.join(parts)}")
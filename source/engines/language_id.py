@@ -0,0 +1,74 @@
+import re
+import time
+import logging
+
+logger = logging.getLogger("LanguageID")
+
+STOPWORDS = {
+    "en": "the and is are was to of in that it you i this for with not have be on what we they do can will my your".split(),
+    "pl": "i w nie to się na jest że z do jak co tak ale o za czy już po mi jestem może być tylko ja ty on".split(),
+    "de": "der die das und ist nicht ich du wir sie es ein eine zu mit auf für den dem ich bin haben sind was wie auch".split(),
+    "es": "el la los las y es que de en un una no por para con se lo me mi su muy pero como está estoy qué".split(),
+    "it": "il lo la gli le e è che di in un una non per con si mi sono ma come anche questo cosa del della".split(),
+    "ru": "и в не на я что он с это как а то все она так его но да ты к у же вы за бы по мне".split(),
+    "nl": "de het een en is niet ik je we ze van in op te dat wat zijn met voor maar ook er heb hebben".split(),
+    "cs": "a v je to se na že s z do jak co tak ale o za by jsem jsi není taky mi ty on ona".split(),
+    "pt": "o a os as e é que de em um uma não por para com se me meu mas como está estou você muito".split(),
+}
+STOPWORDS = {lang: frozenset(words) for lang, words in STOPWORDS.items()}
+
+MARKER_CHARACTERS = {
+    "pl": "ąćęłńśźż",
+    "cs": "ěčřšůýž",
+    "de": "äöüß",
+    "es": "ñ¿¡",
+    "it": "àèìò",
+    "pt": "ãõçâê",
+    "nl": "ĳ",
+    "ru": "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+}
+MARKER_WEIGHT = 3
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+def score_languages(text, candidates):
+    lowered = text.lower()
+    words = WORD_PATTERN.findall(lowered)
+    scores = {}
+    for lang in candidates:
+        stopwords = STOPWORDS.get(lang, frozenset())
+        markers = MARKER_CHARACTERS.get(lang, "")
+        score = sum(1 for word in words if word in stopwords)
+        if markers:
+            score += MARKER_WEIGHT * sum(1 for char in lowered if char in markers)
+        scores[lang] = score
+    return scores
+
+def detect_language(text, candidates):
+    scores = score_languages(text, candidates)
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if not ranked or ranked[0][1] == 0 or (len(ranked) > 1 and ranked[0][1] == ranked[1][1]):
+        return None, scores
+    return ranked[0][0], scores
+
+class ConversationRouter:
+    def __init__(self, language_a, language_b):
+        self.languages = (language_a, language_b)
+        self.last_source = None
+        self.routed = 0
+        self.undecided = 0
+
+    def route(self, text):
+        start = time.perf_counter()
+        source, scores = detect_language(text, self.languages)
+        reason = f"scores {scores}"
+        if source is None:
+            # Speakers usually take turns, so an undecided utterance most
+            # likely comes from the other side.
+            self.undecided += 1
+            source = self.languages[1] if self.last_source == self.languages[0] else self.languages[0]
+            reason = f"undecided ({scores}), assuming turn taking"
+        target = self.languages[1] if source == self.languages[0] else self.languages[0]
+        self.last_source = source
+        self.routed += 1
+        logger.debug(f"Routed {source}->{target} in {(time.perf_counter() - start) * 1e6:.0f}us ({reason})")
+        return source, target
@@ -0,0 +1,86 @@
+import time
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("LibreTranslateClient")
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+CONNECT_TIMEOUT_S = 3
+READ_TIMEOUT_S = 10
+WARM_INTERVAL_S = 15
+
+def base_url(url):
+    url = url.rstrip("/")
+    return url[:-len("/translate")] if url.endswith("/translate") else url
+
+class LibreTranslateError(Exception):
+    pass
+
+class LibreTranslateClient:
+    def __init__(self, url):
+        self.url = url
+        self.base_url = base_url(url)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        self.lock = threading.Lock()
+        self.last_used = 0.0
+        self.warming = False
+
+    def _mark_used(self):
+        with self.lock:
+            self.last_used = time.monotonic()
+
+    def post(self, path, payload, timeout=None):
+        response = self.session.post(
+            f"{self.base_url}{path}", json=payload, timeout=timeout or (CONNECT_TIMEOUT_S, READ_TIMEOUT_S)
+        )
+        self._mark_used()
+        return response
+
+    def translate(self, text, source, target, timeout=None):
+        response = self.post("/translate", {"q": text, "source": source, "target": target}, timeout)
+        if response.status_code != 200:
+            raise LibreTranslateError(f"HTTP {response.status_code} - {response.text[:200]}")
+        translated = response.json().get("translatedText", "")
+        if isinstance(text, list) and (not isinstance(translated, list) or len(translated) != len(text)):
+            raise LibreTranslateError(f"Expected {len(text)} translations in the batch response, got {translated!r:.200}")
+        return translated
+
+    def warm(self):
+        # Opens (or refreshes) a pooled connection so the TCP and TLS handshakes
+        # happen while the user is still speaking.
+        with self.lock:
+            if self.warming or time.monotonic() - self.last_used < WARM_INTERVAL_S:
+                return False
+            self.warming = True
+        try:
+            start = time.perf_counter()
+            self.session.get(f"{self.base_url}/languages", timeout=(CONNECT_TIMEOUT_S, READ_TIMEOUT_S))
+            self._mark_used()
+            logger.debug(f"Warmed connection to {self.base_url} in {(time.perf_counter() - start) * 1000:.0f}ms")
+            return True
+        except requests.RequestException as e:
+            logger.debug(f"Could not warm connection to {self.base_url}: {e}")
+            return False
+        finally:
+            with self.lock:
+                self.warming = False
+
+    def close(self):
+        self.session.close()
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_libretranslate_client(url):
+    with _clients_lock:
+        if url not in _clients:
+            _clients[url] = LibreTranslateClient(url)
+        return _clients[url]
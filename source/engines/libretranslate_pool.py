@@ -0,0 +1,278 @@
+import time
+import logging
+import threading
+import statistics
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+
+from engines.libretranslate_client import get_libretranslate_client, LibreTranslateError
+
+logger = logging.getLogger("LibreTranslatePool")
+
+PROBE_INTERVAL_S = 10
+LATENCY_WINDOW = 200
+MIN_HEDGE_SAMPLES = 10
+MIN_RANK_SAMPLES = 3
+DEFAULT_HEDGE_DELAY_MS = 300
+MIN_HEDGE_DELAY_MS = 20
+DEFAULT_HEDGE_PERCENTILE = 90
+UNHEALTHY_AFTER_FAILURES = 2
+STATS_LOG_INTERVAL = 50
+MIN_CHUNK_SEGMENTS = 2
+
+class PoolExhausted(Exception):
+    pass
+
+def _percentile(samples, percent):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+class Endpoint:
+    def __init__(self, url):
+        self.url = url
+        self.client = get_libretranslate_client(url)
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.healthy = True
+        self.failures = 0
+        self.requests = 0
+        self.wins = 0
+
+    def record(self, elapsed_ms=None):
+        if elapsed_ms is None:
+            self.failures += 1
+            if self.failures >= UNHEALTHY_AFTER_FAILURES and self.healthy:
+                logger.warning(f"LibreTranslate endpoint {self.url} marked unhealthy after {self.failures} failures")
+                self.healthy = False
+            return
+        self.latencies.append(elapsed_ms)
+        self.failures = 0
+        if not self.healthy:
+            logger.info(f"LibreTranslate endpoint {self.url} is healthy again")
+            self.healthy = True
+
+    def record_health(self, ok):
+        # For probes and batches, whose timing says nothing about a single request.
+        if ok:
+            self.failures = 0
+            if not self.healthy:
+                logger.info(f"LibreTranslate endpoint {self.url} answered its health probe again")
+                self.healthy = True
+        else:
+            self.record(None)
+
+    def expected_ms(self):
+        # Barely measured endpoints sort first so a single stalled request
+        # cannot bury an otherwise fast server.
+        if len(self.latencies) < MIN_RANK_SAMPLES:
+            return 0.0
+        return statistics.median(self.latencies)
+
+    def summary(self):
+        if not self.latencies:
+            return f"{self.url}: no samples, {'healthy' if self.healthy else 'unhealthy'}"
+        return (
+            f"{self.url}: p50 {_percentile(self.latencies, 50):.0f}ms p95 {_percentile(self.latencies, 95):.0f}ms, "
+            f"{self.wins}/{self.requests} wins, {'healthy' if self.healthy else 'unhealthy'}"
+        )
+
+class LibreTranslatePool:
+    def __init__(self, urls, hedge_percentile=DEFAULT_HEDGE_PERCENTILE, probe_interval_s=PROBE_INTERVAL_S):
+        self.endpoints = [Endpoint(url) for url in dict.fromkeys(urls)]
+        self.hedge_percentile = hedge_percentile
+        self.probe_interval_s = probe_interval_s
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max(4, 2 * len(self.endpoints)), thread_name_prefix="LibreTranslate")
+        self.stop_event = threading.Event()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        if len(self.endpoints) > 1:
+            threading.Thread(target=self._probe_loop, name="LibreTranslateProbe", daemon=True).start()
+
+    def _probe(self, endpoint):
+        try:
+            response = endpoint.client.session.get(f"{endpoint.client.base_url}/languages", timeout=(3, 5))
+            response.raise_for_status()
+            ok = True
+        except requests.RequestException as e:
+            logger.debug(f"Health probe of {endpoint.url} failed: {e}")
+            ok = False
+        with self.lock:
+            endpoint.record_health(ok)
+
+    def _probe_loop(self):
+        while not self.stop_event.is_set():
+            for endpoint in self.endpoints:
+                self._probe(endpoint)
+            self.stop_event.wait(self.probe_interval_s)
+
+    def ranked(self):
+        with self.lock:
+            healthy = [e for e in self.endpoints if e.healthy]
+            # With everything marked down, still try the endpoints rather than fail outright.
+            return sorted(healthy or self.endpoints, key=lambda e: e.expected_ms())
+
+    def hedge_delay_ms(self, endpoint):
+        with self.lock:
+            if len(endpoint.latencies) < MIN_HEDGE_SAMPLES:
+                return DEFAULT_HEDGE_DELAY_MS
+            return max(MIN_HEDGE_DELAY_MS, _percentile(endpoint.latencies, self.hedge_percentile))
+
+    def _call(self, endpoint, text, source, target, timeout):
+        start = time.perf_counter()
+        try:
+            result = endpoint.client.translate(text, source, target, timeout)
+        except (requests.RequestException, LibreTranslateError, ValueError):
+            with self.lock:
+                endpoint.record(None)
+            raise
+        with self.lock:
+            if isinstance(text, list):
+                endpoint.record_health(True)
+            else:
+                endpoint.record((time.perf_counter() - start) * 1000)
+        return result
+
+    def warm(self):
+        for endpoint in self.ranked()[:2]:
+            endpoint.client.warm()
+
+    def translate(self, text, source, target, timeout=None, hedge=True):
+        candidates = self.ranked()
+        primary = candidates[0]
+        futures = {self.executor.submit(self._call, primary, text, source, target, timeout): primary}
+        pending = set(futures)
+        hedged = False
+        errors = []
+        with self.lock:
+            self.requests += 1
+            primary.requests += 1
+
+        while pending:
+            wait_s = None
+            if hedge and not hedged and len(candidates) > 1:
+                wait_s = self.hedge_delay_ms(primary) / 1000
+            done, pending = wait(pending, timeout=wait_s, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"{futures[future].url}: {e}")
+                    continue
+                winner = futures[future]
+                with self.lock:
+                    winner.wins += 1
+                    if winner is not primary:
+                        self.hedge_wins += 1
+                self._log_stats()
+                return result
+
+            if not hedged and len(candidates) > 1 and (not done or not pending):
+                # The primary is slower than its usual tail latency, or it failed:
+                # race it against the next best endpoint.
+                hedged = True
+                backup = candidates[1]
+                with self.lock:
+                    self.hedges += 1
+                    backup.requests += 1
+                logger.debug(f"Hedging request to {backup.url} after {primary.url} {'failed' if done else 'was slow'}")
+                future = self.executor.submit(self._call, backup, text, source, target, timeout)
+                futures[future] = backup
+                pending.add(future)
+
+        raise PoolExhausted("; ".join(errors) or "No LibreTranslate endpoint answered")
+
+    def translate_segments(self, segments, source, target, timeout=None):
+        # Batches are only retried elsewhere on failure: racing a duplicate of a
+        # long batch would double the server work for little gain.
+        endpoints = self.ranked()
+        chunk_count = min(len(endpoints), len(segments) // MIN_CHUNK_SEGMENTS)
+        if chunk_count <= 1:
+            return self.translate(list(segments), source, target, timeout, hedge=False)
+
+        chunks = _balanced_chunks(segments, chunk_count)
+        futures = [
+            self.executor.submit(self._call, endpoint, chunk, source, target, timeout)
+            for endpoint, chunk in zip(endpoints, chunks)
+        ]
+        with self.lock:
+            self.requests += 1
+            for endpoint in endpoints[:len(chunks)]:
+                endpoint.requests += 1
+        results = []
+        for endpoint, chunk, future in zip(endpoints, chunks, futures):
+            try:
+                results.extend(future.result())
+                with self.lock:
+                    endpoint.wins += 1
+            except Exception as e:
+                logger.debug(f"Chunk of {len(chunk)} segments failed on {endpoint.url} ({e}), retrying on the pool")
+                results.extend(self.translate(chunk, source, target, timeout, hedge=False))
+        logger.debug(f"Translated {len(segments)} segments in {len(chunks)} parallel chunks")
+        self._log_stats()
+        return results
+
+    def _log_stats(self):
+        with self.lock:
+            if self.requests % STATS_LOG_INTERVAL:
+                return
+            lines = [endpoint.summary() for endpoint in self.endpoints]
+            hedges, hedge_wins, requests_count = self.hedges, self.hedge_wins, self.requests
+        logger.info(f"LibreTranslate pool after {requests_count} requests: {hedges} hedged, {hedge_wins} won by the hedge")
+        for line in lines:
+            logger.info(f"  {line}")
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "endpoints": {
+                    e.url: {
+                        "healthy": e.healthy,
+                        "requests": e.requests,
+                        "wins": e.wins,
+                        "p50_ms": _percentile(e.latencies, 50) if e.latencies else None,
+                        "p95_ms": _percentile(e.latencies, 95) if e.latencies else None,
+                    }
+                    for e in self.endpoints
+                },
+            }
+
+    def close(self):
+        self.stop_event.set()
+        self.executor.shutdown(wait=False)
+
+def _balanced_chunks(segments, count):
+    # Contiguous chunks of roughly equal character count, so the parallel
+    # requests finish at about the same time.
+    total = sum(len(segment) for segment in segments)
+    chunks, current, seen = [], [], 0
+    for index, segment in enumerate(segments):
+        current.append(segment)
+        seen += len(segment)
+        still_needed = count - len(chunks) - 1
+        if still_needed and (seen >= total * (len(chunks) + 1) / count or len(segments) - index - 1 == still_needed):
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_libretranslate_pool(urls):
+    global _instance
+    urls = tuple(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+    with _instance_lock:
+        if _instance is None or tuple(e.url for e in _instance.endpoints) != urls:
+            if _instance is not None:
+                _instance.close()
+            _instance = LibreTranslatePool(urls)
+            if len(urls) > 1:
+                logger.info(f"LibreTranslate pool with {len(urls)} endpoints: {', '.join(urls)}")
+        return _instance
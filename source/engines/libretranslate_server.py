@@ -0,0 +1,186 @@
+import json
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from engines import ctranslate2_engine, translation_process
+from core.constants import TARGET_LANGUAGES, DEFAULT_LOCAL_SERVER_PORT
+
+logger = logging.getLogger("LocalTranslationServer")
+
+MAX_REQUEST_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT_S = 30
+
+class _ServerError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "Voxlay"
+    timeout = KEEP_ALIVE_TIMEOUT_S
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_params(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            raise _ServerError(413, "Request too large")
+        raw = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type", "")
+        if "application/json" in content_type:
+            try:
+                params = json.loads(raw.decode("utf-8") or "{}")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise _ServerError(400, "Invalid JSON body")
+            if not isinstance(params, dict):
+                raise _ServerError(400, "Invalid JSON body")
+            return params
+        form = parse_qs(raw.decode("utf-8", errors="replace"))
+        params = {key: values[-1] for key, values in form.items()}
+        if len(form.get("q", [])) > 1:
+            params["q"] = form["q"]
+        return params
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/languages":
+            self._send_json(200, self.server.owner.languages())
+        else:
+            self._send_json(404, {"error": "Not Found"})
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        if path != "/translate":
+            self._send_json(404, {"error": "Not Found"})
+            return
+        try:
+            params = self._read_params()
+            translated = self.server.owner.translate(params.get("q"), params.get("source"), params.get("target"))
+            self._send_json(200, {"translatedText": translated})
+        except _ServerError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Translation request failed: {e}")
+            self._send_json(500, {"error": str(e)})
+
+class LocalTranslationServer:
+    def __init__(self, config, host="127.0.0.1", port=DEFAULT_LOCAL_SERVER_PORT):
+        self.config = config
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def is_running(self):
+        return self.httpd is not None
+
+    def _translator(self):
+        return translation_process.get_ctranslate2_translator(self.config)
+
+    def _profile(self):
+        profile = self.config.get("decoding_profile", "balanced")
+        return "balanced" if profile == "auto" else profile
+
+    def languages(self):
+        targets = {}
+        for name in self._translator().list_models():
+            src, tgt = ctranslate2_engine.parse_model_pair(name)
+            if src and tgt:
+                targets.setdefault(src, set()).add(tgt)
+                targets.setdefault(tgt, set())
+        return [
+            {"code": code, "name": TARGET_LANGUAGES.get(code, code), "targets": sorted(targets[code])}
+            for code in sorted(targets)
+        ]
+
+    def translate(self, q, source, target):
+        if q is None:
+            raise _ServerError(400, "Invalid request: missing q parameter")
+        if not source or not target:
+            raise _ServerError(400, "Invalid request: missing source or target parameter")
+        if source == "auto":
+            raise _ServerError(400, "Automatic language detection is not supported, please set source")
+        texts = q if isinstance(q, list) else [q]
+        if not all(isinstance(text, str) for text in texts):
+            raise _ServerError(400, "Invalid request: q must be a string or a list of strings")
+
+        translator = self._translator()
+        try:
+            model_name = translator.resolve_model_name(source, target)
+        except (RuntimeError, ctranslate2_engine.ModelNotAvailableError) as e:
+            raise _ServerError(400, str(e))
+
+        start = time.perf_counter()
+        translations = translator.translate_many(texts, model_name=model_name, profile=self._profile())
+        with self.lock:
+            self.requests += 1
+        logger.debug(f"Translated {len(texts)} text(s) with {model_name} in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return translations if isinstance(q, list) else translations[0]
+
+    def start(self):
+        if self.httpd is not None:
+            return True
+        try:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        except OSError as e:
+            logger.error(f"Could not start local translation server on {self.url}: {e}")
+            self.httpd = None
+            return False
+        self.httpd.daemon_threads = True
+        self.httpd.owner = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Local translation server listening on {self.url}")
+        return True
+
+    def stop(self):
+        if self.httpd is None:
+            return
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.httpd = None
+        self.thread = None
+        logger.info("Local translation server stopped")
+
+_instance = None
+
+def get_local_server(config, port=None):
+    global _instance
+    if _instance is None:
+        _instance = LocalTranslationServer(config, port=port or DEFAULT_LOCAL_SERVER_PORT)
+    elif port and port != _instance.port:
+        running = _instance.is_running()
+        _instance.stop()
+        _instance.port = port
+        if running:
+            _instance.start()
+    return _instance
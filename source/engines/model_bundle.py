@@ -0,0 +1,150 @@
+import os
+import io
+import json
+import time
+import shutil
+import hashlib
+import logging
+import tarfile
+from pathlib import Path, PurePosixPath
+
+from core.constants import APP_VERSION
+from engines.ctranslate2_engine import PIVOT_MANIFEST, INSTALL_REPORT_FILE, _directory_size
+
+logger = logging.getLogger("ModelBundle")
+
+BUNDLE_MANIFEST = "voxlay-bundle.json"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_SUFFIX = ".tar.gz"
+BUNDLE_COMPRESS_LEVEL = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+class BundleError(Exception):
+    pass
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _bundle_members(model_dir, model_name):
+    model_path = Path(model_dir) / model_name
+    names = [model_name]
+    if (model_path / PIVOT_MANIFEST).exists():
+        with open(model_path / PIVOT_MANIFEST, "r", encoding="utf-8") as f:
+            names = json.load(f)["legs"] + [model_name]
+    for name in names:
+        path = Path(model_dir) / name
+        if not path.is_dir() or not ((path / "model.bin").exists() or (path / PIVOT_MANIFEST).exists()):
+            raise BundleError(f"Model {name} is not installed in {model_dir}")
+    return names
+
+def export_model(model_dir, model_name, output_path):
+    start = time.perf_counter()
+    model_dir = Path(model_dir)
+    output_path = Path(output_path)
+    if output_path.is_dir():
+        output_path = output_path / f"{model_name}{BUNDLE_SUFFIX}"
+
+    models = []
+    for name in _bundle_members(model_dir, model_name):
+        files = {
+            f.relative_to(model_dir / name).as_posix(): _sha256(f)
+            for f in sorted((model_dir / name).rglob("*")) if f.is_file()
+        }
+        entry = {"name": name, "files": files, "size_bytes": _directory_size(model_dir / name)}
+        report_path = model_dir / name / INSTALL_REPORT_FILE
+        if report_path.exists():
+            with open(report_path, "r", encoding="utf-8") as f:
+                entry["quantization"] = json.load(f).get("quantization")
+        models.append(entry)
+
+    manifest = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "model": model_name,
+        "models": models,
+        "app_version": APP_VERSION,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tarfile.open(tmp_path, "w:gz", compresslevel=BUNDLE_COMPRESS_LEVEL) as tar:
+        data = json.dumps(manifest, indent=2).encode("utf-8")
+        info = tarfile.TarInfo(BUNDLE_MANIFEST)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+        for entry in models:
+            for relative in entry["files"]:
+                tar.add(model_dir / entry["name"] / relative, arcname=f"{entry['name']}/{relative}", recursive=False)
+    os.replace(tmp_path, output_path)
+    logger.info(
+        f"Exported {model_name} ({len(models)} model directories) to {output_path}: "
+        f"{output_path.stat().st_size / 1e6:.1f} MB in {time.perf_counter() - start:.1f}s"
+    )
+    return output_path
+
+def _safe_member_path(name):
+    path = PurePosixPath(name)
+    if path.is_absolute() or ".." in path.parts or len(path.parts) < 2:
+        raise BundleError(f"Unsafe path in bundle: {name}")
+    return path
+
+def import_bundle(bundle_path, model_dir, overwrite=False):
+    start = time.perf_counter()
+    model_dir = Path(model_dir)
+    model_dir.mkdir(parents=True, exist_ok=True)
+    staging = model_dir / f".import-{os.getpid()}-{int(time.time())}"
+    staging.mkdir()
+    try:
+        with tarfile.open(bundle_path, "r|gz") as tar:
+            member = tar.next()
+            if member is None or member.name != BUNDLE_MANIFEST:
+                raise BundleError(f"{bundle_path} is not a Voxlay model bundle")
+            manifest = json.load(tar.extractfile(member))
+            if manifest.get("format_version", 0) > BUNDLE_FORMAT_VERSION:
+                raise BundleError(f"Bundle format {manifest['format_version']} is newer than this version of Voxlay supports")
+            for entry in manifest["models"]:
+                if not entry["name"] or "/" in entry["name"] or "\\" in entry["name"] or entry["name"].startswith("."):
+                    raise BundleError(f"Invalid model name in bundle: {entry['name']}")
+            expected = {
+                f"{entry['name']}/{relative}": checksum
+                for entry in manifest["models"] for relative, checksum in entry["files"].items()
+            }
+
+            for member in tar:
+                if not member.isfile() or member.name == BUNDLE_MANIFEST:
+                    continue
+                path = _safe_member_path(member.name)
+                checksum = expected.pop(member.name, None)
+                if checksum is None:
+                    raise BundleError(f"Unexpected file in bundle: {member.name}")
+                target = staging.joinpath(*path.parts)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha256()
+                source = tar.extractfile(member)
+                with open(target, "wb") as f:
+                    for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+                if digest.hexdigest() != checksum:
+                    raise BundleError(f"Checksum mismatch for {member.name}")
+            if expected:
+                raise BundleError(f"Bundle is missing {len(expected)} files, e.g. {next(iter(expected))}")
+
+        installed = []
+        for entry in manifest["models"]:
+            destination = model_dir / entry["name"]
+            if destination.exists():
+                if not overwrite:
+                    logger.info(f"Model {entry['name']} already installed, keeping the existing copy")
+                    continue
+                shutil.rmtree(destination)
+            os.replace(staging / entry["name"], destination)
+            installed.append(entry["name"])
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    logger.info(f"Imported {manifest['model']} from {bundle_path} in {time.perf_counter() - start:.1f}s ({len(installed)} directories installed)")
+    return manifest["model"], installed
@@ -0,0 +1,134 @@
+import json
+import logging
+import threading
+import statistics
+from pathlib import Path
+
+from engines.model_registry import parse_model_pair
+
+logger = logging.getLogger("ModelCatalog")
+
+CATALOG_FILE = "model_catalog.json"
+CATALOG_PIVOT_LANGUAGE = "en"
+DEFAULT_LOAD_THROUGHPUT_MB_S = 400.0
+
+# Converted model size relative to the float32 checkpoint.
+QUANTIZATION_SIZE_RATIO = {
+    "int8": 0.26, "int8_float32": 0.26, "int8_float16": 0.26, "int8_bfloat16": 0.26,
+    "int16": 0.51, "float16": 0.51, "bfloat16": 0.51, "float32": 1.0,
+}
+
+# Helsinki-NLP checkpoints for the languages Voxlay offers, with the size of
+# the weights download in MB. Regenerate with utils/update_model_catalog.py.
+BUNDLED_MODELS = {
+    "Helsinki-NLP/opus-mt-cs-de": 297,
+    "Helsinki-NLP/opus-mt-cs-en": 300,
+    "Helsinki-NLP/opus-mt-de-cs": 297,
+    "Helsinki-NLP/opus-mt-de-en": 298,
+    "Helsinki-NLP/opus-mt-de-es": 298,
+    "Helsinki-NLP/opus-mt-de-it": 298,
+    "Helsinki-NLP/opus-mt-de-nl": 298,
+    "Helsinki-NLP/opus-mt-de-pl": 297,
+    "Helsinki-NLP/opus-mt-en-cs": 300,
+    "Helsinki-NLP/opus-mt-en-de": 298,
+    "Helsinki-NLP/opus-mt-en-es": 312,
+    "Helsinki-NLP/opus-mt-en-it": 291,
+    "Helsinki-NLP/opus-mt-en-nl": 316,
+    "Helsinki-NLP/opus-mt-en-pl": 301,
+    "Helsinki-NLP/opus-mt-en-ru": 307,
+    "Helsinki-NLP/opus-mt-es-de": 298,
+    "Helsinki-NLP/opus-mt-es-en": 312,
+    "Helsinki-NLP/opus-mt-es-it": 296,
+    "Helsinki-NLP/opus-mt-es-nl": 297,
+    "Helsinki-NLP/opus-mt-es-pl": 296,
+    "Helsinki-NLP/opus-mt-es-ru": 305,
+    "Helsinki-NLP/opus-mt-it-de": 298,
+    "Helsinki-NLP/opus-mt-it-en": 291,
+    "Helsinki-NLP/opus-mt-it-es": 296,
+    "Helsinki-NLP/opus-mt-nl-en": 316,
+    "Helsinki-NLP/opus-mt-nl-es": 297,
+    "Helsinki-NLP/opus-mt-pl-de": 297,
+    "Helsinki-NLP/opus-mt-pl-en": 301,
+    "Helsinki-NLP/opus-mt-pl-es": 296,
+    "Helsinki-NLP/opus-mt-ru-en": 307,
+    "Helsinki-NLP/opus-mt-ru-es": 305,
+}
+
+class ModelCatalog:
+    def __init__(self, models, source="bundled"):
+        self.models = dict(models)
+        self.source = source
+        self.pairs = {}
+        for repo_id in sorted(self.models):
+            src, tgt = parse_model_pair(repo_id)
+            if src and tgt:
+                self.pairs.setdefault((src, tgt), repo_id)
+
+    def direct(self, source, target):
+        return self.pairs.get((source, target))
+
+    def route(self, source, target):
+        direct = self.direct(source, target)
+        if direct:
+            return [direct]
+        if CATALOG_PIVOT_LANGUAGE in (source, target):
+            return None
+        legs = [self.direct(source, CATALOG_PIVOT_LANGUAGE), self.direct(CATALOG_PIVOT_LANGUAGE, target)]
+        return legs if all(legs) else None
+
+    def targets_for(self, source):
+        targets = {tgt for src, tgt in self.pairs if src == source}
+        if self.direct(source, CATALOG_PIVOT_LANGUAGE):
+            targets |= {tgt for src, tgt in self.pairs if src == CATALOG_PIVOT_LANGUAGE}
+        targets.discard(source)
+        return targets
+
+    def sources(self):
+        return {src for src, _ in self.pairs}
+
+    def download_mb(self, repo_ids):
+        return sum(self.models.get(repo_id, 0) for repo_id in repo_ids)
+
+    def estimate(self, repo_ids, quantization="int8", installed=()):
+        download_mb = self.download_mb(repo_ids)
+        installed_mb = download_mb * QUANTIZATION_SIZE_RATIO.get(quantization, 1.0)
+        # Calibrate on models that were measured at install time on this machine.
+        samples = [
+            entry["size_bytes"] / 1e6 / (entry["load_ms"] / 1000)
+            for entry in installed if entry.get("load_ms") and entry.get("size_bytes")
+        ]
+        throughput = statistics.median(samples) if samples else DEFAULT_LOAD_THROUGHPUT_MB_S
+        return {
+            "download_mb": download_mb,
+            "installed_mb": round(installed_mb),
+            "load_ms": round(installed_mb / throughput * 1000),
+            "calibrated": bool(samples),
+        }
+
+def load_catalog(config_dir=None):
+    if config_dir:
+        path = Path(config_dir) / CATALOG_FILE
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            logger.info(f"Using model catalog from {path} ({len(data['models'])} models, updated {data.get('updated_at', 'unknown')})")
+            return ModelCatalog(data["models"], source=str(path))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring invalid model catalog {path}: {e}")
+    return ModelCatalog(BUNDLED_MODELS)
+
+_instance = None
+_config_dir = None
+_lock = threading.Lock()
+
+def get_catalog(config_dir=None, reload=False):
+    global _instance, _config_dir
+    with _lock:
+        if config_dir and str(config_dir) != _config_dir:
+            _config_dir = str(config_dir)
+            reload = True
+        if _instance is None or reload:
+            _instance = load_catalog(_config_dir)
+        return _instance
@@ -0,0 +1,287 @@
+import os
+import time
+import shutil
+import hashlib
+import logging
+import threading
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from engines.ctranslate2_engine import (
+    ModelNotAvailableError, PIVOT_LANGUAGE, DEFAULT_INSTALL_QUANTIZATION,
+    parse_model_pair, write_pivot_manifest
+)
+from engines.model_catalog import get_catalog
+
+logger = logging.getLogger("ModelDownloader")
+
+DEFAULT_HUB_ENDPOINT = "https://huggingface.co"
+DOWNLOADS_DIR = ".downloads"
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_ATTEMPTS = 3
+CHUNK_SIZE = 1024 * 1024
+REQUEST_TIMEOUT_S = 30
+PROGRESS_INTERVAL_S = 0.1
+CONVERSION_POLL_S = 0.2
+REPO_LOCK_POLL_S = 0.2
+
+# Pivot installs can share a leg; one repository is only ever downloaded and
+# converted by one install at a time.
+_repo_locks = {}
+_repo_locks_lock = threading.Lock()
+
+class DownloadCancelled(Exception):
+    pass
+
+class ChecksumMismatch(Exception):
+    pass
+
+def hub_endpoint(configured=None):
+    return (configured or os.environ.get("HF_ENDPOINT") or DEFAULT_HUB_ENDPOINT).rstrip("/")
+
+def list_repo_files(repo_id, endpoint, session, revision="main"):
+    url = f"{endpoint}/api/models/{repo_id}/tree/{revision}"
+    response = session.get(url, params={"recursive": "true"}, timeout=REQUEST_TIMEOUT_S)
+    if response.status_code in (401, 404):
+        raise ModelNotAvailableError(f"Model '{repo_id}' does not exist on Hugging Face. Please try using the LibreTranslate engine (requires Docker) or use English as a main language.")
+    response.raise_for_status()
+    files = []
+    for entry in response.json():
+        if entry.get("type") != "file":
+            continue
+        lfs = entry.get("lfs") or {}
+        files.append({
+            "path": entry["path"],
+            "size": lfs.get("size", entry.get("size", 0)),
+            "sha256": lfs.get("oid"),
+            "git_sha1": None if lfs else entry.get("oid"),
+        })
+    return files
+
+def select_runtime_files(files):
+    names = {f["path"] for f in files}
+    if any(name.endswith(".safetensors") for name in names):
+        weights = lambda name: name.endswith(".safetensors")
+    else:
+        weights = lambda name: name == "pytorch_model.bin"
+    return [f for f in files if "/" not in f["path"] and (weights(f["path"]) or f["path"].endswith((".json", ".spm")))]
+
+def _verify(path, entry):
+    if entry["sha256"]:
+        digest = hashlib.sha256()
+    elif entry["git_sha1"]:
+        digest = hashlib.sha1()
+        digest.update(f"blob {path.stat().st_size}\0".encode("ascii"))
+    else:
+        return True
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest() == (entry["sha256"] or entry["git_sha1"])
+
+class RepoDownload:
+    def __init__(self, repo_id, dest_dir, endpoint=None, revision="main", workers=DOWNLOAD_WORKERS,
+                 progress_callback=None, cancel_event=None):
+        self.repo_id = repo_id
+        self.dest_dir = Path(dest_dir)
+        self.endpoint = hub_endpoint(endpoint)
+        self.revision = revision
+        self.workers = workers
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.abort_event = threading.Event()
+        self.session = requests.Session()
+        self.lock = threading.Lock()
+        self.done_bytes = 0
+        self.total_bytes = 0
+        self.last_report = 0.0
+
+    def _advance(self, count, force=False):
+        with self.lock:
+            self.done_bytes += count
+            now = time.monotonic()
+            if not force and now - self.last_report < PROGRESS_INTERVAL_S:
+                return
+            self.last_report = now
+            done, total = self.done_bytes, self.total_bytes
+        if self.progress_callback:
+            self.progress_callback(done, total)
+
+    def _download(self, url, entry, part_path, offset):
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self.session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT_S) as response:
+            if response.status_code == 416:
+                # The partial file no longer matches what the hub serves.
+                part_path.unlink()
+            response.raise_for_status()
+            if offset and response.status_code != 206:
+                offset = 0
+            if offset:
+                logger.info(f"Resuming {entry['path']} at {offset / 1e6:.1f} MB")
+            self._advance(offset)
+            with open(part_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if self.cancel_event.is_set():
+                        raise DownloadCancelled(f"Download of {self.repo_id} cancelled")
+                    if self.abort_event.is_set():
+                        return
+                    f.write(chunk)
+                    self._advance(len(chunk))
+
+    def _fetch(self, entry):
+        final_path = self.dest_dir / entry["path"]
+        part_path = final_path.with_name(final_path.name + ".part")
+        if final_path.exists() and final_path.stat().st_size == entry["size"] and _verify(final_path, entry):
+            self._advance(entry["size"])
+            return
+
+        url = f"{self.endpoint}/{self.repo_id}/resolve/{self.revision}/{entry['path']}"
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if offset > entry["size"]:
+                part_path.unlink()
+                offset = 0
+            try:
+                if offset and offset == entry["size"]:
+                    # Interrupted after the last byte but before the rename; the
+                    # hub answers 416 to a range that starts at the end of the file.
+                    self._advance(offset)
+                else:
+                    self._download(url, entry, part_path, offset)
+                    if self.abort_event.is_set():
+                        return
+                if not _verify(part_path, entry):
+                    self._advance(-part_path.stat().st_size)
+                    part_path.unlink()
+                    raise ChecksumMismatch(f"Checksum mismatch for {entry['path']}")
+                os.replace(part_path, final_path)
+                return
+            except (requests.RequestException, ChecksumMismatch) as e:
+                received = part_path.stat().st_size if part_path.exists() else 0
+                self._advance(-received)
+                if attempt == DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning(f"Download of {entry['path']} failed ({e}), retrying ({attempt}/{DOWNLOAD_ATTEMPTS})")
+                time.sleep(attempt)
+
+    def run(self):
+        files = select_runtime_files(list_repo_files(self.repo_id, self.endpoint, self.session, self.revision))
+        self.dest_dir.mkdir(parents=True, exist_ok=True)
+        self.total_bytes = sum(f["size"] for f in files)
+        logger.info(f"Downloading {len(files)} files ({self.total_bytes / 1e6:.1f} MB) of {self.repo_id} from {self.endpoint}")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._fetch, entry) for entry in files]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                self.abort_event.set()
+                raise
+        self._advance(0, force=True)
+        logger.info(f"Downloaded {self.repo_id} in {time.perf_counter() - start:.1f}s")
+        return self.dest_dir
+
+def _convert_main(conn, model_name, source_dir, target_dir, quantization):
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
+    from engines import ctranslate2_engine
+    try:
+        ctranslate2_engine.convert_model(model_name, source_dir, target_dir, quantization)
+        conn.send((True, str(target_dir)))
+    except Exception as e:
+        conn.send((False, str(e)))
+
+def convert_in_subprocess(model_name, source_dir, target_dir, quantization, cancel_event=None):
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_convert_main, args=(child_conn, model_name, str(source_dir), str(target_dir), quantization),
+        name="VoxlayConverter", daemon=True
+    )
+    process.start()
+    child_conn.close()
+    try:
+        while not parent_conn.poll(CONVERSION_POLL_S):
+            if cancel_event is not None and cancel_event.is_set():
+                process.terminate()
+                raise DownloadCancelled(f"Conversion of {model_name} cancelled")
+            if not process.is_alive():
+                return False, f"Conversion process exited with code {process.exitcode}"
+        return parent_conn.recv()
+    except EOFError:
+        return False, f"Conversion process exited with code {process.exitcode}"
+    finally:
+        process.join(timeout=5)
+
+def _repo_lock(repo_id):
+    with _repo_locks_lock:
+        return _repo_locks.setdefault(repo_id, threading.Lock())
+
+def _install_repo(repo_id, output_dir, quantization, endpoint, progress, status, cancel_event):
+    safe_name = repo_id.replace("/", "_")
+    download_dir = Path(output_dir) / DOWNLOADS_DIR / safe_name
+    target_dir = Path(output_dir) / safe_name
+
+    lock = _repo_lock(repo_id)
+    if not lock.acquire(blocking=False):
+        if status:
+            status(f"Waiting for another install of {repo_id}...")
+        while not lock.acquire(timeout=REPO_LOCK_POLL_S):
+            if cancel_event is not None and cancel_event.is_set():
+                raise DownloadCancelled(f"Install of {repo_id} cancelled")
+    try:
+        if (target_dir / "model.bin").exists():
+            logger.info(f"{repo_id} is already installed at {target_dir}")
+            return True, str(target_dir)
+
+        if status:
+            status(f"Downloading {repo_id}...")
+        RepoDownload(repo_id, download_dir, endpoint, progress_callback=progress, cancel_event=cancel_event).run()
+
+        if status:
+            status(f"Converting {repo_id}...")
+        success, result = convert_in_subprocess(repo_id, download_dir, target_dir, quantization, cancel_event)
+        if success:
+            shutil.rmtree(download_dir, ignore_errors=True)
+        return success, result
+    finally:
+        lock.release()
+
+def install_model_from_hub(model_name, output_dir, quantization=DEFAULT_INSTALL_QUANTIZATION, endpoint=None,
+                           progress=None, status=None, cancel_event=None):
+    src, tgt = parse_model_pair(model_name)
+    route = get_catalog().route(src, tgt) if src and tgt else None
+    try:
+        if route is None or len(route) == 1:
+            try:
+                return _install_repo(route[0] if route else model_name, output_dir, quantization, endpoint, progress, status, cancel_event)
+            except ModelNotAvailableError as e:
+                if not src or not tgt or PIVOT_LANGUAGE in (src, tgt):
+                    return False, str(e)
+                logger.info(f"No direct model for {src}-{tgt}, trying pivot route through {PIVOT_LANGUAGE}")
+            route = [f"Helsinki-NLP/opus-mt-{src}-{PIVOT_LANGUAGE}", f"Helsinki-NLP/opus-mt-{PIVOT_LANGUAGE}-{tgt}"]
+        else:
+            logger.info(f"Catalog lists no direct model for {src}-{tgt}, installing pivot route {' + '.join(route)}")
+
+        legs = []
+        for leg in route:
+            leg_dir = Path(output_dir) / leg.replace("/", "_")
+            if not (leg_dir / "model.bin").exists():
+                try:
+                    success, result = _install_repo(leg, output_dir, quantization, endpoint, progress, status, cancel_event)
+                except ModelNotAvailableError as e:
+                    success, result = False, str(e)
+                if not success:
+                    return False, f"No direct model and no pivot route for {src}-{tgt} via {PIVOT_LANGUAGE}: {result}"
+            legs.append(leg_dir.name)
+        return True, str(write_pivot_manifest(output_dir, src, tgt, legs))
+    except DownloadCancelled as e:
+        logger.info(str(e))
+        return False, "Cancelled"
+    except Exception as e:
+        logger.error(f"Failed to install model {model_name}: {e}")
+        return False, f"Installation failed: {e}"
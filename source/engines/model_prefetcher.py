@@ -0,0 +1,158 @@
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger("ModelPrefetcher")
+
+HISTORY_FILE = "model_switch_history.json"
+MIN_PREDICTION_PROBABILITY = 0.3
+MIN_FREE_MEMORY_MB = 512
+FALLBACK_MODEL_MB = 300
+
+def available_memory_mb():
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+class PairSwitchHistory:
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.lock = threading.Lock()
+        self.transitions = {}
+        self.last_model = None
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.transitions = data.get("transitions", {})
+            self.last_model = data.get("last_model")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read model switch history {self.path}: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"last_model": self.last_model, "transitions": self.transitions}, f, indent=2)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write model switch history {self.path}: {e}")
+
+    def record(self, model_name):
+        with self.lock:
+            if model_name == self.last_model:
+                return False
+            if self.last_model:
+                counts = self.transitions.setdefault(self.last_model, {})
+                counts[model_name] = counts.get(model_name, 0) + 1
+                logger.debug(f"Pair switch {self.last_model} -> {model_name} (seen {counts[model_name]}x)")
+            self.last_model = model_name
+            self._save()
+            return True
+
+    def predict(self, current):
+        with self.lock:
+            counts = self.transitions.get(current, {})
+            total = sum(counts.values())
+            if not total:
+                return []
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            return [(name, count / total) for name, count in ranked if count / total >= MIN_PREDICTION_PROBABILITY]
+
+class ModelPrefetcher:
+    def __init__(self, history):
+        self.history = history
+        self.lock = threading.Lock()
+        self.running = False
+        self.prefetched = set()
+        self.stats = {"prefetched": 0, "hits": 0, "skipped_budget": 0, "cancelled_pressure": 0}
+
+    def _model_mb(self, translator, model_name):
+        names = translator.get_pivot_legs(model_name) if translator.is_pivot(model_name) else [model_name]
+        total = 0
+        for name in names:
+            entry = translator.get_model_info(name)
+            total += entry["size_bytes"] / 1e6 if entry and entry.get("size_bytes") else FALLBACK_MODEL_MB
+        return total
+
+    def _fits(self, translator, model_name, budget_mb):
+        needed = self._model_mb(translator, model_name)
+        resident = sum(self._model_mb(translator, name) for name in translator.loaded_models())
+        if budget_mb and resident + needed > budget_mb:
+            logger.info(f"Not prefetching {model_name}: {resident:.0f} + {needed:.0f} MB exceeds the {budget_mb} MB model budget")
+            self.stats["skipped_budget"] += 1
+            return False
+        available = available_memory_mb()
+        if available is not None and available - needed < MIN_FREE_MEMORY_MB:
+            logger.info(f"Not prefetching {model_name}: only {available:.0f} MB of memory available")
+            self.stats["cancelled_pressure"] += 1
+            return False
+        return True
+
+    def record_use(self, model_name):
+        with self.lock:
+            if model_name in self.prefetched:
+                self.prefetched.discard(model_name)
+                self.stats["hits"] += 1
+                logger.info(f"Prefetch hit for {model_name} ({self.stats['hits']} of {self.stats['prefetched']} prefetches used)")
+        self.history.record(model_name)
+
+    def prefetch(self, translator, current_models, budget_mb):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+        try:
+            self._prefetch(translator, current_models, budget_mb)
+        except Exception as e:
+            logger.warning(f"Prefetch failed: {e}")
+        finally:
+            with self.lock:
+                self.running = False
+
+    def _prefetch(self, translator, current_models, budget_mb):
+        # The models the next utterance will use come first; they may have
+        # just been selected in settings and never loaded.
+        token = translator.reserve_capacity(sum(2 if translator.is_pivot(name) else 1 for name in current_models))
+        try:
+            for model_name in current_models:
+                if not translator.is_loaded(model_name):
+                    start = time.perf_counter()
+                    translator.ensure_loaded(model_name)
+                    logger.info(f"Loaded {model_name} while capturing in {(time.perf_counter() - start) * 1000:.0f}ms")
+        finally:
+            translator.release_capacity(token)
+
+        for candidate, probability in self.history.predict(current_models[0]):
+            if translator.is_loaded(candidate) or candidate not in translator.list_models():
+                continue
+            # Budget and free memory are checked before loading; a load that
+            # would not fit is skipped rather than undone afterwards.
+            if not self._fits(translator, candidate, budget_mb):
+                break
+            start = time.perf_counter()
+            token = translator.reserve_capacity(len(translator.loaded_models()) + (2 if translator.is_pivot(candidate) else 1))
+            try:
+                translator.ensure_loaded(candidate)
+            finally:
+                translator.release_capacity(token)
+            with self.lock:
+                self.prefetched.add(candidate)
+                self.stats["prefetched"] += 1
+            logger.info(f"Prefetched {candidate} (p={probability:.2f}) in {(time.perf_counter() - start) * 1000:.0f}ms")
+            break
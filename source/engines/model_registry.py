@@ -0,0 +1,207 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger("ModelRegistry")
+
+REGISTRY_DIR = ".voxlay"
+REGISTRY_FILE = "registry.json"
+REGISTRY_VERSION = 1
+PIVOT_MANIFEST = "pivot.json"
+INSTALL_REPORT_FILE = "install.json"
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+def parse_model_pair(model_name):
+    match = re.search(r"-([a-z]{2,3})-([a-z]{2,3})$", model_name or "")
+    if not match:
+        return None, None
+    return match.group(1), match.group(2)
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def touch_model_dir(model_dir):
+    # Installs write into an already existing subdirectory, which does not
+    # change the parent's mtime on its own.
+    try:
+        os.utime(model_dir)
+    except OSError as e:
+        logger.debug(f"Could not touch {model_dir}: {e}")
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return None
+
+class ModelRegistry:
+    def __init__(self, model_dir):
+        self.model_dir = Path(model_dir)
+        self.path = self.model_dir / REGISTRY_DIR / REGISTRY_FILE
+        self.lock = threading.RLock()
+        self.entries = {}
+        self.pairs = {}
+        self.dir_mtime = None
+        self.missing = False
+        self._load()
+
+    def _dir_mtime(self):
+        try:
+            return self.model_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        data = _read_json(self.path)
+        if not data or data.get("version") != REGISTRY_VERSION:
+            return
+        self.entries = data.get("models", {})
+        self.dir_mtime = data.get("dir_mtime")
+        self._build_index()
+
+    def _save(self):
+        try:
+            # Kept in a subdirectory so rewriting it leaves the model dir mtime alone.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.dir_mtime = self._dir_mtime()
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": REGISTRY_VERSION, "dir_mtime": self.dir_mtime, "models": self.entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write model registry {self.path}: {e}")
+
+    def _build_index(self):
+        pairs = {}
+        for name, entry in sorted(self.entries.items(), key=lambda item: item[1].get("pivot", False), reverse=True):
+            if entry.get("source") and entry.get("target"):
+                pairs[(entry["source"], entry["target"])] = name
+        self.pairs = pairs
+
+    def _describe(self, path, previous):
+        model_file = path / "model.bin"
+        marker = model_file if model_file.exists() else path / PIVOT_MANIFEST
+        try:
+            mtime = marker.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        if previous and previous.get("model_mtime") == mtime:
+            return previous
+
+        manifest = _read_json(marker) if marker.name == PIVOT_MANIFEST else None
+        if marker.name == PIVOT_MANIFEST and manifest is None:
+            return None
+        report = _read_json(path / INSTALL_REPORT_FILE) or {}
+        if manifest:
+            source, target = manifest.get("source"), manifest.get("target")
+        else:
+            source, target = parse_model_pair(path.name)
+        # Models installed before install reports existed have no checksum;
+        # hashing model.bin here would stall whichever thread syncs, so it is
+        # left to checksum() on demand.
+        return {
+            "source": source,
+            "target": target,
+            "pivot": bool(manifest),
+            "legs": manifest.get("legs", []) if manifest else [],
+            "size_bytes": report.get("size_bytes") or sum(f.stat().st_size for f in path.rglob("*") if f.is_file()),
+            "compute_type": report.get("quantization"),
+            "load_ms": report.get("load_ms"),
+            "checksum": None if manifest else report.get("checksum"),
+            "installed_at": report.get("installed_at") or time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(path.stat().st_mtime)),
+            "model_mtime": mtime,
+        }
+
+    def sync(self, force=False):
+        with self.lock:
+            mtime = self._dir_mtime()
+            if mtime is None:
+                # Remember that the directory is missing so lookups do not
+                # rescan until it appears.
+                if self.missing and not force:
+                    return False
+                self.missing = True
+                self.dir_mtime = None
+                self.entries = {}
+                self.pairs = {}
+                logger.info(f"Model directory {self.model_dir} does not exist, registry is empty")
+                return True
+            self.missing = False
+            if not force and mtime == self.dir_mtime:
+                return False
+            start = time.perf_counter()
+            entries = {}
+            if self.model_dir.is_dir():
+                for item in self.model_dir.iterdir():
+                    if not item.is_dir() or item.name.startswith("."):
+                        continue
+                    entry = self._describe(item, self.entries.get(item.name))
+                    if entry:
+                        entries[item.name] = entry
+            added = entries.keys() - self.entries.keys()
+            removed = self.entries.keys() - entries.keys()
+            self.entries = entries
+            self._build_index()
+            self._save()
+            logger.info(
+                f"Model registry synced in {(time.perf_counter() - start) * 1000:.0f}ms: {len(entries)} models"
+                f"{f', added {sorted(added)}' if added else ''}{f', removed {sorted(removed)}' if removed else ''}"
+            )
+            return True
+
+    def checksum(self, model_name):
+        with self.lock:
+            self.sync()
+            entry = self.entries.get(model_name)
+            if not entry or entry["pivot"] or entry.get("checksum"):
+                return entry.get("checksum") if entry else None
+        # Hashed outside the lock so lookups from other threads are not held up.
+        try:
+            checksum = file_checksum(self.model_dir / model_name / "model.bin")
+        except OSError as e:
+            logger.warning(f"Could not hash {model_name}: {e}")
+            return None
+        with self.lock:
+            if self.entries.get(model_name) is entry:
+                entry["checksum"] = checksum
+                self._save()
+        return checksum
+
+    def models(self):
+        with self.lock:
+            self.sync()
+            return list(self.entries)
+
+    def get(self, model_name):
+        with self.lock:
+            self.sync()
+            return self.entries.get(model_name)
+
+    def resolve(self, source, target):
+        with self.lock:
+            self.sync()
+            return self.pairs.get((source, target))
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_registry(model_dir):
+    key = os.path.abspath(model_dir)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = ModelRegistry(model_dir)
+        return _registries[key]
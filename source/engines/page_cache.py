@@ -0,0 +1,101 @@
+import os
+import time
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger("PageCache")
+
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_STARTUP_DELAY_S = 5.0
+DEFAULT_CHECK_INTERVAL_S = 5.0
+RESUME_THRESHOLD_S = 5.0
+
+_last_prewarm = {}
+
+def prewarm(paths):
+    start = time.perf_counter()
+    total = 0
+    buffer = bytearray(READ_CHUNK_SIZE)
+    view = memoryview(buffer)
+    for path in paths:
+        try:
+            with open(path, "rb", buffering=0) as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                # WILLNEED is only a hint, reading makes sure the pages are resident.
+                while True:
+                    count = f.readinto(view)
+                    if not count:
+                        break
+                    total += count
+            _last_prewarm[str(path)] = time.monotonic()
+        except OSError as e:
+            logger.warning(f"Could not prewarm {path}: {e}")
+    return total, time.perf_counter() - start
+
+def evict(paths):
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    evicted = True
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            logger.warning(f"Could not evict {path} from the page cache: {e}")
+            evicted = False
+        _last_prewarm.pop(str(path), None)
+    return evicted
+
+def seconds_since_prewarm(path):
+    timestamp = _last_prewarm.get(str(path))
+    return time.monotonic() - timestamp if timestamp is not None else None
+
+def _suspend_clock():
+    # CLOCK_BOOTTIME keeps counting while suspended, CLOCK_MONOTONIC does not,
+    # so their difference grows by the time spent asleep.
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - time.monotonic()
+    return time.time() - time.monotonic()
+
+class PageCachePrewarmer(threading.Thread):
+    def __init__(self, paths_provider, startup_delay_s=DEFAULT_STARTUP_DELAY_S, interval_s=DEFAULT_CHECK_INTERVAL_S):
+        super().__init__(name="PageCachePrewarmer", daemon=True)
+        self.paths_provider = paths_provider
+        self.startup_delay_s = startup_delay_s
+        self.interval_s = interval_s
+        self.stop_event = threading.Event()
+        self.last_paths = []
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _paths(self):
+        try:
+            return [str(path) for path in self.paths_provider()]
+        except Exception as e:
+            logger.debug(f"No model files to prewarm: {e}")
+            return []
+
+    def _prewarm(self, paths, reason):
+        self.last_paths = paths
+        if not paths:
+            return
+        count, elapsed = prewarm(paths)
+        logger.info(f"Prewarmed {len(paths)} model files ({count / 1e6:.1f} MB) in {elapsed * 1000:.0f}ms ({reason})")
+
+    def run(self):
+        if self.stop_event.wait(self.startup_delay_s):
+            return
+        self._prewarm(self._paths(), "startup")
+        offset = _suspend_clock()
+        while not self.stop_event.wait(self.interval_s):
+            current = _suspend_clock()
+            slept = current - offset
+            offset = current
+            paths = self._paths()
+            if slept > RESUME_THRESHOLD_S:
+                self._prewarm(paths, f"resumed after {slept:.0f}s asleep")
+            elif paths != self.last_paths:
+                self._prewarm(paths, "model changed")
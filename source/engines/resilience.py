@@ -0,0 +1,121 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger("Resilience")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class Deadline:
+    def __init__(self, timeout_s):
+        self.timeout_s = timeout_s
+        self.expires_at = time.monotonic() + timeout_s
+        self.cancel_event = threading.Event()
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def done(self):
+        return self.cancelled or self.remaining() <= 0
+
+    def sleep(self, seconds):
+        # Backoff that wakes up early on cancel; returns False when the caller
+        # should stop retrying.
+        remaining = self.remaining()
+        if self.cancel_event.wait(min(seconds, remaining)):
+            return False
+        return seconds < remaining
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=3, reset_timeout_s=30, on_change=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.on_change = on_change
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def configure(self, failure_threshold, reset_timeout_s):
+        with self.lock:
+            self.failure_threshold = max(1, failure_threshold)
+            self.reset_timeout_s = reset_timeout_s
+
+    def _transition(self, state):
+        if state == self.state:
+            return None
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+        return previous
+
+    def _notify(self, previous):
+        if previous is None:
+            return
+        if self.state == OPEN:
+            logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures, retrying in {self.reset_timeout_s}s")
+        else:
+            logger.info(f"{self.name} circuit {previous} -> {self.state}")
+        if self.on_change:
+            self.on_change(self.state)
+
+    def allow(self):
+        previous = None
+        with self.lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout_s:
+                previous = self._transition(HALF_OPEN)
+            if self.state == CLOSED:
+                allowed = True
+            elif self.state == HALF_OPEN and not self.trial_in_flight:
+                # Let exactly one request find out whether the service is back.
+                self.trial_in_flight = True
+                allowed = True
+            else:
+                self.rejected += 1
+                allowed = False
+        self._notify(previous)
+        return allowed
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.trial_in_flight = False
+            previous = self._transition(CLOSED)
+        self._notify(previous)
+
+    def record_failure(self):
+        previous = None
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                previous = self._transition(OPEN)
+        self._notify(previous)
+
+    def release(self):
+        # Hands back a half-open trial that was never sent.
+        with self.lock:
+            self.trial_in_flight = False
+
+    def stats(self):
+        with self.lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
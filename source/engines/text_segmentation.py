@@ -0,0 +1,36 @@
+import re
+
+SENTENCE_BOUNDARY = re.compile(
+    r"(?:(?<=[.!?…])|(?<=[.!?…][\"'”»)\]]))\s+(?=[\"'“«(\[]?[A-ZÀ-ÖØ-ÞĀ-ſА-Я0-9])"
+)
+
+def split_sentences(text):
+    text = text.strip()
+    if not text:
+        return []
+    return [segment.strip() for segment in SENTENCE_BOUNDARY.split(text) if segment.strip()]
+
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:])\s+")
+MAX_SEGMENT_WORDS = 40
+
+def _split_long(sentence, max_words):
+    if len(sentence.split()) <= max_words:
+        return [sentence]
+    # Recognizers often return long unpunctuated runs; cut at clause marks
+    # first and only fall back to a hard word limit.
+    pieces, current = [], []
+    for clause in CLAUSE_BOUNDARY.split(sentence):
+        words = clause.split()
+        if current and len(current) + len(words) > max_words:
+            pieces.append(" ".join(current))
+            current = []
+        current.extend(words)
+        while len(current) > max_words:
+            pieces.append(" ".join(current[:max_words]))
+            current = current[max_words:]
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+def split_segments(text, max_words=MAX_SEGMENT_WORDS):
+    return [piece for sentence in split_sentences(text) for piece in _split_long(sentence, max_words)]
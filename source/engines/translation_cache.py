@@ -0,0 +1,176 @@
+import time
+import sqlite3
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+
+logger = logging.getLogger("TranslationCache")
+
+TOUCH_FLUSH_SIZE = 100
+
+def normalize_text(text):
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+class TranslationCache:
+    def __init__(self, max_entries=2048, persistent_path=None, max_disk_entries=50000):
+        self.enabled = True
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.entries = OrderedDict()
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.db = None
+        self.db_lock = threading.Lock()
+        self.disk_writes = 0
+        self.touched = {}
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+        if persistent_path:
+            self._open_db(persistent_path)
+
+    @staticmethod
+    def make_key(engine, model, source_lang, target_lang, text):
+        return "\x1f".join([engine or "", model or "", source_lang or "", target_lang or "", normalize_text(text)])
+
+    def _open_db(self, path):
+        try:
+            self.db = sqlite3.connect(str(path), check_same_thread=False)
+            # WAL with NORMAL sync commits without an fsync per write.
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)")
+            self.db.commit()
+            logger.info(f"Persistent translation cache opened at {path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open persistent translation cache {path}: {e}")
+            self.db = None
+
+    def _disk_get(self, key):
+        if self.db is None:
+            return None
+        with self.db_lock:
+            try:
+                row = self.db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+                if row:
+                    # Recency only matters for trimming, so hits are written
+                    # back in batches instead of committing on every read.
+                    self.touched[key] = time.time()
+                    if len(self.touched) >= TOUCH_FLUSH_SIZE:
+                        self._flush_touched()
+                        self.db.commit()
+                return row[0] if row else None
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache read failed: {e}")
+                return None
+
+    def _flush_touched(self):
+        touched, self.touched = self.touched, {}
+        self.db.executemany("UPDATE cache SET last_used = ? WHERE key = ?", [(used, key) for key, used in touched.items()])
+
+    def _disk_put(self, key, value):
+        if self.db is None:
+            return
+        with self.db_lock:
+            try:
+                self._flush_touched()
+                self.db.execute("INSERT OR REPLACE INTO cache (key, value, last_used) VALUES (?, ?, ?)", (key, value, time.time()))
+                self.disk_writes += 1
+                if self.disk_writes % 500 == 0:
+                    self.db.execute(
+                        "DELETE FROM cache WHERE key NOT IN (SELECT key FROM cache ORDER BY last_used DESC LIMIT ?)",
+                        (self.max_disk_entries,)
+                    )
+                self.db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache write failed: {e}")
+
+    def _memory_put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.memory_hits += 1
+                return self.entries[key]
+        value = self._disk_get(key)
+        if value is not None:
+            with self.lock:
+                self.disk_hits += 1
+                self._memory_put(key, value)
+        return value
+
+    def put(self, key, value):
+        with self.lock:
+            self._memory_put(key, value)
+        self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute):
+        if not self.enabled:
+            return compute()
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.in_flight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+            future.set_result(value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+
+        if value:
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+        if self.db is not None:
+            with self.db_lock:
+                try:
+                    self.touched.clear()
+                    self.db.execute("DELETE FROM cache")
+                    self.db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not clear persistent cache: {e}")
+
+    def stats(self):
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.coalesced + self.misses
+            hits = self.memory_hits + self.disk_hits + self.coalesced
+            return {
+                "entries": len(self.entries),
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "coalesced": self.coalesced,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
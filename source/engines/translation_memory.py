@@ -0,0 +1,276 @@
+import math
+import time
+import sqlite3
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from engines.translation_cache import normalize_text
+
+logger = logging.getLogger("TranslationMemory")
+
+NGRAM_SIZE = 3
+LOAD_CHUNK_SIZE = 5000
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+def char_ngrams(text, n=NGRAM_SIZE):
+    padded = f" {normalize_text(text).casefold()} "
+    if len(padded) <= n:
+        return frozenset([padded])
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+def dice(a, b):
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+def seed_prefix(query, match_source, match_target, holdback_words=1):
+    query_words = normalize_text(query).casefold().split()
+    source_words = normalize_text(match_source).casefold().split()
+    common = 0
+    for a, b in zip(query_words, source_words):
+        if a != b:
+            break
+        common += 1
+    if common == 0 or not source_words:
+        return ""
+    target_words = match_target.split()
+    keep = int(len(target_words) * common / len(source_words)) - holdback_words
+    return " ".join(target_words[:keep]) if keep > 0 else ""
+
+class _Partition:
+    def __init__(self):
+        self.sources = []
+        self.targets = []
+        self.grams = []
+        self.index = {}
+        self.exact = {}
+
+    def add(self, source, target):
+        key = normalize_text(source).casefold()
+        if key in self.exact:
+            self.targets[self.exact[key]] = target
+            return False
+        entry_id = len(self.sources)
+        grams = char_ngrams(source)
+        self.sources.append(source)
+        self.targets.append(target)
+        self.grams.append(grams)
+        self.exact[key] = entry_id
+        for gram in grams:
+            self.index.setdefault(gram, []).append(entry_id)
+        return True
+
+    def search(self, text, threshold):
+        key = normalize_text(text).casefold()
+        if key in self.exact:
+            entry_id = self.exact[key]
+            return 1.0, entry_id
+
+        query = char_ngrams(text)
+        size = len(query)
+        min_size = size * threshold / (2 - threshold)
+        max_size = size * (2 - threshold) / threshold
+        min_overlap = math.ceil(threshold * size / (2 - threshold) - 1e-9)
+
+        # Any entry reaching the threshold must share at least one of the
+        # (size - min_overlap + 1) rarest query grams, so only those postings
+        # are scanned for candidates.
+        ordered = sorted(query, key=lambda g: len(self.index.get(g, ())))
+        probe = ordered[:max(size - min_overlap + 1, 1)]
+
+        best_score = 0.0
+        best_id = None
+        seen = set()
+        for gram in probe:
+            for entry_id in self.index.get(gram, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                grams = self.grams[entry_id]
+                if not (min_size <= len(grams) <= max_size):
+                    continue
+                score = dice(query, grams)
+                if score > best_score:
+                    best_score = score
+                    best_id = entry_id
+        if best_id is None or best_score < threshold:
+            return 0.0, None
+        return best_score, best_id
+
+class TranslationMemory:
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path else None
+        self.partitions = {}
+        self.lock = threading.Lock()
+        self.db = None
+        self.db_lock = threading.Lock()
+        self.loaded = threading.Event()
+        self.skipped_lookups = 0
+
+        if self.db_path:
+            self._open_db()
+            threading.Thread(target=self._load, daemon=True).start()
+        else:
+            self.loaded.set()
+
+    def _open_db(self):
+        try:
+            self.db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS tm (source_lang TEXT NOT NULL, target_lang TEXT NOT NULL, "
+                "source TEXT NOT NULL, target TEXT NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (source_lang, target_lang, source))"
+            )
+            self.db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open translation memory {self.db_path}: {e}")
+            self.db = None
+
+    def _load(self):
+        start = time.perf_counter()
+        count = 0
+        try:
+            if self.db is not None:
+                with self.db_lock:
+                    rows = self.db.execute("SELECT source_lang, target_lang, source, target FROM tm").fetchall()
+                for offset in range(0, len(rows), LOAD_CHUNK_SIZE):
+                    with self.lock:
+                        for source_lang, target_lang, source, target in rows[offset:offset + LOAD_CHUNK_SIZE]:
+                            self._partition(source_lang, target_lang).add(source, target)
+                            count += 1
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load translation memory: {e}")
+        finally:
+            self.loaded.set()
+        skipped = f", {self.skipped_lookups} lookups skipped while loading" if self.skipped_lookups else ""
+        logger.info(f"Translation memory loaded {count} entries in {(time.perf_counter() - start) * 1000:.0f}ms{skipped}")
+
+    def _partition(self, source_lang, target_lang):
+        key = (source_lang, target_lang)
+        if key not in self.partitions:
+            self.partitions[key] = _Partition()
+        return self.partitions[key]
+
+    def add(self, source_lang, target_lang, source, target, persist=True):
+        if not source or not target:
+            return
+        with self.lock:
+            self._partition(source_lang, target_lang).add(source, target)
+        if persist and self.db is not None:
+            with self.db_lock:
+                try:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO tm (source_lang, target_lang, source, target, created) VALUES (?, ?, ?, ?, ?)",
+                        (source_lang, target_lang, source, target, time.time())
+                    )
+                    self.db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not store translation memory entry: {e}")
+
+    def _ready(self):
+        if self.loaded.is_set():
+            return True
+        with self.lock:
+            self.skipped_lookups += 1
+            first = self.skipped_lookups == 1
+        if first:
+            logger.info("Translation memory is still loading, lookups are skipped until it is ready")
+        return False
+
+    def exact(self, source_lang, target_lang, text):
+        if not self._ready():
+            return None
+        with self.lock:
+            partition = self.partitions.get((source_lang, target_lang))
+            entry_id = partition.exact.get(normalize_text(text).casefold()) if partition else None
+            return partition.targets[entry_id] if entry_id is not None else None
+
+    def lookup(self, source_lang, target_lang, text, threshold):
+        if not self._ready():
+            return None
+        with self.lock:
+            partition = self.partitions.get((source_lang, target_lang))
+            if partition is None:
+                return None
+            score, entry_id = partition.search(text, threshold)
+            if entry_id is None:
+                return None
+            return score, partition.sources[entry_id], partition.targets[entry_id]
+
+    def __len__(self):
+        with self.lock:
+            return sum(len(p.sources) for p in self.partitions.values())
+
+    def export_tmx(self, path):
+        root = ET.Element("tmx", version="1.4")
+        ET.SubElement(root, "header", {
+            "creationtool": "Voxlay",
+            "segtype": "sentence",
+            "o-tmf": "Voxlay",
+            "adminlang": "en",
+            "srclang": "*all*",
+            "datatype": "plaintext",
+        })
+        body = ET.SubElement(root, "body")
+        count = 0
+        with self.lock:
+            for (source_lang, target_lang), partition in self.partitions.items():
+                for source, target in zip(partition.sources, partition.targets):
+                    tu = ET.SubElement(body, "tu", srclang=source_lang)
+                    for lang, seg_text in ((source_lang, source), (target_lang, target)):
+                        tuv = ET.SubElement(tu, "tuv", {XML_LANG: lang})
+                        ET.SubElement(tuv, "seg").text = seg_text
+                    count += 1
+        ET.ElementTree(root).write(str(path), encoding="utf-8", xml_declaration=True)
+        logger.info(f"Exported {count} translation memory entries to {path}")
+        return count
+
+    def import_tmx(self, path):
+        count = 0
+        header_srclang = None
+        rows = []
+        for event, elem in ET.iterparse(str(path), events=("end",)):
+            if elem.tag == "header":
+                header_srclang = elem.get("srclang")
+            elif elem.tag == "tu":
+                segments = []
+                for tuv in elem.findall("tuv"):
+                    lang = (tuv.get(XML_LANG) or tuv.get("lang") or "").split("-")[0].lower()
+                    seg = tuv.find("seg")
+                    if lang and seg is not None:
+                        segments.append((lang, "".join(seg.itertext()).strip()))
+                srclang = (elem.get("srclang") or header_srclang or "").split("-")[0].lower()
+                source = next((s for s in segments if s[0] == srclang), segments[0] if segments else None)
+                if source:
+                    for lang, seg_text in segments:
+                        if lang != source[0] and source[1] and seg_text:
+                            rows.append((source[0], lang, source[1], seg_text))
+                elem.clear()
+
+        now = time.time()
+        with self.lock:
+            for source_lang, target_lang, source, target in rows:
+                self._partition(source_lang, target_lang).add(source, target)
+                count += 1
+        if self.db is not None and rows:
+            with self.db_lock:
+                try:
+                    self.db.executemany(
+                        "INSERT OR REPLACE INTO tm (source_lang, target_lang, source, target, created) VALUES (?, ?, ?, ?, ?)",
+                        [row + (now,) for row in rows]
+                    )
+                    self.db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not store imported translation memory: {e}")
+        logger.info(f"Imported {count} translation memory entries from {path}")
+        return count
+
+_instance = None
+
+def get_translation_memory(db_path=None):
+    global _instance
+    if _instance is None:
+        _instance = TranslationMemory(db_path)
+    return _instance
@@ -0,0 +1,216 @@
+import time
+import queue
+import logging
+import itertools
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future
+
+from engines import translation_worker
+from core.constants import DEFAULT_CTRANSLATE2_MODEL_DIR, DEFAULT_CTRANSLATE2_COMPUTE_TYPE, DEFAULT_CTRANSLATE2_WORKER_MODE
+
+logger = logging.getLogger("TranslationProcess")
+
+MAX_RESTARTS = 5
+RESTART_WINDOW_S = 60
+RESTART_BACKOFF_S = 0.5
+
+class TranslationProcessClient:
+    def __init__(self, model_dir, device="cpu", compute_type="auto"):
+        self.settings = (str(model_dir), device, compute_type)
+        self.context = multiprocessing.get_context("spawn")
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.pending = {}
+        self.ids = itertools.count()
+        self.restarts = deque()
+        self.restart_count = 0
+        self.process = None
+        self.conn = None
+        self.closed = False
+        self.resident = set()
+        self.legs = {}
+        self._start()
+
+    def _start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=translation_worker.run, args=(child_conn,) + self.settings, name="VoxlayTranslator", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.resident = set()
+        self.process = process
+        self.conn = parent_conn
+        logger.info(f"Translation process started (pid {process.pid})")
+        threading.Thread(target=self._supervise, args=(process, parent_conn), daemon=True).start()
+
+    def _supervise(self, process, conn):
+        while True:
+            try:
+                kind, request_id, payload = conn.recv()
+            except (EOFError, OSError):
+                break
+            if kind == "loaded":
+                self.resident = set(payload)
+                continue
+            with self.lock:
+                waiter = self.pending.get(request_id) if kind == "partial" else self.pending.pop(request_id, None)
+            if waiter is None:
+                continue
+            if isinstance(waiter, queue.Queue):
+                waiter.put((kind, payload))
+            elif kind == "error":
+                waiter.set_exception(RuntimeError(payload))
+            else:
+                waiter.set_result(payload)
+
+        process.join(timeout=1)
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for waiter in pending.values():
+            if isinstance(waiter, queue.Queue):
+                waiter.put(("error", "Translation process exited"))
+            else:
+                waiter.set_exception(RuntimeError("Translation process exited"))
+        if self.closed:
+            return
+
+        now = time.monotonic()
+        while self.restarts and now - self.restarts[0] > RESTART_WINDOW_S:
+            self.restarts.popleft()
+        if len(self.restarts) >= MAX_RESTARTS:
+            logger.critical(f"Translation process crashed {MAX_RESTARTS} times within {RESTART_WINDOW_S}s, not restarting")
+            self.closed = True
+            return
+        self.restarts.append(now)
+        self.restart_count += 1
+        logger.error(f"Translation process exited with code {process.exitcode}, restarting")
+        time.sleep(RESTART_BACKOFF_S * len(self.restarts))
+        with self.lock:
+            if not self.closed:
+                self._start()
+
+    def _submit(self, method, args, kwargs, waiter):
+        if self.closed:
+            raise RuntimeError("Translation process is not running")
+        with self.lock:
+            request_id = next(self.ids)
+            self.pending[request_id] = waiter
+            conn = self.conn
+        try:
+            with self.send_lock:
+                conn.send((request_id, method, args, kwargs))
+        except (OSError, ValueError) as e:
+            with self.lock:
+                self.pending.pop(request_id, None)
+            raise RuntimeError(f"Translation process unavailable: {e}")
+
+    def _call(self, method, *args, **kwargs):
+        future = Future()
+        self._submit(method, args, kwargs, future)
+        return future.result()
+
+    def configure(self, model_dir, device=None, compute_type=None):
+        settings = (str(model_dir), device or self.settings[1], compute_type or self.settings[2])
+        if settings != self.settings:
+            self.settings = settings
+            self.legs.clear()
+            self._call("configure", *settings)
+
+    def translate(self, text, **kwargs):
+        return self._call("translate", text, **kwargs)
+
+    def translate_many(self, texts, **kwargs):
+        return self._call("translate_many", texts, **kwargs)
+
+    def translate_stream(self, text, **kwargs):
+        updates = queue.Queue()
+        self._submit("translate_stream", (text,), kwargs, updates)
+        while True:
+            kind, payload = updates.get()
+            if kind == "partial":
+                yield payload
+            elif kind == "error":
+                raise RuntimeError(payload)
+            else:
+                return
+
+    def resolve_model_name(self, source_lang, target_lang):
+        return self._call("resolve_model_name", source_lang, target_lang)
+
+    def _legs(self, model_name):
+        # Pivot routes only change when models are installed, so they are
+        # asked for once rather than on every translation.
+        legs = self.legs.get(model_name)
+        if legs is None:
+            legs = self._call("get_pivot_legs", model_name) if self._call("is_pivot", model_name) else [model_name]
+            self.legs[model_name] = legs
+        return legs
+
+    def is_pivot(self, model_name):
+        return self._legs(model_name) != [model_name]
+
+    def is_loaded(self, model_name):
+        return all(name in self.resident for name in self._legs(model_name))
+
+    def ensure_loaded(self, model_name):
+        return self._call("ensure_loaded", model_name)
+
+    def reserve_capacity(self, count):
+        return self._call("reserve_capacity", count)
+
+    def release_capacity(self, token):
+        return self._call("release_capacity", token)
+
+    def list_models(self):
+        self.legs.clear()
+        return self._call("list_models")
+
+    def get_model_info(self, model_name):
+        return self._call("get_model_info", model_name)
+
+    def get_pivot_legs(self, model_name):
+        return self._call("get_pivot_legs", model_name)
+
+    def loaded_models(self):
+        return self._call("loaded_models")
+
+    def unload_model(self, model_name):
+        return self._call("unload_model", model_name)
+
+    def get_batching_stats(self):
+        return self._call("get_batching_stats")
+
+    def close(self):
+        self.closed = True
+        try:
+            with self.send_lock:
+                self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+
+_instance = None
+
+def get_translation_process(model_dir="models", device=None, compute_type=None):
+    global _instance
+    if _instance is None:
+        _instance = TranslationProcessClient(model_dir, device or "cpu", compute_type or "auto")
+    else:
+        _instance.configure(model_dir, device, compute_type)
+    return _instance
+
+def get_ctranslate2_translator(config):
+    # The one place that picks between the in-process wrapper and the worker
+    # process, so the app and the local server always share a translator.
+    model_dir = config.get("ctranslate2_model_dir", DEFAULT_CTRANSLATE2_MODEL_DIR)
+    device = "cpu" #force cpu
+    compute_type = config.get("ctranslate2_compute_type", DEFAULT_CTRANSLATE2_COMPUTE_TYPE)
+    if config.get("ctranslate2_worker_mode", DEFAULT_CTRANSLATE2_WORKER_MODE) == "process":
+        return get_translation_process(model_dir, device, compute_type)
+    from engines import ctranslate2_engine
+    return ctranslate2_engine.get_translator(model_dir, device, compute_type)
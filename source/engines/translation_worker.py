@@ -0,0 +1,56 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+CHILD_WORKERS = 4
+
+# Entry point of the translation process. Kept apart from translation_process
+# so the spawned child only imports what it needs to translate.
+def run(conn, model_dir, device, compute_type):
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
+    from engines import ctranslate2_engine
+    translator = ctranslate2_engine.get_translator(model_dir, device, compute_type)
+    send_lock = threading.Lock()
+    resident = [None]
+
+    def send(message):
+        with send_lock:
+            conn.send(message)
+
+    def send_resident():
+        # Pushed before the result whenever loads or evictions changed it, so
+        # the parent can answer is_loaded without a round-trip.
+        with send_lock:
+            loaded = sorted(translator.loaded_models())
+            if loaded != resident[0]:
+                resident[0] = loaded
+                conn.send(("loaded", None, loaded))
+
+    def handle(request_id, method, args, kwargs):
+        try:
+            if method == "configure":
+                ctranslate2_engine.get_translator(*args)
+                send_resident()
+                send(("result", request_id, None))
+            elif method == "translate_stream":
+                for partial in translator.translate_stream(*args, **kwargs):
+                    send(("partial", request_id, partial))
+                send_resident()
+                send(("result", request_id, None))
+            else:
+                result = getattr(translator, method)(*args, **kwargs)
+                send_resident()
+                send(("result", request_id, result))
+        except Exception as e:
+            send_resident()
+            send(("error", request_id, f"{type(e).__name__}: {e}"))
+
+    with ThreadPoolExecutor(max_workers=CHILD_WORKERS) as executor:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message is None:
+                break
+            executor.submit(handle, *message)
@@ -0,0 +1,112 @@
+import json
+import time
+import logging
+import difflib
+from pathlib import Path
+
+logger = logging.getLogger("VocabularyMap")
+
+VMAP_FILE = "vmap.txt"
+VMAP_REPORT_FILE = "vmap.json"
+VMAP_ALWAYS_ON = 1500
+VMAP_SOURCE_PIECES = 4000
+VMAP_HYPOTHESES = 4
+VMAP_BUILD_BATCH_SIZE = 64
+VMAP_MIN_AGREEMENT = 0.95
+VMAP_BENCHMARK_ROUNDS = 3
+SPECIAL_TOKENS = ("</s>", "<unk>", "<pad>")
+
+def _read_vocabulary(model_dir, side):
+    for name in (f"{side}_vocabulary.json", "shared_vocabulary.json", f"{side}_vocabulary.txt", "shared_vocabulary.txt"):
+        path = Path(model_dir) / name
+        if not path.exists():
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            if path.suffix == ".json":
+                return json.load(f)
+            return [line.rstrip("\n") for line in f]
+    raise FileNotFoundError(f"No {side} vocabulary found in {model_dir}")
+
+def _pieces_by_frequency(spm_path, vocabulary):
+    import sentencepiece
+    processor = sentencepiece.SentencePieceProcessor(model_file=str(spm_path))
+    known = set(vocabulary)
+    pieces = [(processor.get_score(i), processor.id_to_piece(i)) for i in range(processor.get_piece_size())]
+    pieces.sort(reverse=True)
+    return [piece for _, piece in pieces if piece in known and piece not in SPECIAL_TOKENS]
+
+def build_vmap(model_dir, translator):
+    model_dir = Path(model_dir)
+    start = time.perf_counter()
+    target_vocab = _read_vocabulary(model_dir, "target")
+    source_vocab = _read_vocabulary(model_dir, "source")
+    target_pieces = _pieces_by_frequency(model_dir / "target.spm", target_vocab)
+    source_pieces = _pieces_by_frequency(model_dir / "source.spm", source_vocab)[:VMAP_SOURCE_PIECES]
+
+    # Short pieces (punctuation, digits, single letters) and the most frequent
+    # target pieces are always allowed so copying and rare words still decode.
+    always_on = list(SPECIAL_TOKENS)
+    always_on += [piece for piece in target_vocab if len(piece.lstrip("▁")) <= 1 and piece not in SPECIAL_TOKENS]
+    always_on += target_pieces[:VMAP_ALWAYS_ON]
+    always_on = list(dict.fromkeys(always_on))
+
+    lines = ["\t" + " ".join(always_on)]
+    for offset in range(0, len(source_pieces), VMAP_BUILD_BATCH_SIZE):
+        chunk = source_pieces[offset:offset + VMAP_BUILD_BATCH_SIZE]
+        results = translator.translate_batch(
+            [[piece, "</s>"] for piece in chunk],
+            beam_size=VMAP_HYPOTHESES,
+            num_hypotheses=VMAP_HYPOTHESES,
+            max_decoding_length=8,
+        )
+        for piece, result in zip(chunk, results):
+            targets = dict.fromkeys(token for hypothesis in result.hypotheses for token in hypothesis if token not in SPECIAL_TOKENS)
+            if targets:
+                lines.append(f"{piece}\t{' '.join(targets)}")
+
+    with open(model_dir / VMAP_FILE, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    logger.info(
+        f"Built vocabulary map for {model_dir.name}: {len(always_on)} always-on of {len(target_vocab)} target tokens, "
+        f"{len(lines) - 1} source entries in {time.perf_counter() - start:.1f}s"
+    )
+    return model_dir / VMAP_FILE
+
+def benchmark_vmap(translator, batch):
+    results = {}
+    outputs = {}
+    translator.translate_batch(batch[:1])
+    for use_vmap in (False, True):
+        start = time.perf_counter()
+        for _ in range(VMAP_BENCHMARK_ROUNDS):
+            translations = translator.translate_batch(batch, beam_size=2, use_vmap=use_vmap)
+        elapsed = (time.perf_counter() - start) / VMAP_BENCHMARK_ROUNDS
+        hypotheses = [t.hypotheses[0] for t in translations]
+        outputs[use_vmap] = hypotheses
+        results["tokens_per_second_vmap" if use_vmap else "tokens_per_second"] = round(sum(len(h) for h in hypotheses) / elapsed, 1)
+
+    agreement = sum(
+        difflib.SequenceMatcher(None, ref, hyp).ratio()
+        for ref, hyp in zip(outputs[False], outputs[True])
+    ) / len(batch)
+    results["agreement"] = round(agreement, 3)
+    results["speedup"] = round(results["tokens_per_second_vmap"] / results["tokens_per_second"], 2) if results["tokens_per_second"] else 0.0
+    results["enabled"] = agreement >= VMAP_MIN_AGREEMENT and results["speedup"] > 1.0
+    return results
+
+def write_vmap_report(model_dir, report):
+    with open(Path(model_dir) / VMAP_REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+def vmap_enabled(model_dir):
+    model_dir = Path(model_dir)
+    if not (model_dir / VMAP_FILE).exists():
+        return False
+    try:
+        with open(model_dir / VMAP_REPORT_FILE, "r", encoding="utf-8") as f:
+            return bool(json.load(f).get("enabled", True))
+    except FileNotFoundError:
+        return True
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read vocabulary map report for {model_dir.name}: {e}")
+        return False
@@ -0,0 +1,40 @@
+from PyQt6 import QtWidgets, QtCore
+from ..common_widgets import SettingCard, FluentIcon
+import logging
+
+logger = logging.getLogger("GUI.LanguageChecklist")
+
+class LanguageChecklistCard(SettingCard):
+    selectionChanged = QtCore.pyqtSignal(list)
+
+    def __init__(self, title, content, languages, selected=None, parent=None):
+        super().__init__(FluentIcon.LANGUAGE, title, content, parent)
+        self.checkboxes = {}
+        
+        grid = QtWidgets.QGridLayout()
+        grid.setHorizontalSpacing(12)
+        for i, (code, name) in enumerate(languages.items()):
+            checkbox = QtWidgets.QCheckBox(name, self)
+            checkbox.setChecked(code in (selected or []))
+            checkbox.toggled.connect(self._on_toggled)
+            grid.addWidget(checkbox, i // 3, i % 3)
+            self.checkboxes[code] = checkbox
+        
+        self.hBoxLayout.addLayout(grid)
+        self.hBoxLayout.addSpacing(16)
+
+    def _on_toggled(self, checked):
+        self.selectionChanged.emit(self.selected())
+
+    def selected(self):
+        return [code for code, checkbox in self.checkboxes.items() if checkbox.isChecked()]
+
+    def setSelected(self, codes):
+        for code, checkbox in self.checkboxes.items():
+            checkbox.blockSignals(True)
+            checkbox.setChecked(code in codes)
+            checkbox.blockSignals(False)
+
+    def setExcluded(self, excluded_codes):
+        for code, checkbox in self.checkboxes.items():
+            checkbox.setEnabled(code not in excluded_codes)
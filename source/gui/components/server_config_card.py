@@ -152,3 +152,30 @@ class ServerConfigCard(SettingCard):
             
     def setValue(self, value):
         self.urlEdit.setText(value)
+
+class AdditionalServersCard(SettingCard):
+    def __init__(self, config, save_func=None, parent=None):
+        super().__init__(FluentIcon.GLOBE, "Additional Servers", "Comma-separated fallback URLs, used when the main server is slow or down", parent)
+        self.config = config
+        self.save_func = save_func
+
+        self.urlsEdit = LineEdit(self)
+        self.urlsEdit.setPlaceholderText("http://192.168.1.20:5000/translate")
+        self.urlsEdit.setText(", ".join(self.config.get("libretranslate_urls", [])))
+        self.urlsEdit.setFixedWidth(450)
+        self.urlsEdit.editingFinished.connect(self._on_urls_changed)
+
+        self.hBoxLayout.addWidget(self.urlsEdit, 0, QtCore.Qt.AlignmentFlag.AlignRight)
+        self.hBoxLayout.addSpacing(16)
+
+    def _on_urls_changed(self):
+        urls = [url.strip() for url in self.urlsEdit.text().split(",") if url.strip()]
+        if urls == self.config.get("libretranslate_urls", []):
+            return
+        logger.info(f"Additional LibreTranslate servers changed to {urls}")
+        self.config["libretranslate_urls"] = urls
+        if self.save_func:
+            self.save_func()
+
+    def setValue(self, urls):
+        self.urlsEdit.setText(", ".join(urls))
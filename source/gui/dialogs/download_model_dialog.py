@@ -6,8 +6,12 @@ import logging
 logger = logging.getLogger("GUI.DownloadDialog")
 
 class DownloadModelDialog(MessageBoxBase):
-    def __init__(self, parent=None, fixed_source_lang=None):
+    def __init__(self, parent=None, fixed_source_lang=None, install_queue=None, catalog=None, installed=None, quantization="int8"):
         super().__init__(parent)
+        self.install_queue = install_queue
+        self.catalog = catalog
+        self.installed = installed or {}
+        self.quantization = quantization
         self.setWindowTitle("Download Model")
         self.fixed_source_lang = fixed_source_lang.lower().strip() if fixed_source_lang else None
         self.titleLabel = SubtitleLabel("Download Helsinki-NLP Model", self)
@@ -38,6 +42,21 @@ class DownloadModelDialog(MessageBoxBase):
         self.warningLabel.setVisible(False)
         self.viewLayout.addWidget(self.warningLabel)
         
+        self.detailsLabel = BodyLabel("", self)
+        self.detailsLabel.setWordWrap(True)
+        self.viewLayout.addWidget(self.detailsLabel)
+        
+        self.queueLabel = BodyLabel("", self)
+        self.queueLabel.setWordWrap(True)
+        self.queueLabel.setVisible(False)
+        self.viewLayout.addWidget(self.queueLabel)
+        if self.install_queue:
+            self.install_queue.progress_signal.connect(self._on_install_progress)
+            self.install_queue.status_signal.connect(self._on_install_status)
+            pending = self.install_queue.pending()
+            if pending:
+                self._on_install_status(pending[0], f"Installing: {', '.join(name.split('/')[-1] for name in pending)}")
+        
         self.widget.setMinimumWidth(400)
         
         self.yesButton.setText("Download")
@@ -47,6 +66,26 @@ class DownloadModelDialog(MessageBoxBase):
         
         self._init_languages()
 
+    def _on_install_progress(self, model_name, done, total):
+        percent = int(done * 100 / total) if total else 0
+        self._on_install_status(model_name, f"Downloading {model_name.split('/')[-1]}: {percent}% ({done / 1e6:.1f} of {total / 1e6:.1f} MB)")
+
+    def _on_install_status(self, model_name, message):
+        self.queueLabel.setText(message)
+        self.queueLabel.setVisible(True)
+
+    def done(self, result):
+        if self.install_queue:
+            self.install_queue.progress_signal.disconnect(self._on_install_progress)
+            self.install_queue.status_signal.disconnect(self._on_install_status)
+            self.install_queue = None
+        super().done(result)
+
+    def _available_targets(self, src_code):
+        if not self.catalog:
+            return set(TARGET_LANGUAGES)
+        return self.catalog.targets_for(src_code)
+
     def _init_languages(self):
         languages = TARGET_LANGUAGES
         
@@ -54,7 +93,8 @@ class DownloadModelDialog(MessageBoxBase):
         
         if not self.fixed_source_lang:
             for code, name in sorted_langs:
-                self.sourceCombo.addItem(name, code)
+                if self._available_targets(code) & set(languages):
+                    self.sourceCombo.addItem(name, code)
             
             self.sourceCombo.currentIndexChanged.connect(self._update_target_combo)
             
@@ -75,11 +115,19 @@ class DownloadModelDialog(MessageBoxBase):
             
         languages = TARGET_LANGUAGES
         sorted_langs = sorted(languages.items(), key=lambda x: x[1])
+        available = self._available_targets(str(src_code).lower().strip())
         
         for code, name in sorted_langs:
-            if str(code).lower().strip() == str(src_code).lower().strip():
+            if str(code).lower().strip() == str(src_code).lower().strip() or code not in available:
                 continue
             self.targetCombo.addItem(name, code)
+        
+        self.yesButton.setEnabled(self.targetCombo.count() > 0)
+        if self.targetCombo.count() == 0:
+            self.warningLabel.setText(f"No Helsinki-NLP models are available for {str(src_code).upper()}. Use the LibreTranslate engine for this language.")
+            self.warningLabel.setVisible(True)
+            self.detailsLabel.setText("")
+            return
             
         if current_target and current_target != src_code:
             idx = self.targetCombo.findData(current_target)
@@ -111,13 +159,33 @@ class DownloadModelDialog(MessageBoxBase):
         
         if not src or not tgt:
             self.warningLabel.setVisible(False)
+            self.detailsLabel.setText("")
             return
-            
-        if src != "en" and tgt != "en":
-            self.warningLabel.setText(f"Warning: Direct translation models for {src.upper()}-{tgt.upper()} often do not exist. If the download fails, please try using the LibreTranslate engine instead.")
+        
+        if not self.catalog:
+            self.detailsLabel.setText("")
+            if src != "en" and tgt != "en":
+                self.warningLabel.setText(f"Note: Direct translation models for {src.upper()}-{tgt.upper()} often do not exist. If there is none, Voxlay installs {src.upper()}-EN and EN-{tgt.upper()} and translates through English.")
+                self.warningLabel.setVisible(True)
+            else:
+                self.warningLabel.setVisible(False)
+            return
+        
+        route = self.catalog.route(src, tgt) or []
+        if len(route) == 2:
+            self.warningLabel.setText(f"There is no direct {src.upper()}-{tgt.upper()} model. Voxlay installs {src.upper()}-EN and EN-{tgt.upper()} and translates through English.")
             self.warningLabel.setVisible(True)
         else:
             self.warningLabel.setVisible(False)
+        
+        missing = [repo_id for repo_id in route if repo_id.replace("/", "_") not in self.installed]
+        estimate = self.catalog.estimate(route, self.quantization, self.installed.values())
+        download = f"{self.catalog.download_mb(missing)} MB download" if missing else "already downloaded"
+        load = f"{estimate['load_ms'] / 1000:.1f} s" if estimate["load_ms"] >= 100 else f"{estimate['load_ms']} ms"
+        self.detailsLabel.setText(
+            f"{', '.join(route)}\n{download}, about {estimate['installed_mb']} MB installed as {self.quantization}, "
+            f"loads in about {load}{'' if estimate['calibrated'] else ' (estimated)'}"
+        )
 
     def get_model_name(self):
         if self.fixed_source_lang:
@@ -139,5 +207,8 @@ class DownloadModelDialog(MessageBoxBase):
         if not src: src = "en"
         if not tgt: 
             return None
+        
+        if self.catalog and self.catalog.direct(src, tgt):
+            return self.catalog.direct(src, tgt)
             
         return f"Helsinki-NLP/opus-mt-{src}-{tgt}"
@@ -84,6 +84,21 @@ class BehaviorInterface(ScrollArea):
         
         timingGroup.addSettingCard(self.silenceCard)
         
+        self.latencyCard = RangeSettingCard(
+            BridgeConfigItem(DEFAULT_CONFIG_STRUCT["target_latency_ms"], []),
+            FIF.SPEED_HIGH,
+            "Target Translation Latency",
+            "Auto decoding picks the best quality that fits this budget (ms)",
+            timingGroup
+        )
+        self.latencyCard.configItem.range = [50, 1000]
+        if hasattr(self.latencyCard, 'slider'):
+             self.latencyCard.slider.setRange(50, 1000)
+
+        self.latencyCard.setValue(self.config.get("target_latency_ms", 150))
+        self.latencyCard.valueChanged.connect(self.change_target_latency)
+        timingGroup.addSettingCard(self.latencyCard)
+        
         layout.addWidget(timingGroup)
         
         layout.addWidget(TitleLabel("Manual Control"))
@@ -122,6 +137,12 @@ class BehaviorInterface(ScrollArea):
         if self.save_func:
             self.save_func()
 
+    def change_target_latency(self, value):
+        logger.info(f"Changed target translation latency to: {value}ms")
+        self.config["target_latency_ms"] = value
+        if self.save_func:
+            self.save_func()
+
     def change_initial_silence_slider(self, value):
         float_val = value / 10.0
         logger.info(f"Changed initial silence timeout to: {float_val}s")
@@ -134,3 +155,4 @@ class BehaviorInterface(ScrollArea):
         self.phraseTimeCard.setValue(self.config.get("phrase_time_limit", 30))
         init_val = int(round(self.config.get("initial_silence_timeout", 1.5) * 10))
         self.silenceCard.setValue(init_val)
+        self.latencyCard.setValue(self.config.get("target_latency_ms", 150))
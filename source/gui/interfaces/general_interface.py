@@ -1,14 +1,19 @@
 from PyQt6 import QtWidgets, QtCore
 from ..common_widgets import (
     ScrollArea, SettingCardGroup, ComboBoxSettingCard, 
-    PushSettingCard, SubtitleLabel, LineEdit, FluentIcon as FIF,
+    PushSettingCard, SwitchSettingCard, SubtitleLabel, LineEdit, FluentIcon as FIF,
     InfoBar, InfoBarPosition, TitleLabel
 )
 from ..components.bridge_config_item import BridgeConfigItem
-from ..components.server_config_card import ServerConfigCard
+from ..components.server_config_card import ServerConfigCard, AdditionalServersCard
+from ..components.language_checklist_card import LanguageChecklistCard
 from ..dialogs.download_model_dialog import DownloadModelDialog
-from ..workers.model_installer import ModelInstallerThread
-from core.constants import DEFAULT_CONFIG_STRUCT, SOURCE_LANGUAGES, TARGET_LANGUAGES, TRANSLATOR_ENGINES, DEFAULT_CTRANSLATE2_MODEL_DIR
+from ..workers.model_installer import ModelInstallQueue, ModelBundleThread
+from core.constants import (
+    DEFAULT_CONFIG_STRUCT, SOURCE_LANGUAGES, TARGET_LANGUAGES, TRANSLATOR_ENGINES,
+    DEFAULT_CTRANSLATE2_MODEL_DIR, CTRANSLATE2_COMPUTE_TYPES, DECODING_PROFILES,
+    DEFAULT_LOCAL_SERVER_PORT
+)
 import logging
 import threading
 import shutil
@@ -34,6 +39,12 @@ class GeneralInterface(ScrollArea):
         self.view.setObjectName('view')
         self.setObjectName('GeneralInterface')
         
+        self.install_queue = ModelInstallQueue(DEFAULT_CTRANSLATE2_MODEL_DIR, self)
+        self.install_queue.progress_signal.connect(self.on_install_progress)
+        self.install_queue.status_signal.connect(self.on_install_status)
+        self.install_queue.queue_changed_signal.connect(self.on_install_queue_changed)
+        self.install_queue.finished_signal.connect(self.on_download_finished)
+        
         self._init_ui()
 
     def _init_ui(self):
@@ -107,6 +118,27 @@ class GeneralInterface(ScrollArea):
         self.targetLangCard.comboBox.currentIndexChanged.connect(self.change_target_language)
         langGroup.addSettingCard(self.targetLangCard)
         
+        self.extraTargetsCard = LanguageChecklistCard(
+            "Additional Target Languages",
+            "Also translate each utterance into these languages",
+            TARGET_LANGUAGES,
+            self.config.get("additional_target_languages", []),
+            self.view
+        )
+        self.extraTargetsCard.selectionChanged.connect(self.change_additional_targets)
+        langGroup.addSettingCard(self.extraTargetsCard)
+        
+        self.conversationCard = SwitchSettingCard(
+            FIF.CHAT,
+            "Conversation Mode",
+            "Translate both ways between the two languages; each utterance is routed by the language it is spoken in (additional targets are ignored)",
+            BridgeConfigItem(self.config.get("conversation_mode", False), []),
+            self.view
+        )
+        self.conversationCard.setChecked(self.config.get("conversation_mode", False))
+        self.conversationCard.checkedChanged.connect(self.toggle_conversation_mode)
+        langGroup.addSettingCard(self.conversationCard)
+        
         src_lang_prefix = src_lang.split("-")[0].lower()
         self._update_target_language_options(src_lang_prefix)
         self._update_source_language_options_libretranslate(tgt_lang)
@@ -146,6 +178,27 @@ class GeneralInterface(ScrollArea):
         self.downloadModelCard.clicked.connect(self.show_download_dialog)
         engineGroup.addSettingCard(self.downloadModelCard)
         
+        self.cancelDownloadCard = PushSettingCard(
+            "Cancel",
+            FIF.CANCEL,
+            "Cancel Downloads",
+            "Stop the running installs; finished files are kept and resumed next time",
+            parent=self.view
+        )
+        self.cancelDownloadCard.clicked.connect(lambda: self.install_queue.cancel())
+        self.cancelDownloadCard.setVisible(False)
+        engineGroup.addSettingCard(self.cancelDownloadCard)
+        
+        self.importBundleCard = PushSettingCard(
+            "Import Bundle",
+            FIF.FOLDER_ADD,
+            "Import Model Bundle",
+            "Install a model exported from another Voxlay installation, no download or conversion needed",
+            parent=self.view
+        )
+        self.importBundleCard.clicked.connect(self.import_model_bundle)
+        engineGroup.addSettingCard(self.importBundleCard)
+        
         self.modelCard = ComboBoxSettingCard(
             BridgeConfigItem(DEFAULT_CONFIG_STRUCT["ctranslate2_model"], [""]),
             FIF.FOLDER,
@@ -157,6 +210,70 @@ class GeneralInterface(ScrollArea):
         self.modelCard.comboBox.currentIndexChanged.connect(self.change_ctranslate2_model)
         engineGroup.addSettingCard(self.modelCard)
         
+        self.computeTypeCard = ComboBoxSettingCard(
+            BridgeConfigItem(DEFAULT_CONFIG_STRUCT["ctranslate2_compute_type"], list(CTRANSLATE2_COMPUTE_TYPES.keys())),
+            FIF.SPEED_HIGH,
+            "Compute Type",
+            "Selected automatically at first model load",
+            list(CTRANSLATE2_COMPUTE_TYPES.values()),
+            self.view
+        )
+        
+        for i, (code, name) in enumerate(CTRANSLATE2_COMPUTE_TYPES.items()):
+            self.computeTypeCard.comboBox.setItemData(i, code)
+        
+        current_compute_type = self.config.get("ctranslate2_compute_type", "auto")
+        for i in range(self.computeTypeCard.comboBox.count()):
+            if self.computeTypeCard.comboBox.itemData(i) == current_compute_type:
+                self.computeTypeCard.comboBox.setCurrentIndex(i)
+                break
+        
+        self.computeTypeCard.comboBox.currentIndexChanged.connect(self.change_compute_type)
+        engineGroup.addSettingCard(self.computeTypeCard)
+        
+        self.decodingProfileCard = ComboBoxSettingCard(
+            BridgeConfigItem(DEFAULT_CONFIG_STRUCT["decoding_profile"], list(DECODING_PROFILES.keys())),
+            FIF.SPEED_HIGH,
+            "Decoding Profile",
+            "Trade translation quality for speed (Auto follows the target latency)",
+            list(DECODING_PROFILES.values()),
+            self.view
+        )
+        
+        for i, (code, name) in enumerate(DECODING_PROFILES.items()):
+            self.decodingProfileCard.comboBox.setItemData(i, code)
+        
+        current_profile = self.config.get("decoding_profile", "auto")
+        for i in range(self.decodingProfileCard.comboBox.count()):
+            if self.decodingProfileCard.comboBox.itemData(i) == current_profile:
+                self.decodingProfileCard.comboBox.setCurrentIndex(i)
+                break
+        
+        self.decodingProfileCard.comboBox.currentIndexChanged.connect(self.change_decoding_profile)
+        engineGroup.addSettingCard(self.decodingProfileCard)
+        
+        self.localServerCard = SwitchSettingCard(
+            FIF.GLOBE,
+            "Local Translation Server",
+            self._local_server_description(),
+            BridgeConfigItem(self.config.get("local_server_enabled", False), []),
+            self.view
+        )
+        self.localServerCard.setChecked(self.config.get("local_server_enabled", False))
+        self.localServerCard.checkedChanged.connect(self.toggle_local_server)
+        engineGroup.addSettingCard(self.localServerCard)
+        
+        self.workerProcessCard = SwitchSettingCard(
+            FIF.DEVELOPER_TOOLS,
+            "Separate Translation Process",
+            "Run CTranslate2 in a child process so translation never stalls the overlay or audio capture (applies to the next translation)",
+            BridgeConfigItem(self.config.get("ctranslate2_worker_mode", "thread") == "process", []),
+            self.view
+        )
+        self.workerProcessCard.setChecked(self.config.get("ctranslate2_worker_mode", "thread") == "process")
+        self.workerProcessCard.checkedChanged.connect(self.toggle_worker_process)
+        engineGroup.addSettingCard(self.workerProcessCard)
+        
         layout.addWidget(engineGroup)
 
         self.manageModelsTitle = TitleLabel("Manage Models")
@@ -169,12 +286,136 @@ class GeneralInterface(ScrollArea):
         self.serverGroup = SettingCardGroup("", self.view)
         self.serverCard = ServerConfigCard(self.config, self.save_func, self.view)
         self.serverGroup.addSettingCard(self.serverCard)
+        self.additionalServersCard = AdditionalServersCard(self.config, self.save_func, self.view)
+        self.serverGroup.addSettingCard(self.additionalServersCard)
         
         layout.addWidget(self.serverGroup)
         
+        layout.addWidget(TitleLabel("Translation Memory"))
+        memoryGroup = SettingCardGroup("", self.view)
+        
+        self.importMemoryCard = PushSettingCard(
+            "Import TMX",
+            FIF.DOWNLOAD,
+            "Import Translation Memory",
+            "Add translations from a TMX file",
+            parent=self.view
+        )
+        self.importMemoryCard.clicked.connect(self.import_translation_memory)
+        memoryGroup.addSettingCard(self.importMemoryCard)
+        
+        self.exportMemoryCard = PushSettingCard(
+            "Export TMX",
+            FIF.SAVE,
+            "Export Translation Memory",
+            "Save remembered translations to a TMX file",
+            parent=self.view
+        )
+        self.exportMemoryCard.clicked.connect(self.export_translation_memory)
+        memoryGroup.addSettingCard(self.exportMemoryCard)
+        
+        layout.addWidget(memoryGroup)
+        
         layout.addStretch(1)
         self.update_visibility()
 
+    def _local_server_description(self):
+        port = self.config.get("local_server_port", DEFAULT_LOCAL_SERVER_PORT)
+        return f"Serve installed models over a LibreTranslate-compatible API at http://127.0.0.1:{port}"
+
+    def toggle_local_server(self, is_checked):
+        from engines.libretranslate_server import get_local_server
+        logger.info(f"Toggled local translation server: {is_checked}")
+        self.config["local_server_enabled"] = is_checked
+        if self.save_func:
+            self.save_func()
+        server = get_local_server(self.config, self.config.get("local_server_port", DEFAULT_LOCAL_SERVER_PORT))
+        if not is_checked:
+            server.stop()
+        elif not server.start():
+            InfoBar.error(
+                title="Server Not Started",
+                content=f"Could not listen on {server.url}. Is the port already in use?",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=5000,
+                parent=self.window()
+            )
+
+    def toggle_conversation_mode(self, is_checked):
+        logger.info(f"Conversation mode {'enabled' if is_checked else 'disabled'}")
+        self.config["conversation_mode"] = is_checked
+        if self.save_func:
+            self.save_func()
+
+    def toggle_worker_process(self, is_checked):
+        mode = "process" if is_checked else "thread"
+        logger.info(f"Changed CTranslate2 worker mode to: {mode}")
+        self.config["ctranslate2_worker_mode"] = mode
+        if self.save_func:
+            self.save_func()
+
+    def _get_translation_memory(self):
+        from engines.translation_memory import get_translation_memory
+        from core.config_handler import config_handler
+        db_path = config_handler.config_dir / "translation_memory.sqlite3" if config_handler.config_dir else None
+        return get_translation_memory(db_path)
+
+    def import_translation_memory(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self.window(), "Import TMX", "", "TMX files (*.tmx);;All files (*)")
+        if not path:
+            return
+        try:
+            count = self._get_translation_memory().import_tmx(path)
+            InfoBar.success(
+                title="Translation Memory Imported",
+                content=f"Imported {count} translations.",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=3000,
+                parent=self.window()
+            )
+        except Exception as e:
+            logger.error(f"Error importing TMX {path}: {e}")
+            InfoBar.error(
+                title="Import Failed",
+                content=f"Could not import TMX file: {e}",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=5000,
+                parent=self.window()
+            )
+
+    def export_translation_memory(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self.window(), "Export TMX", "voxlay.tmx", "TMX files (*.tmx)")
+        if not path:
+            return
+        try:
+            count = self._get_translation_memory().export_tmx(path)
+            InfoBar.success(
+                title="Translation Memory Exported",
+                content=f"Exported {count} translations to {path}.",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=3000,
+                parent=self.window()
+            )
+        except Exception as e:
+            logger.error(f"Error exporting TMX {path}: {e}")
+            InfoBar.error(
+                title="Export Failed",
+                content=f"Could not export TMX file: {e}",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=5000,
+                parent=self.window()
+            )
+
     def refresh_models(self):
         from engines import ctranslate2_engine
         from core.constants import DEFAULT_CTRANSLATE2_MODEL_DIR
@@ -220,6 +461,36 @@ class GeneralInterface(ScrollArea):
         finally:
             self.modelCard.comboBox.blockSignals(False)
             self._update_model_management_list()
+            self._update_compute_type_status()
+
+    def _update_compute_type_status(self):
+        from engines import ctranslate2_engine
+        model_name = self.config.get("ctranslate2_model", "")
+        if not model_name:
+            self.computeTypeCard.setContent("Select a model to see the compute type in use")
+            return
+        try:
+            translator = ctranslate2_engine.get_translator(DEFAULT_CTRANSLATE2_MODEL_DIR)
+            compute_type, source = translator.get_selected_compute_type(model_name)
+        except Exception as e:
+            logger.error(f"Error reading compute type: {e}")
+            return
+        
+        if source == "configured":
+            self.computeTypeCard.setContent(f"Using {compute_type} (set manually)")
+        elif source == "measured":
+            self.computeTypeCard.setContent(f"Using {compute_type} (fastest measured on this CPU)")
+        else:
+            self.computeTypeCard.setContent("Will be measured at first model load")
+
+    def change_compute_type(self):
+        code = self.computeTypeCard.comboBox.currentData()
+        logger.info(f"Changed CTranslate2 compute type to: {code}")
+        self.config["ctranslate2_compute_type"] = code
+        self.config["ctranslate2_compute_type_user_set"] = code != "auto"
+        if self.save_func:
+            self.save_func()
+        self._update_compute_type_status()
 
     def _update_model_management_list(self):
         while self.manageModelsGroup.viewLayout.count():
@@ -242,8 +513,20 @@ class GeneralInterface(ScrollArea):
                     
                     name_label = QtWidgets.QLabel(model_name)
                     item_layout.addWidget(name_label)
+                    
+                    info = translator.get_model_info(model_name)
+                    if info:
+                        details = "pivot via " + ", ".join(info["legs"]) if info["pivot"] else f"{info['size_bytes'] / 1e6:.0f} MB, {info['compute_type'] or 'unknown type'}"
+                        details_label = QtWidgets.QLabel(f"({details})")
+                        details_label.setStyleSheet("color: gray;")
+                        item_layout.addWidget(details_label)
                     item_layout.addStretch()
                     
+                    export_btn = QtWidgets.QPushButton("Export")
+                    export_btn.setFixedWidth(80)
+                    export_btn.clicked.connect(lambda checked, m=model_name: self.export_model_bundle(m))
+                    item_layout.addWidget(export_btn)
+                    
                     del_btn = QtWidgets.QPushButton("Delete")
                     del_btn.setFixedWidth(80)
                     del_btn.setStyleSheet("background-color: #c42b1c; color: white;")
@@ -254,6 +537,52 @@ class GeneralInterface(ScrollArea):
         except Exception as e:
             logger.error(f"Error updating management list: {e}")
 
+    def import_model_bundle(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self.window(), "Import Model Bundle", "", "Model bundles (*.tar.gz);;All files (*)")
+        if not path:
+            return
+        self.importBundleCard.setEnabled(False)
+        self.importBundleCard.setContent("Importing... Please wait.")
+        self.bundle_thread = ModelBundleThread(DEFAULT_CTRANSLATE2_MODEL_DIR, import_path=path)
+        self.bundle_thread.finished_signal.connect(self.on_bundle_finished)
+        self.bundle_thread.start()
+
+    def export_model_bundle(self, model_name):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self.window(), "Export Model Bundle", f"{model_name}.tar.gz", "Model bundles (*.tar.gz)")
+        if not path:
+            return
+        self.importBundleCard.setEnabled(False)
+        self.importBundleCard.setContent(f"Exporting {model_name}... Please wait.")
+        self.bundle_thread = ModelBundleThread(DEFAULT_CTRANSLATE2_MODEL_DIR, export_model=model_name, export_path=path)
+        self.bundle_thread.finished_signal.connect(self.on_bundle_finished)
+        self.bundle_thread.start()
+
+    def on_bundle_finished(self, success, message):
+        self.importBundleCard.setEnabled(True)
+        self.importBundleCard.setContent("Install a model exported from another Voxlay installation, no download or conversion needed")
+        if success:
+            InfoBar.success(
+                title="Model Bundle",
+                content=f"Done: {message}",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=5000,
+                parent=self.window()
+            )
+            self.refresh_models()
+        else:
+            logger.error(f"Model bundle operation failed: {message}")
+            InfoBar.error(
+                title="Model Bundle Failed",
+                content=message,
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=10000,
+                parent=self.window()
+            )
+
     def delete_model(self, model_name):
         from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
@@ -312,9 +641,23 @@ class GeneralInterface(ScrollArea):
             logger.info(f"Updated config['ctranslate2_model'] to: {model}")
             if self.save_func:
                 self.save_func()
+            self._update_compute_type_status()
         else:
             logger.warning("change_ctranslate2_model called with empty model data/text")
 
+    def change_additional_targets(self, codes):
+        logger.info(f"Changed additional target languages to: {codes}")
+        self.config["additional_target_languages"] = codes
+        if self.save_func:
+            self.save_func()
+
+    def change_decoding_profile(self):
+        code = self.decodingProfileCard.comboBox.currentData()
+        logger.info(f"Changed decoding profile to: {code}")
+        self.config["decoding_profile"] = code
+        if self.save_func:
+            self.save_func()
+
     def change_target_language(self):
         code = self.targetLangCard.comboBox.currentData()
         logger.info(f"Changed target language to: {code}")
@@ -398,7 +741,13 @@ class GeneralInterface(ScrollArea):
             self.sourceLangCardLibreTranslate.setVisible(True)
             self.sourceLangCardCTranslate2.setVisible(False)
             self.modelCard.setVisible(False)
+            self.computeTypeCard.setVisible(False)
+            self.decodingProfileCard.setVisible(False)
+            self.localServerCard.setVisible(False)
+            self.workerProcessCard.setVisible(False)
             self.downloadModelCard.setVisible(False)
+            self.cancelDownloadCard.setVisible(False)
+            self.importBundleCard.setVisible(False)
             self.manageModelsTitle.setVisible(False)
             self.manageModelsGroup.setVisible(False)
             self.manageModelsGroup.setVisible(False)
@@ -410,11 +759,35 @@ class GeneralInterface(ScrollArea):
             self.sourceLangCardLibreTranslate.setVisible(False)
             self.sourceLangCardCTranslate2.setVisible(True)
             self.modelCard.setVisible(True)
+            self.computeTypeCard.setVisible(True)
+            self.decodingProfileCard.setVisible(True)
+            self.localServerCard.setVisible(True)
+            self.workerProcessCard.setVisible(True)
             self.downloadModelCard.setVisible(True)
+            self.cancelDownloadCard.setVisible(self.install_queue.is_busy())
+            self.importBundleCard.setVisible(True)
             self.manageModelsTitle.setVisible(True)
             self.manageModelsGroup.setVisible(True)
             self.sourceLangCard = self.sourceLangCardCTranslate2
             self.refresh_models()
+        elif engine == "fastest":
+            self.serverTitle.setVisible(True)
+            self.serverGroup.setVisible(True)
+            self.targetLangCard.setVisible(True)
+            self.sourceLangCardLibreTranslate.setVisible(True)
+            self.sourceLangCardCTranslate2.setVisible(False)
+            self.modelCard.setVisible(False)
+            self.computeTypeCard.setVisible(True)
+            self.decodingProfileCard.setVisible(True)
+            self.localServerCard.setVisible(False)
+            self.workerProcessCard.setVisible(True)
+            self.downloadModelCard.setVisible(True)
+            self.cancelDownloadCard.setVisible(self.install_queue.is_busy())
+            self.importBundleCard.setVisible(True)
+            self.manageModelsTitle.setVisible(True)
+            self.manageModelsGroup.setVisible(True)
+            self.sourceLangCard = self.sourceLangCardLibreTranslate
+            self.refresh_models()
         else:
             self.serverTitle.setVisible(False)
             self.serverGroup.setVisible(False)
@@ -422,7 +795,13 @@ class GeneralInterface(ScrollArea):
             self.sourceLangCardLibreTranslate.setVisible(True)
             self.sourceLangCardCTranslate2.setVisible(False)
             self.modelCard.setVisible(False)
+            self.computeTypeCard.setVisible(False)
+            self.decodingProfileCard.setVisible(False)
+            self.localServerCard.setVisible(False)
+            self.workerProcessCard.setVisible(False)
             self.downloadModelCard.setVisible(False)
+            self.cancelDownloadCard.setVisible(False)
+            self.importBundleCard.setVisible(False)
             self.manageModelsTitle.setVisible(False)
             self.manageModelsGroup.setVisible(False)
             self.sourceLangCard = self.sourceLangCardLibreTranslate
@@ -482,13 +861,23 @@ class GeneralInterface(ScrollArea):
                 break
                 
         self.serverCard.setValue(self.config.get("libretranslate_url", "http://localhost:5000/translate"))
+        self.additionalServersCard.setValue(self.config.get("libretranslate_urls", []))
 
     def show_download_dialog(self):
         from engines import ctranslate2_engine
         current_source = self.config.get("source_language", "pl-PL")
         fixed_src = current_source.replace("_", "-").split("-")[0].lower().strip()
         
-        dialog = DownloadModelDialog(self.window(), fixed_source_lang=fixed_src)
+        from engines.model_catalog import get_catalog
+        from core.config_handler import config_handler
+        translator = ctranslate2_engine.get_translator(DEFAULT_CTRANSLATE2_MODEL_DIR)
+        installed = {name: translator.get_model_info(name) for name in translator.list_models()}
+        quantization = ctranslate2_engine.conversion_quantization(self.config.get("ctranslate2_compute_type"))
+        
+        dialog = DownloadModelDialog(
+            self.window(), fixed_source_lang=fixed_src, install_queue=self.install_queue,
+            catalog=get_catalog(config_handler.config_dir), installed=installed, quantization=quantization
+        )
         if dialog.exec():
             model_name = dialog.get_model_name()
             
@@ -511,12 +900,10 @@ class GeneralInterface(ScrollArea):
                     )
                     return
 
-            translator = ctranslate2_engine.get_translator(DEFAULT_CTRANSLATE2_MODEL_DIR)
-            installed_models = translator.list_models()
             safe_name = model_name.replace("/", "_")
-            legacy_name = model_name.split("/")[-1]
+            src, tgt = ctranslate2_engine.parse_model_pair(model_name)
             
-            if safe_name in installed_models or legacy_name in installed_models:
+            if safe_name in installed or translator.registry.resolve(src, tgt):
                 InfoBar.warning(
                     title="Model Already Installed",
                     content=f"The model '{model_name}' is already installed.",
@@ -528,26 +915,54 @@ class GeneralInterface(ScrollArea):
                 )
                 return
 
+            if model_name in self.install_queue.pending():
+                InfoBar.warning(
+                    title="Already Downloading",
+                    content=f"The model '{model_name}' is already in the download queue.",
+                    orient=QtCore.Qt.Orientation.Horizontal,
+                    isClosable=True,
+                    position=InfoBarPosition.TOP_RIGHT,
+                    duration=3000,
+                    parent=self.window()
+                )
+                return
+
             logger.info(f"User requested download of model: {model_name}")
             self.start_model_download(model_name)
 
     def start_model_download(self, model_name):
-        self.downloadModelCard.setEnabled(False)
-        self.modelCard.setEnabled(False)
-        self.downloadModelCard.setContent("Downloading... Please wait.")
-        self.downloadModelCard.button.setText("Downloading...")
-        
-        self.installer_thread = ModelInstallerThread(model_name, DEFAULT_CTRANSLATE2_MODEL_DIR)
-        self.installer_thread.finished_signal.connect(self.on_download_finished)
-        self.installer_thread.start()
+        from engines import ctranslate2_engine
+        quantization = ctranslate2_engine.conversion_quantization(self.config.get("ctranslate2_compute_type"))
+        self.install_queue.enqueue(model_name, quantization, self.config.get("model_hub_url") or None)
+
+    def on_install_progress(self, model_name, done, total):
+        percent = int(done * 100 / total) if total else 0
+        self.downloadModelCard.setContent(f"Downloading {model_name.split('/')[-1]}: {percent}% ({done / 1e6:.1f} of {total / 1e6:.1f} MB)")
+
+    def on_install_status(self, model_name, message):
+        self.downloadModelCard.setContent(message)
+
+    def on_install_queue_changed(self, pending):
+        engine = self.config.get("translator_engine", "libretranslate_local")
+        self.cancelDownloadCard.setVisible(bool(pending) and engine in ("ctranslate2", "fastest"))
+        if pending:
+            self.downloadModelCard.button.setText(f"Download New Model ({len(pending)} queued)")
+        else:
+            self.downloadModelCard.setContent("Download and install a new Helsinki-NLP model")
+            self.downloadModelCard.button.setText("Download New Model")
 
     def on_download_finished(self, success, message, model_name):
-        self.downloadModelCard.setEnabled(True)
-        self.modelCard.setEnabled(True)
-        self.downloadModelCard.setContent("Download and install a new Helsinki-NLP model")
-        self.downloadModelCard.button.setText("Download New Model")
-        
-        if success:
+        if not success and message == "Cancelled":
+            InfoBar.info(
+                title="Download Cancelled",
+                content=f"Installation of {model_name} was cancelled.",
+                orient=QtCore.Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=3000,
+                parent=self.window()
+            )
+        elif success:
             InfoBar.success(
                 title="Model Installed",
                 content=f"Model {model_name} installed successfully.",
@@ -559,7 +974,7 @@ class GeneralInterface(ScrollArea):
             )
             self.refresh_models()
             
-            safe_name = model_name.replace("/", "_")
+            safe_name = Path(message).name if message else model_name.replace("/", "_")
             
             if not any(self.modelCard.comboBox.itemData(i) == safe_name for i in range(self.modelCard.comboBox.count())):
                  safe_name_legacy = model_name.split("/")[-1]
@@ -10,6 +10,7 @@ logger = logging.getLogger("GUI.Overlay")
 
 class OverlayWindow(QtWidgets.QWidget):
     show_text_signal = QtCore.pyqtSignal(str, bool, bool, int)
+    show_lines_signal = QtCore.pyqtSignal(list, bool, int)
     copy_to_clipboard_signal = QtCore.pyqtSignal(str)
     
     def __init__(self, config):
@@ -25,6 +26,7 @@ class OverlayWindow(QtWidgets.QWidget):
         self.hide_timer.timeout.connect(self.hide_overlay_and_clear_text)
         
         self.show_text_signal.connect(self._on_show_text_signal)
+        self.show_lines_signal.connect(self._on_show_lines_signal)
         self.copy_to_clipboard_signal.connect(self._on_copy_to_clipboard)
         
         self.hide()
@@ -121,6 +123,11 @@ class OverlayWindow(QtWidgets.QWidget):
     def _on_show_text_signal(self, text, is_error, is_final, duration_ms):
         self._show_text_internal(text, is_final, duration_ms)
 
+    @QtCore.pyqtSlot(list, bool, int)
+    def _on_show_lines_signal(self, lines, is_final, duration_ms):
+        text = "\n".join(f"[{lang.upper()}] {line}" for lang, line in lines)
+        self._show_text_internal(text, is_final, duration_ms)
+
     def _show_text_internal(self, text, is_final=True, duration_ms=0):
         if not text:
             self.hide()
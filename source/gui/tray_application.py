@@ -51,6 +51,15 @@ class SystemTrayApp:
 		self.tray_icon.setIcon(icon)
 		
 		self.menu = QtWidgets.QMenu()
+		self.health_action = QtGui.QAction("", self.app)
+		self.health_action.setEnabled(False)
+		self.health_action.setVisible(False)
+		self.menu.addAction(self.health_action)
+		self.translation_health_state = None
+		self.performance_action = QtGui.QAction("", self.app)
+		self.performance_action.setEnabled(False)
+		self.performance_action.setVisible(False)
+		self.menu.addAction(self.performance_action)
 		settings_action = QtGui.QAction("Open Settings", self.app)
 		settings_action.triggered.connect(self.show_settings_window)
 		self.menu.addAction(settings_action)
@@ -95,6 +104,37 @@ class SystemTrayApp:
 			if self.settings_window.updatesInterface and hasattr(self.settings_window.updatesInterface, 'start_update'):
 				self.settings_window.updatesInterface.start_update()
 
+	def update_performance(self, status):
+		self.performance_action.setText(status)
+		self.performance_action.setVisible(True)
+
+	def update_translation_health(self, state, fallbacks):
+		if state == "closed":
+			status = "LibreTranslate: online"
+		elif state == "open":
+			status = "LibreTranslate: unreachable, using CTranslate2"
+		else:
+			status = "LibreTranslate: checking server"
+		if fallbacks:
+			status += f" ({fallbacks} fallback translations)"
+		self.health_action.setText(status)
+		self.health_action.setVisible(True)
+		self.tray_icon.setToolTip(f"{APP_NAME}\n{status}")
+
+		if state != self.translation_health_state and state in ("open", "closed"):
+			if state == "open":
+				message = "LibreTranslate is not responding. Translating with local CTranslate2 models where available."
+			else:
+				message = "LibreTranslate is reachable again."
+			if state == "open" or self.translation_health_state is not None:
+				self.tray_icon.showMessage(
+					"Voxlay",
+					message,
+					QtWidgets.QSystemTrayIcon.MessageIcon.Warning if state == "open" else QtWidgets.QSystemTrayIcon.MessageIcon.Information,
+					3000
+				)
+		self.translation_health_state = state
+
 	def _on_tray_activated(self, reason):
 		if reason in (QtWidgets.QSystemTrayIcon.ActivationReason.Trigger,
 					  QtWidgets.QSystemTrayIcon.ActivationReason.DoubleClick):
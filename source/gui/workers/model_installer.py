@@ -1,14 +1,97 @@
+import threading
+from collections import deque
 from PyQt6 import QtCore
-from engines import ctranslate2_engine
+from engines import model_downloader
+from engines import model_bundle
 
-class ModelInstallerThread(QtCore.QThread):
-    finished_signal = QtCore.pyqtSignal(bool, str, str)
+MAX_PARALLEL_INSTALLS = 2
+
+class ModelBundleThread(QtCore.QThread):
+    finished_signal = QtCore.pyqtSignal(bool, str)
 
-    def __init__(self, model_name, output_dir):
+    def __init__(self, model_dir, export_model=None, export_path=None, import_path=None):
         super().__init__()
-        self.model_name = model_name
-        self.output_dir = output_dir
+        self.model_dir = model_dir
+        self.export_model = export_model
+        self.export_path = export_path
+        self.import_path = import_path
 
     def run(self):
-        success, result = ctranslate2_engine.install_model(self.model_name, self.output_dir)
-        self.finished_signal.emit(success, result, self.model_name)
+        try:
+            if self.import_path:
+                model_name, installed = model_bundle.import_bundle(self.import_path, self.model_dir)
+                self.finished_signal.emit(True, model_name)
+            else:
+                self.finished_signal.emit(True, str(model_bundle.export_model(self.model_dir, self.export_model, self.export_path)))
+        except Exception as e:
+            self.finished_signal.emit(False, str(e))
+
+class ModelInstallQueue(QtCore.QObject):
+    progress_signal = QtCore.pyqtSignal(str, object, object)
+    status_signal = QtCore.pyqtSignal(str, str)
+    finished_signal = QtCore.pyqtSignal(bool, str, str)
+    queue_changed_signal = QtCore.pyqtSignal(list)
+
+    def __init__(self, output_dir, parent=None):
+        super().__init__(parent)
+        self.output_dir = output_dir
+        self.jobs = deque()
+        self.active = {}
+        self.cond = threading.Condition()
+        self.workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(MAX_PARALLEL_INSTALLS)]
+        for worker in self.workers:
+            worker.start()
+
+    def enqueue(self, model_name, quantization, endpoint=None):
+        with self.cond:
+            if model_name in self.active or any(job[0] == model_name for job in self.jobs):
+                return False
+            self.jobs.append((model_name, quantization, endpoint))
+            self.cond.notify()
+        self._emit_queue()
+        return True
+
+    def cancel(self, model_name=None):
+        with self.cond:
+            if model_name is None:
+                self.jobs.clear()
+                events = list(self.active.values())
+            else:
+                self.jobs = deque(job for job in self.jobs if job[0] != model_name)
+                events = [self.active[model_name]] if model_name in self.active else []
+        for event in events:
+            event.set()
+        self._emit_queue()
+
+    def pending(self):
+        with self.cond:
+            return list(self.active) + [job[0] for job in self.jobs]
+
+    def is_busy(self):
+        with self.cond:
+            return bool(self.active or self.jobs)
+
+    def _emit_queue(self):
+        self.queue_changed_signal.emit(self.pending())
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while not self.jobs:
+                    self.cond.wait()
+                model_name, quantization, endpoint = self.jobs.popleft()
+                cancel_event = threading.Event()
+                self.active[model_name] = cancel_event
+            self._emit_queue()
+
+            success, result = model_downloader.install_model_from_hub(
+                model_name, self.output_dir, quantization, endpoint,
+                progress=lambda done, total, name=model_name: self.progress_signal.emit(name, done, total),
+                status=lambda message, name=model_name: self.status_signal.emit(name, message),
+                cancel_event=cancel_event
+            )
+
+            with self.cond:
+                self.active.pop(model_name, None)
+            self.finished_signal.emit(success, result, model_name)
+            self._emit_queue()
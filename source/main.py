@@ -2,18 +2,15 @@ import sys
 import os
 import logging
 import threading
-from PyQt6 import QtWidgets, QtCore, QtGui
+import argparse
+import multiprocessing
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='[%(name)s] %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
 logger = logging.getLogger("Main")
 
+# Spawned worker processes import this module again as __mp_main__, so Qt,
+# the controller and the hotkey backends are only imported from main().
 from core.config_handler import config_handler
-from core.controller import ApplicationController
-from core.constants import APP_NAME, APP_VERSION, OVERLAY_POSITIONS
+from core.constants import APP_NAME, APP_VERSION, OVERLAY_POSITIONS, DEFAULT_CTRANSLATE2_MODEL_DIR
 
 app_controller = None
 
@@ -29,8 +26,31 @@ def register_hotkey_copy_wrapper(hotkey, window):
         return app_controller.register_hotkeys()
     return False
 
+def run_cli(argv):
+    parser = argparse.ArgumentParser(prog=APP_NAME.lower())
+    parser.add_argument("--export-model", nargs=2, metavar=("MODEL", "OUTPUT"), help="Export an installed model into a bundle archive")
+    parser.add_argument("--import-model", nargs="+", metavar="BUNDLE", help="Install models from bundle archives")
+    parser.add_argument("--model-dir", default=DEFAULT_CTRANSLATE2_MODEL_DIR, help="CTranslate2 model directory")
+    parser.add_argument("--overwrite", action="store_true", help="Replace models that are already installed")
+    args, _ = parser.parse_known_args(argv)
+    if not args.export_model and not args.import_model:
+        return None
+
+    from engines import model_bundle
+    try:
+        if args.export_model:
+            model_bundle.export_model(args.model_dir, args.export_model[0], args.export_model[1])
+        for bundle in args.import_model or []:
+            model_bundle.import_bundle(bundle, args.model_dir, overwrite=args.overwrite)
+    except (model_bundle.BundleError, OSError) as e:
+        logger.error(f"Model bundle operation failed: {e}")
+        return 1
+    return 0
+
 def main():
     global app_controller
+    from PyQt6 import QtWidgets, QtCore, QtGui
+    from core.controller import ApplicationController
     logger.info("Initializing application...")
     
     config_handler.load_config()
@@ -94,6 +114,8 @@ def main():
         )
         
         tray.controller = app_controller
+        app_controller.translation_health_signal.connect(tray.update_translation_health)
+        app_controller.performance_signal.connect(tray.update_performance)
     except Exception as e:
         logger.critical(f"Failed to create SystemTrayApp: {e}")
         sys.exit(1)
@@ -106,10 +128,18 @@ def main():
     
     tray.show_settings_window()
 
+    if cfg.get("local_server_enabled", False):
+        from engines.libretranslate_server import get_local_server
+        get_local_server(cfg, cfg.get("local_server_port")).start()
+
     def preload_engines():
         logger.info("Pre-loading translation engines...")
-        from engines import ctranslate2_engine
-        ctranslate2_engine._import_libs()
+        if cfg.get("translator_engine") == "ctranslate2" and cfg.get("ctranslate2_worker_mode") == "process":
+            from engines.translation_process import get_translation_process
+            get_translation_process(cfg.get("ctranslate2_model_dir", "models"))
+        else:
+            from engines import ctranslate2_engine
+            ctranslate2_engine._import_libs()
         logger.info("Translation engines pre-loaded successfully.")
 
     QtCore.QTimer.singleShot(1000, lambda: threading.Thread(target=preload_engines, daemon=True).start())
@@ -117,6 +147,15 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='[%(name)s] %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    exit_code = run_cli(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
     try:
         main()
     except KeyboardInterrupt:
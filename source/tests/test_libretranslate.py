@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+from engines.libretranslate_client import LibreTranslateClient
+from engines.libretranslate_pool import LibreTranslatePool, UNHEALTHY_AFTER_FAILURES
+from utils import libretranslate_stub
+
+@pytest.fixture
+def stub(serve):
+    def start(**kwargs):
+        server = libretranslate_stub.create_server(**kwargs)
+        return server, f"{serve(server)}/translate"
+    return start
+
+@pytest.fixture
+def pools():
+    created = []
+
+    def create(urls, **kwargs):
+        pool = LibreTranslatePool(urls, **kwargs)
+        created.append(pool)
+        return pool
+
+    yield create
+    for pool in created:
+        pool.close()
+
+def test_client_reuses_pooled_connection(stub):
+    server, url = stub()
+    client = LibreTranslateClient(url)
+    for i in range(5):
+        assert client.translate(f"sentence {i}", "en", "pl") == f"[pl] sentence {i}"
+    assert server.requests == 5
+    assert server.connections == 1
+    client.close()
+
+def test_pool_fails_over_to_healthy_endpoint(stub, pools):
+    broken, broken_url = stub(fail_rate=1.0)
+    healthy, healthy_url = stub()
+    pool = pools([broken_url, healthy_url], probe_interval_s=60)
+    for i in range(UNHEALTHY_AFTER_FAILURES):
+        assert pool.translate(f"hello {i}", "en", "de") == f"[de] hello {i}"
+    stats = pool.stats()["endpoints"]
+    assert not stats[broken_url]["healthy"]
+    assert stats[healthy_url]["healthy"]
+
+    requests_before = broken.requests
+    assert pool.translate("hello again", "en", "de") == "[de] hello again"
+    assert broken.requests == requests_before
+
+def test_hedge_answers_without_waiting_for_stalled_primary(stub, pools):
+    _, slow_url = stub(delay_ms=2000)
+    _, fast_url = stub()
+    pool = pools([slow_url, fast_url], probe_interval_s=60)
+    start = time.perf_counter()
+    assert pool.translate("hedged", "en", "pl") == "[pl] hedged"
+    assert time.perf_counter() - start < 1.5
+    stats = pool.stats()
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+
+def test_no_hedge_when_disabled(stub, pools):
+    _, slow_url = stub(delay_ms=500)
+    fast, fast_url = stub()
+    pool = pools([slow_url, fast_url], probe_interval_s=60)
+    assert pool.translate("single", "en", "pl", hedge=False) == "[pl] single"
+    assert pool.stats()["hedges"] == 0
+    assert fast.requests == 0
+
+def test_segments_keep_their_order_across_endpoints(stub, pools):
+    servers = [stub(delay_ms=delay) for delay in (60, 5, 30)]
+    pool = pools([url for _, url in servers], probe_interval_s=60)
+    segments = [f"Segment number {i}." for i in range(9)]
+    assert pool.translate_segments(segments, "en", "pl") == [f"[pl] {s}" for s in segments]
+    assert all(server.requests == 1 for server, _ in servers)
+
+def test_failed_chunk_is_retried_in_place(stub, pools):
+    _, broken_url = stub(fail_rate=1.0)
+    _, healthy_url = stub()
+    pool = pools([broken_url, healthy_url], probe_interval_s=60)
+    segments = [f"Segment number {i}." for i in range(6)]
+    assert pool.translate_segments(segments, "en", "pl") == [f"[pl] {s}" for s in segments]
@@ -0,0 +1,111 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engines import model_downloader
+from engines.model_downloader import RepoDownload, ChecksumMismatch, DownloadCancelled
+from engines.ctranslate2_engine import pivot_model_dir_name, PIVOT_MANIFEST
+from utils import model_hub_stub
+
+REPO_ID = "Helsinki-NLP/opus-mt-en-de"
+WEIGHTS = os.urandom(3 * model_downloader.CHUNK_SIZE + 123)
+
+@pytest.fixture
+def hub(tmp_path, serve):
+    repo_dir = tmp_path / "hub" / REPO_ID
+    repo_dir.mkdir(parents=True)
+    (repo_dir / "pytorch_model.bin").write_bytes(WEIGHTS)
+    (repo_dir / "config.json").write_text('{"model_type": "marian"}')
+    return serve(model_hub_stub.create_server(tmp_path / "hub"))
+
+@pytest.fixture
+def pivot_hub(tmp_path, serve):
+    for repo_id in ("Helsinki-NLP/opus-mt-pl-en", "Helsinki-NLP/opus-mt-en-it", "Helsinki-NLP/opus-mt-en-nl"):
+        repo_dir = tmp_path / "hub" / repo_id
+        repo_dir.mkdir(parents=True)
+        (repo_dir / "pytorch_model.bin").write_bytes(os.urandom(256 * 1024))
+        (repo_dir / "config.json").write_text('{"model_type": "marian"}')
+    return serve(model_hub_stub.create_server(tmp_path / "hub", rate=2 * 1024 * 1024))
+
+def test_download_verifies_and_renames(hub, tmp_path):
+    dest = RepoDownload(REPO_ID, tmp_path / "out", hub).run()
+    assert (dest / "pytorch_model.bin").read_bytes() == WEIGHTS
+    assert not list(dest.glob("*.part"))
+
+def test_resume_appends_to_partial_file(hub, tmp_path, caplog):
+    dest = tmp_path / "out"
+    dest.mkdir()
+    (dest / "pytorch_model.bin.part").write_bytes(WEIGHTS[:1000])
+    caplog.set_level(logging.INFO, logger="ModelDownloader")
+    progress = []
+    RepoDownload(REPO_ID, dest, hub, progress_callback=lambda done, total: progress.append((done, total))).run()
+    assert (dest / "pytorch_model.bin").read_bytes() == WEIGHTS
+    assert "Resuming pytorch_model.bin" in caplog.text
+    assert progress[-1][0] == progress[-1][1]
+
+def test_complete_partial_file_is_not_requested_again(hub, tmp_path):
+    dest = tmp_path / "out"
+    dest.mkdir()
+    (dest / "pytorch_model.bin.part").write_bytes(WEIGHTS)
+    RepoDownload(REPO_ID, dest, hub).run()
+    assert (dest / "pytorch_model.bin").read_bytes() == WEIGHTS
+
+def test_hash_mismatch_discards_partial_file(hub, tmp_path, monkeypatch):
+    monkeypatch.setattr(model_downloader, "DOWNLOAD_ATTEMPTS", 1)
+    dest = tmp_path / "out"
+    dest.mkdir()
+    download = RepoDownload(REPO_ID, dest, hub)
+    entry = {"path": "pytorch_model.bin", "size": len(WEIGHTS), "sha256": "0" * 64, "git_sha1": None}
+    with pytest.raises(ChecksumMismatch):
+        download._fetch(entry)
+    assert not (dest / "pytorch_model.bin").exists()
+    assert not (dest / "pytorch_model.bin.part").exists()
+    assert download.done_bytes == 0
+
+def test_cancel_keeps_partial_file_for_resume(hub, tmp_path, monkeypatch):
+    monkeypatch.setattr(model_downloader, "PROGRESS_INTERVAL_S", 0)
+    dest = tmp_path / "out"
+    cancel_event = threading.Event()
+
+    def progress(done, total):
+        if done >= model_downloader.CHUNK_SIZE:
+            cancel_event.set()
+
+    download = RepoDownload(REPO_ID, dest, hub, workers=1, progress_callback=progress, cancel_event=cancel_event)
+    with pytest.raises(DownloadCancelled):
+        download.run()
+    assert not (dest / "pytorch_model.bin").exists()
+    partial = dest / "pytorch_model.bin.part"
+    assert 0 < partial.stat().st_size < len(WEIGHTS)
+
+    RepoDownload(REPO_ID, dest, hub).run()
+    assert (dest / "pytorch_model.bin").read_bytes() == WEIGHTS
+
+def test_concurrent_pivot_installs_share_a_leg(pivot_hub, tmp_path, monkeypatch):
+    conversions = []
+
+    def convert(repo_id, source_dir, target_dir, quantization, cancel_event=None):
+        assert (source_dir / "pytorch_model.bin").exists()
+        time.sleep(0.2)
+        target_dir.mkdir(parents=True)
+        (target_dir / "model.bin").write_bytes(b"converted")
+        conversions.append(repo_id)
+        return True, str(target_dir)
+
+    monkeypatch.setattr(model_downloader, "convert_in_subprocess", convert)
+    output_dir = tmp_path / "models"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(
+            lambda name: model_downloader.install_model_from_hub(name, output_dir, endpoint=pivot_hub),
+            ["Helsinki-NLP/opus-mt-pl-it", "Helsinki-NLP/opus-mt-pl-nl"]
+        ))
+
+    assert all(success for success, _ in results), results
+    assert sorted(conversions) == ["Helsinki-NLP/opus-mt-en-it", "Helsinki-NLP/opus-mt-en-nl", "Helsinki-NLP/opus-mt-pl-en"]
+    for target in ("it", "nl"):
+        assert (output_dir / pivot_model_dir_name("pl", target) / PIVOT_MANIFEST).exists()
+    assert not list((output_dir / model_downloader.DOWNLOADS_DIR).iterdir())
@@ -30,18 +30,15 @@ def verbose_import(module_name):
         return None
 
 def check_libretranslate(url):
-    logger.info(f"[NET] Checking LibreTranslate connection: {url}")
+    from engines.libretranslate_client import get_libretranslate_client
+    client = get_libretranslate_client(url)
+    check_url = f"{client.base_url}/translate"
+    logger.info(f"[NET] Checking LibreTranslate connection: {check_url}")
     try:
-        if not url.endswith('/translate'):
-            check_url = url.rstrip('/') + '/translate'
-        else:
-            check_url = url
-            
         payload = {"q": "test", "source": "auto", "target": "en"}
-        headers = {"Content-Type": "application/json"}
         
         start = time.time()
-        resp = requests.post(check_url, json=payload, headers=headers, timeout=3)
+        resp = client.post("/translate", payload, timeout=3)
         latency = (time.time() - start) * 1000
         
         if resp.status_code == 200:
@@ -49,7 +46,7 @@ def check_libretranslate(url):
             return True
         elif resp.status_code == 400:
             logger.warning(f"[WARN] Got 400 on {check_url}, trying base URL {url}...")
-            resp = requests.post(url, json=payload, headers=headers, timeout=3)
+            resp = client.session.post(url, json=payload, timeout=3)
             if resp.status_code == 200:
                 logger.info(f"[OK] LibreTranslate OK on base URL")
                 return True
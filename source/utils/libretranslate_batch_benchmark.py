@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines.libretranslate_client import get_libretranslate_client
+from engines.libretranslate_pool import LibreTranslatePool
+from engines.text_segmentation import split_segments
+from utils import libretranslate_stub
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("LibreTranslateBatchBenchmark")
+logging.getLogger("LibreTranslatePool").setLevel(logging.WARNING)
+
+SENTENCES = [
+    "Good morning everyone and thank you for joining the call today.",
+    "Before we start I would like to go over the agenda for this meeting.",
+    "First we will look at the results from the last quarter.",
+    "Sales in the northern region grew faster than we expected.",
+    "The southern region had a slower start but caught up in the last month.",
+    "After that we will talk about the plans for the new office.",
+    "The building work should be finished by the end of the summer.",
+    "We still need to decide how many desks we will need on each floor.",
+    "Finally I want to leave some time for your questions.",
+    "Please keep your microphones muted while someone else is speaking.",
+    "If you have a question you can also write it in the chat.",
+    "Let us begin with the quarterly numbers.",
+]
+
+def start_stubs(count, delay_ms, char_ms):
+    urls = []
+    for _ in range(count):
+        server = libretranslate_stub.create_server(delay_ms=delay_ms, char_ms=char_ms)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls.append(f"http://127.0.0.1:{server.server_port}/translate")
+    return urls
+
+def measure(name, rounds, func):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {name:<40} median {statistics.median(samples):7.1f} ms   max {max(samples):7.1f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare ways of sending a long transcript to LibreTranslate-compatible stub servers.")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--servers", type=int, default=3)
+    parser.add_argument("--delay-ms", type=float, default=30, help="Fixed cost per request on each stub")
+    parser.add_argument("--char-ms", type=float, default=0.5, help="Cost per input character on each stub")
+    args = parser.parse_args()
+
+    transcript = " ".join(SENTENCES)
+    segments = split_segments(transcript)
+    urls = start_stubs(args.servers, args.delay_ms, args.char_ms)
+    single = LibreTranslatePool(urls[:1])
+    pool = LibreTranslatePool(urls)
+    for url in urls:
+        get_libretranslate_client(url).warm()
+
+    print(
+        f"{len(transcript)} characters in {len(segments)} segments; stubs cost "
+        f"{args.delay_ms:g} ms per request + {args.char_ms:g} ms per character"
+    )
+    measure("one string, one server", args.rounds, lambda: single.translate(transcript, "en", "pl"))
+    measure("one request per sentence, one server", args.rounds, lambda: [single.translate(s, "en", "pl") for s in segments])
+    measure("batched array, one server", args.rounds, lambda: single.translate_segments(segments, "en", "pl"))
+    measure(f"parallel chunks, {args.servers} servers", args.rounds, lambda: pool.translate_segments(segments, "en", "pl"))
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+import statistics
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines.libretranslate_client import LibreTranslateClient
+from utils import libretranslate_stub
+
+logger = logging.getLogger("LibreTranslateBenchmark")
+
+PAYLOAD = {"q": "Good morning, how are you today?", "source": "en", "target": "pl"}
+
+def measure_cold(url, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = requests.post(url, json=PAYLOAD, headers={"Connection": "close"}, timeout=10)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def measure_warm(url, rounds):
+    client = LibreTranslateClient(url)
+    client.warm()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        client.translate(PAYLOAD["q"], PAYLOAD["source"], PAYLOAD["target"])
+        samples.append((time.perf_counter() - start) * 1000)
+    client.close()
+    return samples
+
+def report(name, samples):
+    print(f"  {name:<28} median {statistics.median(samples):7.2f} ms   p95 {statistics.quantiles(samples, n=20)[18]:7.2f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-request connections with the pooled LibreTranslate client.")
+    parser.add_argument("--url", default=None, help="LibreTranslate /translate URL (defaults to an in-process stub)")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        server = libretranslate_stub.create_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/translate"
+
+    print(f"Round-trip time to {url} over {args.rounds} requests")
+    report("new connection per request", measure_cold(url, args.rounds))
+    report("pooled keep-alive session", measure_warm(url, args.rounds))
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines.libretranslate_pool import LibreTranslatePool
+from utils import libretranslate_stub
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("LibreTranslatePoolHarness")
+logging.getLogger("LibreTranslatePool").setLevel(logging.WARNING)
+
+# (delay_ms, jitter_ms, fail_rate, stall_rate, stall_ms): two fast servers that
+# now and then stall, and a slow one that occasionally errors.
+STUB_PROFILES = [(30, 10, 0.0, 0.05, 400), (35, 10, 0.0, 0.05, 400), (120, 80, 0.05, 0.0, 0)]
+
+def start_stubs(profiles):
+    urls = []
+    for delay_ms, jitter_ms, fail_rate, stall_rate, stall_ms in profiles:
+        server = libretranslate_stub.create_server(
+            delay_ms=delay_ms, jitter_ms=jitter_ms, fail_rate=fail_rate, stall_rate=stall_rate, stall_ms=stall_ms
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls.append(f"http://127.0.0.1:{server.server_port}/translate")
+    return urls
+
+def run(pool, rounds):
+    samples = []
+    failures = 0
+    for i in range(rounds):
+        start = time.perf_counter()
+        try:
+            pool.translate(f"Sentence number {i}", "en", "pl")
+        except Exception:
+            failures += 1
+            continue
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, failures
+
+def report(name, pool, samples, failures):
+    q = statistics.quantiles(samples, n=100)
+    stats = pool.stats()
+    print(f"{name}")
+    print(f"  p50 {statistics.median(samples):6.1f} ms   p95 {q[94]:6.1f} ms   p99 {q[98]:6.1f} ms   failed {failures}")
+    print(f"  hedged {stats['hedges']} of {stats['requests']}, {stats['hedge_wins']} won by the hedge")
+    for url, endpoint in stats["endpoints"].items():
+        print(f"    {url}: {endpoint['wins']}/{endpoint['requests']} wins, {'healthy' if endpoint['healthy'] else 'unhealthy'}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare LibreTranslate pool routing with and without hedging against delayed stub servers.")
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--hedge-percentile", type=float, default=90)
+    args = parser.parse_args()
+
+    urls = start_stubs(STUB_PROFILES)
+    print(f"Stubs (delay, jitter, fail rate, stall rate, stall): {STUB_PROFILES}")
+
+    # Percentile 100 only hedges past the slowest latency seen, which makes
+    # the run a fair "pick the fastest endpoint" baseline.
+    for name, percentile in (("no hedging", 100), (f"hedge at p{args.hedge_percentile:g}", args.hedge_percentile)):
+        pool = LibreTranslatePool(urls, hedge_percentile=percentile, probe_interval_s=1)
+        samples, failures = run(pool, args.rounds)
+        report(name, pool, samples, failures)
+        pool.close()
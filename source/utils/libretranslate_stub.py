@@ -0,0 +1,110 @@
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("LibreTranslateStub")
+
+STUB_LANGUAGES = ["cs", "de", "en", "es", "it", "nl", "pl", "pt", "ru"]
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client closed the connection before the response was sent")
+
+    def _delay(self, chars=0):
+        server = self.server
+        delay = server.delay_ms + random.uniform(0, server.jitter_ms) + server.char_ms * chars
+        if random.random() < server.stall_rate:
+            delay += server.stall_ms
+        if delay:
+            time.sleep(delay / 1000)
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0].rstrip("/") == "/languages":
+            if random.random() < self.server.fail_rate:
+                self._send_json(500, {"error": "Injected failure"})
+                return
+            self._send_json(200, [{"code": code, "name": code, "targets": STUB_LANGUAGES} for code in STUB_LANGUAGES])
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        if self.path.split("?", 1)[0].rstrip("/") != "/translate":
+            self._send_json(404, {"error": "Not found"})
+            return
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            data = json.loads(raw or b"{}")
+        else:
+            data = {key: values[0] for key, values in parse_qs(raw.decode("utf-8")).items()}
+
+        self.server.requests += 1
+        q, target = data.get("q"), data.get("target", "en")
+        self._delay(sum(len(item) for item in q) if isinstance(q, list) else len(q or ""))
+        if random.random() < self.server.fail_rate:
+            self._send_json(500, {"error": "Injected failure"})
+            return
+        if not q or not data.get("source"):
+            self._send_json(400, {"error": "Invalid request: missing q or source parameter"})
+            return
+        translate = lambda text: f"[{target}] {text}"
+        self._send_json(200, {"translatedText": [translate(item) for item in q] if isinstance(q, list) else translate(q)})
+
+def create_server(host="127.0.0.1", port=0, delay_ms=0, jitter_ms=0, fail_rate=0.0, stall_rate=0.0, stall_ms=0, char_ms=0):
+    server = ThreadingHTTPServer((host, port), _StubHandler)
+    server.daemon_threads = True
+    server.delay_ms = delay_ms
+    server.jitter_ms = jitter_ms
+    server.fail_rate = fail_rate
+    server.stall_rate = stall_rate
+    server.stall_ms = stall_ms
+    server.char_ms = char_ms
+    server.requests = 0
+    server.connections = 0
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a LibreTranslate-compatible API that echoes its input, for latency tests.")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--delay-ms", type=float, default=0, help="Fixed processing delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay per request")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests (including /languages) answered with HTTP 500")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of requests that stall, like a server busy with another job")
+    parser.add_argument("--stall-ms", type=float, default=500, help="Extra delay of a stalled request")
+    parser.add_argument("--char-ms", type=float, default=0, help="Processing cost per input character, like a server translating serially")
+    args = parser.parse_args()
+    server = create_server(
+        port=args.port, delay_ms=args.delay_ms, jitter_ms=args.jitter_ms, fail_rate=args.fail_rate,
+        stall_rate=args.stall_rate, stall_ms=args.stall_ms, char_ms=args.char_ms
+    )
+    logger.info(f"LibreTranslate stub listening on http://127.0.0.1:{args.port}/translate")
+    server.serve_forever()
@@ -0,0 +1,123 @@
+import os
+import sys
+import time
+import json
+import hashlib
+import logging
+import argparse
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("ModelHubStub")
+
+LFS_SUFFIXES = (".bin", ".safetensors")
+
+def _file_entry(path, relative):
+    data = path.read_bytes()
+    entry = {
+        "type": "file",
+        "path": relative,
+        "size": len(data),
+        "oid": hashlib.sha1(f"blob {len(data)}\0".encode("ascii") + data).hexdigest(),
+    }
+    if relative.endswith(LFS_SUFFIXES):
+        entry["lfs"] = {"oid": hashlib.sha256(data).hexdigest(), "size": len(data), "pointerSize": 130}
+    return entry
+
+class _HubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send(self, status, body, content_type="application/json", extra_headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        return body
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].strip("/")
+        parts = path.split("/")
+        root = self.server.root
+
+        if parts == ["api", "models"]:
+            query = dict(item.split("=", 1) for item in self.path.partition("?")[2].split("&") if "=" in item)
+            repos = [
+                {"id": f"{org.name}/{repo.name}"}
+                for org in sorted(root.iterdir()) if org.is_dir() and org.name == query.get("author", org.name)
+                for repo in sorted(org.iterdir()) if repo.is_dir() and query.get("search", "") in repo.name
+            ]
+            self.wfile.write(self._send(200, json.dumps(repos).encode("utf-8")))
+            return
+
+        if parts[:2] == ["api", "models"] and len(parts) >= 6 and parts[4] == "tree":
+            repo_dir = root / parts[2] / parts[3]
+            if not repo_dir.is_dir():
+                self.wfile.write(self._send(404, b'{"error": "Repository not found"}'))
+                return
+            entries = [_file_entry(f, f.relative_to(repo_dir).as_posix()) for f in sorted(repo_dir.rglob("*")) if f.is_file()]
+            self.wfile.write(self._send(200, json.dumps(entries).encode("utf-8")))
+            return
+
+        if len(parts) >= 5 and parts[2] == "resolve":
+            file_path = root / parts[0] / parts[1] / "/".join(parts[4:])
+            if not file_path.is_file():
+                self.wfile.write(self._send(404, b"Entry not found", "text/plain"))
+                return
+            data = file_path.read_bytes()
+            start = 0
+            status = 200
+            headers = {"Accept-Ranges": "bytes"}
+            range_header = self.headers.get("Range")
+            if range_header and range_header.startswith("bytes="):
+                start = int(range_header[6:].split("-")[0] or 0)
+                if start >= len(data):
+                    # Same as the real hub: a range past the last byte is unsatisfiable.
+                    self.wfile.write(self._send(416, b"", "text/plain", {"Content-Range": f"bytes */{len(data)}"}))
+                    return
+                status = 206
+                headers["Content-Range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+            body = data[start:]
+            self._send(status, body, "application/octet-stream", headers)
+            self._write_throttled(body)
+            return
+
+        self.wfile.write(self._send(404, b"Not found", "text/plain"))
+
+    def _write_throttled(self, body):
+        rate = self.server.rate
+        step = 64 * 1024
+        try:
+            for offset in range(0, len(body), step):
+                self.wfile.write(body[offset:offset + step])
+                if rate:
+                    time.sleep(step / rate)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client closed the connection mid-download")
+
+def create_server(root, host="127.0.0.1", port=0, rate=0):
+    server = ThreadingHTTPServer((host, port), _HubHandler)
+    server.daemon_threads = True
+    server.root = Path(root)
+    server.rate = rate
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local directory as a Hugging Face model hub stand-in (<root>/<org>/<repo>/files).")
+    parser.add_argument("root")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate", type=int, default=0, help="Throttle downloads to this many bytes per second")
+    args = parser.parse_args()
+    server = create_server(args.root, port=args.port, rate=args.rate)
+    logger.info(f"Serving {os.path.abspath(args.root)} at http://127.0.0.1:{args.port} (use HF_ENDPOINT to point Voxlay at it)")
+    server.serve_forever()
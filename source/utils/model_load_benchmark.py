@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import logging
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines import ctranslate2_engine
+from engines.page_cache import prewarm, evict
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("LoadBenchmark")
+
+def measure(wrapper, model_path, cold):
+    files = [path for path in model_path.iterdir() if path.is_file()]
+    if cold:
+        if not evict(files):
+            return None
+    else:
+        prewarm(files)
+    wrapper.unload_model(model_path.name)
+    start = time.perf_counter()
+    wrapper.load_model_by_name(model_path.name)
+    elapsed = (time.perf_counter() - start) * 1000
+    wrapper.unload_model(model_path.name)
+    return elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold (evicted page cache) and warm (prewarmed) model load times.")
+    parser.add_argument("model_path", help="Path to an installed CTranslate2 model directory")
+    parser.add_argument("--compute-type", default="default")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if not ctranslate2_engine._import_libs():
+        sys.exit("CTranslate2 is not installed")
+    model_path = Path(args.model_path).resolve()
+    wrapper = ctranslate2_engine.CTranslate2Wrapper(model_path.parent, compute_type=args.compute_type)
+
+    results = {}
+    for cold in (True, False):
+        samples = [measure(wrapper, model_path, cold) for _ in range(args.rounds)]
+        if None in samples:
+            logger.warning("Cannot evict files from the page cache on this platform, skipping cold loads")
+            continue
+        results["cold" if cold else "warm"] = statistics.median(samples)
+
+    size_mb = (model_path / "model.bin").stat().st_size / 1e6
+    print(f"\n{model_path.name} ({size_mb:.1f} MB model.bin, {args.compute_type}), median of {args.rounds} loads")
+    for state, elapsed in results.items():
+        print(f"  {state}: {elapsed:8.1f} ms")
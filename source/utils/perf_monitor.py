@@ -0,0 +1,64 @@
+import time
+import logging
+import threading
+from collections import deque
+from PyQt6 import QtCore
+
+logger = logging.getLogger("PerfMonitor")
+
+LAG_SAMPLE_INTERVAL_MS = 20
+LAG_WINDOW_SAMPLES = 500
+
+_overflow_lock = threading.Lock()
+_audio_overflows = 0
+
+def record_audio_overflow():
+    global _audio_overflows
+    with _overflow_lock:
+        _audio_overflows += 1
+
+def audio_overflow_count():
+    with _overflow_lock:
+        return _audio_overflows
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+class EventLoopLagMonitor(QtCore.QObject):
+    def __init__(self, parent=None, interval_ms=LAG_SAMPLE_INTERVAL_MS):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.samples = deque(maxlen=LAG_WINDOW_SAMPLES)
+        self.lock = threading.Lock()
+        self.last_tick = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._on_tick)
+
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.timer.start(self.interval_ms)
+
+    def stop(self):
+        self.timer.stop()
+
+    def _on_tick(self):
+        now = time.perf_counter()
+        lag_ms = max((now - self.last_tick) * 1000 - self.interval_ms, 0.0)
+        self.last_tick = now
+        with self.lock:
+            self.samples.append(lag_ms)
+
+    def snapshot(self):
+        with self.lock:
+            samples = list(self.samples)
+        return {
+            "samples": len(samples),
+            "p50_ms": percentile(samples, 0.5),
+            "p95_ms": percentile(samples, 0.95),
+            "p99_ms": percentile(samples, 0.99),
+            "max_ms": max(samples) if samples else 0.0,
+        }
@@ -0,0 +1,68 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.constants import TARGET_LANGUAGES, APP_NAME
+from engines.model_catalog import CATALOG_FILE
+from engines.model_downloader import hub_endpoint, list_repo_files, select_runtime_files, REQUEST_TIMEOUT_S
+from engines.model_registry import parse_model_pair
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("CatalogUpdater")
+
+def list_author_models(session, endpoint, author="Helsinki-NLP"):
+    url = f"{endpoint}/api/models"
+    params = {"author": author, "search": "opus-mt", "limit": 1000}
+    while url:
+        response = session.get(url, params=params, timeout=REQUEST_TIMEOUT_S)
+        response.raise_for_status()
+        for model in response.json():
+            yield model.get("id") or model.get("modelId")
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+def build_catalog(endpoint, languages):
+    session = requests.Session()
+    models = {}
+    for repo_id in list_author_models(session, endpoint):
+        src, tgt = parse_model_pair(repo_id)
+        if src not in languages or tgt not in languages or "-tc-" in repo_id:
+            continue
+        try:
+            files = select_runtime_files(list_repo_files(repo_id, endpoint, session))
+        except Exception as e:
+            logger.warning(f"Skipping {repo_id}: {e}")
+            continue
+        weights = [f for f in files if f["path"].endswith((".bin", ".safetensors"))]
+        if not weights:
+            continue
+        models[repo_id] = round(sum(f["size"] for f in weights) / 1e6)
+        logger.info(f"{repo_id}: {models[repo_id]} MB")
+    return models
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the catalog of downloadable Helsinki-NLP models from the model hub.")
+    parser.add_argument("--endpoint", default=None, help="Model hub URL (defaults to HF_ENDPOINT or huggingface.co)")
+    parser.add_argument("--output", default=str(Path.home() / ".config" / APP_NAME / CATALOG_FILE))
+    args = parser.parse_args()
+
+    endpoint = hub_endpoint(args.endpoint)
+    start = time.perf_counter()
+    models = build_catalog(endpoint, set(TARGET_LANGUAGES))
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"updated_at": time.strftime("%Y-%m-%d"), "endpoint": endpoint, "models": dict(sorted(models.items()))}, f, indent=2)
+    logger.info(f"Wrote {len(models)} models to {args.output} in {time.perf_counter() - start:.1f}s")